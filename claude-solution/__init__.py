@@ -6,7 +6,7 @@ into DICOM attributes when converting WSI files using wsidicomizer.
 """
 
 from .collection_config import CollectionConfig, MCI_CCDI_CONFIG
-from .uid_manager import UIDMappingManager
+from .uid_manager import UIDMappingManager, SqliteUIDStore
 from .code_mapper import DicomCodeMapper
 from .csv_loaders import CSVLoaderBase, MCICCDILoader
 from .specimen_builder import SpecimenMetadataBuilder
@@ -17,6 +17,7 @@ __all__ = [
     'CollectionConfig',
     'MCI_CCDI_CONFIG',
     'UIDMappingManager',
+    'SqliteUIDStore',
     'DicomCodeMapper',
     'CSVLoaderBase',
     'MCICCDILoader',
@@ -6,12 +6,16 @@ for anatomy, fixation, staining, and diagnosis codes.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from pathlib import Path
 import csv
+import os
+import re
+import sys
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CodedConcept:
     """
     Represents a DICOM coded concept (code value, scheme, meaning).
@@ -30,6 +34,299 @@ class CodedConcept:
     meaning: str
 
 
+# Coding scheme designators used in the mapping tables below
+_SCT = "SCT"      # SNOMED CT
+_NCIT = "NCIt"    # NCI Thesaurus
+
+# The mapping tables are shared, read-only module constants so that
+# constructing a DicomCodeMapper does not rebuild them.
+
+# Pool of table entries so that repeated codes (e.g., "Brain", "Soft tissue")
+# share a single CodedConcept instance
+_CC_POOL: Dict[Tuple[str, str, str], CodedConcept] = {}
+
+
+def _cc(value: str, scheme: str, meaning: str) -> CodedConcept:
+    """Return the pooled CodedConcept for (value, scheme, meaning)."""
+    key = (value, scheme, meaning)
+    concept = _CC_POOL.get(key)
+    if concept is None:
+        concept = _CC_POOL[key] = CodedConcept(value, scheme, meaning)
+    return concept
+
+
+# ICD-O topography to SNOMED CT mappings.
+# Derived from mcitodcm.sh and other conversion scripts.
+# Format: "ICD-O code : Description" -> SNOMED CT code
+_ANATOMY_MAP: Mapping[str, CodedConcept] = MappingProxyType({
+    # Brain and CNS
+    "C71.0 : Cerebrum": _cc("83678007", _SCT, "Cerebrum"),
+    "C71.1 : Frontal lobe": _cc("83251001", _SCT, "Frontal lobe"),
+    "C71.2 : Temporal lobe": _cc("78277001", _SCT, "Temporal lobe"),
+    "C71.3 : Parietal lobe": _cc("16630005", _SCT, "Parietal lobe"),
+    "C71.4 : Occipital lobe": _cc("31065004", _SCT, "Occipital lobe"),
+    "C71.5 : Ventricle, NOS": _cc("35764002", _SCT, "Cerebral ventricle"),
+    "C71.6 : Cerebellum, NOS": _cc("113305005", _SCT, "Cerebellar structure"),
+    "C71.7 : Brain stem": _cc("15926001", _SCT, "Brain stem"),
+    "C71.8 : Overlapping lesion of brain": _cc("12738006", _SCT, "Brain"),
+    "C71.9 : Brain, NOS": _cc("12738006", _SCT, "Brain"),
+    "C72.0 : Spinal cord": _cc("2748008", _SCT, "Spinal cord"),
+    "C72.1 : Cauda equina": _cc("7173007", _SCT, "Cauda equina"),
+    "C72.9 : Central nervous system": _cc("21483005", _SCT, "Central nervous system"),
+
+    # Endocrine
+    "C74.0 : Adrenal cortex": _cc("68594002", _SCT, "Adrenal cortex"),
+    "C74.1 : Adrenal medulla": _cc("23451007", _SCT, "Adrenal medulla"),
+    "C74.9 : Adrenal gland, NOS": _cc("23451007", _SCT, "Adrenal gland"),
+    "C75.1 : Pituitary gland": _cc("56329008", _SCT, "Pituitary gland"),
+    "C75.2 : Craniopharyngeal duct": _cc("55926006", _SCT, "Craniopharyngeal duct"),
+    "C75.3 : Pineal gland": _cc("45793000", _SCT, "Pineal gland"),
+
+    # Hematopoietic
+    "C42.0 : Blood": _cc("87612001", _SCT, "Blood"),
+    "C42.1 : Bone marrow": _cc("14016003", _SCT, "Bone marrow"),
+
+    # Thorax
+    "C34.0 : Main bronchus": _cc("102297006", _SCT, "Main bronchus"),
+    "C34.1 : Upper lobe, lung": _cc("45653009", _SCT, "Upper lobe of lung"),
+    "C34.2 : Middle lobe, lung": _cc("72481006", _SCT, "Middle lobe of right lung"),
+    "C34.3 : Lower lobe, lung": _cc("90572001", _SCT, "Lower lobe of lung"),
+    "C34.9 : Lung, NOS": _cc("39607008", _SCT, "Lung"),
+    "C37.9 : Thymus": _cc("9875009", _SCT, "Thymus"),
+    "C38.0 : Heart": _cc("80891009", _SCT, "Heart"),
+
+    # Abdomen
+    "C22.0 : Liver": _cc("10200004", _SCT, "Liver"),
+    "C22.1 : Intrahepatic bile duct": _cc("58716001", _SCT, "Intrahepatic bile duct"),
+    "C23.9 : Gallbladder": _cc("28231008", _SCT, "Gallbladder"),
+    "C25.0 : Head of pancreas": _cc("64163001", _SCT, "Head of pancreas"),
+    "C25.9 : Pancreas, NOS": _cc("15776009", _SCT, "Pancreas"),
+
+    # Retroperitoneum
+    "C48.0 : Retroperitoneum": _cc("82849001", _SCT, "Retroperitoneum"),
+    "C48.1 : Specified parts of peritoneum": _cc("15425007", _SCT, "Peritoneum"),
+    "C48.2 : Peritoneum, NOS": _cc("15425007", _SCT, "Peritoneum"),
+
+    # Urinary
+    "C64.9 : Kidney, NOS": _cc("64033007", _SCT, "Kidney"),
+    "C65.9 : Renal pelvis": _cc("25990002", _SCT, "Renal pelvis"),
+    "C66.9 : Ureter": _cc("87953007", _SCT, "Ureter"),
+    "C67.9 : Bladder, NOS": _cc("89837001", _SCT, "Urinary bladder"),
+    "C68.0 : Urethra": _cc("13648007", _SCT, "Urethra"),
+
+    # Male genital
+    "C61.9 : Prostate gland": _cc("41216001", _SCT, "Prostate"),
+    "C62.9 : Testis, NOS": _cc("40689003", _SCT, "Testis"),
+
+    # Female genital
+    "C53.9 : Cervix uteri": _cc("71252005", _SCT, "Cervix"),
+    "C54.1 : Endometrium": _cc("2739003", _SCT, "Endometrium"),
+    "C54.9 : Corpus uteri": _cc("35039007", _SCT, "Uterus"),
+    "C55.9 : Uterus, NOS": _cc("35039007", _SCT, "Uterus"),
+    "C56.9 : Ovary": _cc("15497006", _SCT, "Ovary"),
+    "C57.0 : Fallopian tube": _cc("31435000", _SCT, "Fallopian tube"),
+
+    # Breast
+    "C50.9 : Breast, NOS": _cc("76752008", _SCT, "Breast"),
+
+    # Skin
+    "C44.9 : Skin, NOS": _cc("39937001", _SCT, "Skin"),
+
+    # Bones
+    "C40.0 : Long bones of upper limb": _cc("410030009", _SCT, "Bone structure of upper extremity"),
+    "C40.2 : Long bones of lower limb": _cc("410029004", _SCT, "Bone structure of lower extremity"),
+    "C41.0 : Bones of skull and face and associated joints": _cc("272679001", _SCT, "Cranial and/or facial bone"),
+    "C41.2 : Vertebral column": _cc("421060004", _SCT, "Vertebral column"),
+    "C41.4 : Pelvic bones": _cc("12921003", _SCT, "Pelvic bone"),
+    "C41.9 : Bone, NOS": _cc("272673000", _SCT, "Bone"),
+
+    # Soft tissue
+    "C47.9 : Peripheral nerves and autonomic nervous system": _cc("84782009", _SCT, "Peripheral nerve"),
+    "C49.0 : Connective tissue of head, face and neck": _cc("71836000", _SCT, "Soft tissue"),
+    "C49.9 : Connective, subcutaneous and other soft tissues, NOS": _cc("71836000", _SCT, "Soft tissue"),
+
+    # Eye
+    "C69.0 : Conjunctiva": _cc("29445007", _SCT, "Conjunctiva"),
+    "C69.2 : Retina": _cc("5665001", _SCT, "Retina"),
+    "C69.4 : Ciliary body": _cc("29534007", _SCT, "Ciliary body"),
+    "C69.6 : Orbit, NOS": _cc("363654007", _SCT, "Orbit"),
+    "C69.9 : Eye, NOS": _cc("81745001", _SCT, "Eye"),
+
+    # Lymph nodes
+    "C77.0 : Lymph nodes of head, face and neck": _cc("59441001", _SCT, "Lymph node"),
+    "C77.9 : Lymph node, NOS": _cc("59441001", _SCT, "Lymph node"),
+
+    # GI tract
+    "C15.9 : Esophagus, NOS": _cc("32849002", _SCT, "Esophagus"),
+    "C16.9 : Stomach, NOS": _cc("69695003", _SCT, "Stomach"),
+    "C17.0 : Duodenum": _cc("38848004", _SCT, "Duodenum"),
+    "C17.9 : Small intestine, NOS": _cc("30315005", _SCT, "Small intestine"),
+    "C18.9 : Colon, NOS": _cc("71854001", _SCT, "Colon"),
+    "C19.9 : Rectosigmoid junction": _cc("49832006", _SCT, "Rectosigmoid junction"),
+    "C20.9 : Rectum, NOS": _cc("34402009", _SCT, "Rectum"),
+
+    # Head and neck
+    "C00.9 : Lip, NOS": _cc("81083006", _SCT, "Lip"),
+    "C01.9 : Base of tongue": _cc("47975008", _SCT, "Base of tongue"),
+    "C02.9 : Tongue, NOS": _cc("21974007", _SCT, "Tongue"),
+    "C07.9 : Parotid gland": _cc("45289007", _SCT, "Parotid gland"),
+    "C08.9 : Major salivary gland, NOS": _cc("385296007", _SCT, "Salivary gland"),
+    "C09.9 : Tonsil, NOS": _cc("75573002", _SCT, "Tonsil"),
+    "C10.9 : Oropharynx, NOS": _cc("31389004", _SCT, "Oropharynx"),
+    "C11.9 : Nasopharynx, NOS": _cc("71836000", _SCT, "Nasopharynx"),
+    "C13.9 : Hypopharynx, NOS": _cc("81502006", _SCT, "Hypopharynx"),
+    "C30.0 : Nasal cavity": _cc("279549004", _SCT, "Nasal cavity"),
+    "C31.0 : Maxillary sinus": _cc("15924003", _SCT, "Maxillary sinus"),
+    "C32.9 : Larynx, NOS": _cc("4596009", _SCT, "Larynx"),
+    "C73.9 : Thyroid gland": _cc("69748006", _SCT, "Thyroid gland"),
+
+    # Unknown
+    "C76.0 : Head, face or neck, NOS": _cc("774007", _SCT, "Head and/or neck structure"),
+    "C76.7 : Other ill-defined sites": _cc("39801007", _SCT, "Body structure"),
+    "C80.9 : Unknown primary site": _cc("39801007", _SCT, "Body structure"),
+})
+
+# Secondary index keyed by ICD-O code only (e.g., "C71.7") for
+# anatomic sites whose description differs from the table above
+_ANATOMY_PREFIX_MAP: Mapping[str, CodedConcept] = MappingProxyType({
+    sys.intern(key.split(":", 1)[0].strip()): anat
+    for key, anat in _ANATOMY_MAP.items()
+})
+
+# ICD-O topography code appearing anywhere in an anatomic site string
+_ICDO_TOPOGRAPHY_RE = re.compile(r"C\d{2}\.\d")
+
+# Fixation method mappings
+_FIXATION_MAP: Mapping[str, CodedConcept] = MappingProxyType({
+    # Formalin-based fixation
+    "FFPE": _cc("431510009", _SCT, "Formalin fixed and target antigen retrieved"),
+    "Formalin fixed paraffin embedded (FFPE)": _cc("431510009", _SCT, "Formalin fixed and target antigen retrieved"),
+    "Formalin-Fixed Paraffin-Embedded": _cc("431510009", _SCT, "Formalin fixed and target antigen retrieved"),
+    "Formalin": _cc("431510009", _SCT, "Formalin fixed and target antigen retrieved"),
+    "10% Neutral Buffered Formalin": _cc("434162003", _SCT, "Neutral Buffered Formalin"),
+    "PAXgene": _cc("C185113", _NCIT, "PAXgene Tissue System"),
+
+    # Frozen/OCT
+    "OCT": _cc("433469005", _SCT, "Tissue freezing medium"),
+    "Optimal Cutting Temperature": _cc("433469005", _SCT, "Tissue freezing medium"),
+    "Frozen": _cc("433469005", _SCT, "Tissue freezing medium"),
+})
+
+_FIXATION_ABBREVIATIONS: Mapping[str, str] = MappingProxyType({
+    "FFPE": "FF",
+    "Formalin fixed paraffin embedded (FFPE)": "FF",
+    "Formalin-Fixed Paraffin-Embedded": "FF",
+    "Formalin": "FF",
+    "10% Neutral Buffered Formalin": "FF",
+    "PAXgene": "PG",
+    "OCT": "OCT",
+    "Optimal Cutting Temperature": "OCT",
+    "Frozen": "FR",
+})
+
+# Embedding media mappings
+_EMBEDDING_MAP: Mapping[str, CodedConcept] = MappingProxyType({
+    # Paraffin embedding
+    "FFPE": _cc("311731000", _SCT, "Paraffin wax"),
+    "Formalin fixed paraffin embedded (FFPE)": _cc("311731000", _SCT, "Paraffin wax"),
+    "Formalin-Fixed Paraffin-Embedded": _cc("311731000", _SCT, "Paraffin wax"),
+    "Paraffin": _cc("311731000", _SCT, "Paraffin wax"),
+    "Paraffin wax": _cc("311731000", _SCT, "Paraffin wax"),
+    # OCT is the embedding medium itself (frozen sections)
+})
+
+_EMBEDDING_ABBREVIATIONS: Mapping[str, str] = MappingProxyType({
+    "FFPE": "PE",
+    "Formalin fixed paraffin embedded (FFPE)": "PE",
+    "Formalin-Fixed Paraffin-Embedded": "PE",
+    "Paraffin": "PE",
+    "Paraffin wax": "PE",
+})
+
+# Fixation method -> (fixative, embedding) pairs, so map_fixation_to_codes
+# needs a single lookup
+_FIXATION_COMBO_MAP: Mapping[
+    str, Tuple[Optional[CodedConcept], Optional[CodedConcept]]
+] = MappingProxyType({
+    method: (_FIXATION_MAP.get(method), _EMBEDDING_MAP.get(method))
+    for method in (*_FIXATION_MAP, *_EMBEDDING_MAP)
+})
+
+# Staining method mappings; each method maps to a tuple of stain codes
+_STAINING_MAP: Mapping[str, Tuple[CodedConcept, ...]] = MappingProxyType({
+    # H&E - two stains
+    "H&E": (
+        _cc("12710003", _SCT, "hematoxylin stain"),
+        _cc("36879007", _SCT, "water soluble eosin stain"),
+    ),
+    "Hematoxylin and Eosin Staining Method": (
+        _cc("12710003", _SCT, "hematoxylin stain"),
+        _cc("36879007", _SCT, "water soluble eosin stain"),
+    ),
+    "HE": (
+        _cc("12710003", _SCT, "hematoxylin stain"),
+        _cc("36879007", _SCT, "water soluble eosin stain"),
+    ),
+
+    # Immunohistochemistry
+    "IHC": (
+        _cc("127790008", _SCT, "immunohistochemical stain"),
+    ),
+    "Immunohistochemistry": (
+        _cc("127790008", _SCT, "immunohistochemical stain"),
+    ),
+
+    # Other common stains
+    "PAS": (
+        _cc("104210008", _SCT, "periodic acid Schiff stain"),
+    ),
+    "Masson trichrome": (
+        _cc("76574004", _SCT, "Masson trichrome stain"),
+    ),
+    "Silver stain": (
+        _cc("86243006", _SCT, "silver stain"),
+    ),
+    "Giemsa": (
+        _cc("62778005", _SCT, "Giemsa stain"),
+    ),
+})
+
+_STAINING_ABBREVIATIONS: Mapping[str, str] = MappingProxyType({
+    "H&E": "HE",
+    "Hematoxylin and Eosin Staining Method": "HE",
+    "HE": "HE",
+    "IHC": "IHC",
+    "Immunohistochemistry": "IHC",
+    "PAS": "PAS",
+    "Masson trichrome": "MT",
+    "Silver stain": "SS",
+    "Giemsa": "GI",
+})
+
+# Tissue type (tumor status) mappings
+_TISSUE_TYPE_MAP: Mapping[str, CodedConcept] = MappingProxyType({
+    "Normal": _cc("17621005", _SCT, "Normal"),
+    "Tumor": _cc("108369006", _SCT, "Tumor"),
+    "Neoplastic": _cc("108369006", _SCT, "Neoplastic"),
+})
+
+_TISSUE_TYPE_ABBREVIATIONS: Mapping[str, str] = MappingProxyType({
+    "Normal": "N",
+    "Tumor": "T",
+    "Neoplastic": "T",
+})
+
+# Normalized (lowercased, stripped) sex values to DICOM PatientSex codes
+_SEX_MAP: Mapping[str, str] = MappingProxyType({
+    "male": "M",
+    "m": "M",
+    "female": "F",
+    "f": "F",
+    "other": "O",
+    "o": "O",
+})
+
+
 class DicomCodeMapper:
     """
     Maps CSV values to DICOM coded concepts.
@@ -47,10 +344,10 @@ class DicomCodeMapper:
     """
 
     # Coding scheme designators
-    SCT = "SCT"      # SNOMED CT
+    SCT = _SCT       # SNOMED CT
     ICDO3 = "ICDO3"  # ICD-O-3
     DCM = "DCM"      # DICOM
-    NCIT = "NCIt"    # NCI Thesaurus
+    NCIT = _NCIT     # NCI Thesaurus
 
     def __init__(self, icd_o_file: Optional[Path] = None):
         """
@@ -62,278 +359,33 @@ class DicomCodeMapper:
             Path to ICD-O-3 morphology code CSV file for extended lookups
         """
         self.icd_o_codes: Dict[str, str] = {}
-        if icd_o_file and Path(icd_o_file).exists():
-            self._load_icd_o_codes(Path(icd_o_file))
 
-        self._init_anatomy_mappings()
-        self._init_fixation_mappings()
-        self._init_embedding_mappings()
-        self._init_staining_mappings()
-        self._init_tissue_type_mappings()
+        # Per-instance lookup caches; CSV values repeat heavily across slides
+        self._anatomy_cache: Dict[str, Optional[CodedConcept]] = {}
+        self._diagnosis_cache: Dict[
+            Tuple[Optional[str], Optional[str]],
+            Tuple[Optional[str], Optional[str], Optional[str]]
+        ] = {}
+
+        if icd_o_file:
+            icd_o_path = Path(icd_o_file)
+            if icd_o_path.is_file():
+                self._load_icd_o_codes(icd_o_path)
 
-    def _load_icd_o_codes(self, filepath: Path) -> None:
+    def _load_icd_o_codes(self, filepath: os.PathLike) -> None:
         """Load ICD-O-3 morphology codes from CSV."""
         try:
-            with open(filepath, 'r', encoding='latin-1') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 3 and row[1] == 'Preferred':
-                        # Format: code, type, meaning
-                        self.icd_o_codes[row[0]] = row[2]
+            # Parsed once at startup; a large read buffer avoids many small reads
+            with open(os.fspath(filepath), 'r', encoding='latin-1', newline='',
+                      buffering=1 << 20) as f:
+                # Format: code, type, meaning
+                self.icd_o_codes.update(
+                    (row[0], row[2]) for row in csv.reader(f)
+                    if len(row) >= 3 and row[1] == 'Preferred'
+                )
         except Exception:
             pass  # Silently fail if file can't be read
 
-    def _init_anatomy_mappings(self) -> None:
-        """
-        Initialize ICD-O topography to SNOMED CT mappings.
-
-        Derived from mcitodcm.sh and other conversion scripts.
-        Format: "ICD-O code : Description" -> SNOMED CT code
-        """
-        self._anatomy_map: Dict[str, CodedConcept] = {
-            # Brain and CNS
-            "C71.0 : Cerebrum": CodedConcept("83678007", self.SCT, "Cerebrum"),
-            "C71.1 : Frontal lobe": CodedConcept("83251001", self.SCT, "Frontal lobe"),
-            "C71.2 : Temporal lobe": CodedConcept("78277001", self.SCT, "Temporal lobe"),
-            "C71.3 : Parietal lobe": CodedConcept("16630005", self.SCT, "Parietal lobe"),
-            "C71.4 : Occipital lobe": CodedConcept("31065004", self.SCT, "Occipital lobe"),
-            "C71.5 : Ventricle, NOS": CodedConcept("35764002", self.SCT, "Cerebral ventricle"),
-            "C71.6 : Cerebellum, NOS": CodedConcept("113305005", self.SCT, "Cerebellar structure"),
-            "C71.7 : Brain stem": CodedConcept("15926001", self.SCT, "Brain stem"),
-            "C71.8 : Overlapping lesion of brain": CodedConcept("12738006", self.SCT, "Brain"),
-            "C71.9 : Brain, NOS": CodedConcept("12738006", self.SCT, "Brain"),
-            "C72.0 : Spinal cord": CodedConcept("2748008", self.SCT, "Spinal cord"),
-            "C72.1 : Cauda equina": CodedConcept("7173007", self.SCT, "Cauda equina"),
-            "C72.9 : Central nervous system": CodedConcept("21483005", self.SCT, "Central nervous system"),
-
-            # Endocrine
-            "C74.0 : Adrenal cortex": CodedConcept("68594002", self.SCT, "Adrenal cortex"),
-            "C74.1 : Adrenal medulla": CodedConcept("23451007", self.SCT, "Adrenal medulla"),
-            "C74.9 : Adrenal gland, NOS": CodedConcept("23451007", self.SCT, "Adrenal gland"),
-            "C75.1 : Pituitary gland": CodedConcept("56329008", self.SCT, "Pituitary gland"),
-            "C75.2 : Craniopharyngeal duct": CodedConcept("55926006", self.SCT, "Craniopharyngeal duct"),
-            "C75.3 : Pineal gland": CodedConcept("45793000", self.SCT, "Pineal gland"),
-
-            # Hematopoietic
-            "C42.0 : Blood": CodedConcept("87612001", self.SCT, "Blood"),
-            "C42.1 : Bone marrow": CodedConcept("14016003", self.SCT, "Bone marrow"),
-
-            # Thorax
-            "C34.0 : Main bronchus": CodedConcept("102297006", self.SCT, "Main bronchus"),
-            "C34.1 : Upper lobe, lung": CodedConcept("45653009", self.SCT, "Upper lobe of lung"),
-            "C34.2 : Middle lobe, lung": CodedConcept("72481006", self.SCT, "Middle lobe of right lung"),
-            "C34.3 : Lower lobe, lung": CodedConcept("90572001", self.SCT, "Lower lobe of lung"),
-            "C34.9 : Lung, NOS": CodedConcept("39607008", self.SCT, "Lung"),
-            "C37.9 : Thymus": CodedConcept("9875009", self.SCT, "Thymus"),
-            "C38.0 : Heart": CodedConcept("80891009", self.SCT, "Heart"),
-
-            # Abdomen
-            "C22.0 : Liver": CodedConcept("10200004", self.SCT, "Liver"),
-            "C22.1 : Intrahepatic bile duct": CodedConcept("58716001", self.SCT, "Intrahepatic bile duct"),
-            "C23.9 : Gallbladder": CodedConcept("28231008", self.SCT, "Gallbladder"),
-            "C25.0 : Head of pancreas": CodedConcept("64163001", self.SCT, "Head of pancreas"),
-            "C25.9 : Pancreas, NOS": CodedConcept("15776009", self.SCT, "Pancreas"),
-
-            # Retroperitoneum
-            "C48.0 : Retroperitoneum": CodedConcept("82849001", self.SCT, "Retroperitoneum"),
-            "C48.1 : Specified parts of peritoneum": CodedConcept("15425007", self.SCT, "Peritoneum"),
-            "C48.2 : Peritoneum, NOS": CodedConcept("15425007", self.SCT, "Peritoneum"),
-
-            # Urinary
-            "C64.9 : Kidney, NOS": CodedConcept("64033007", self.SCT, "Kidney"),
-            "C65.9 : Renal pelvis": CodedConcept("25990002", self.SCT, "Renal pelvis"),
-            "C66.9 : Ureter": CodedConcept("87953007", self.SCT, "Ureter"),
-            "C67.9 : Bladder, NOS": CodedConcept("89837001", self.SCT, "Urinary bladder"),
-            "C68.0 : Urethra": CodedConcept("13648007", self.SCT, "Urethra"),
-
-            # Male genital
-            "C61.9 : Prostate gland": CodedConcept("41216001", self.SCT, "Prostate"),
-            "C62.9 : Testis, NOS": CodedConcept("40689003", self.SCT, "Testis"),
-
-            # Female genital
-            "C53.9 : Cervix uteri": CodedConcept("71252005", self.SCT, "Cervix"),
-            "C54.1 : Endometrium": CodedConcept("2739003", self.SCT, "Endometrium"),
-            "C54.9 : Corpus uteri": CodedConcept("35039007", self.SCT, "Uterus"),
-            "C55.9 : Uterus, NOS": CodedConcept("35039007", self.SCT, "Uterus"),
-            "C56.9 : Ovary": CodedConcept("15497006", self.SCT, "Ovary"),
-            "C57.0 : Fallopian tube": CodedConcept("31435000", self.SCT, "Fallopian tube"),
-
-            # Breast
-            "C50.9 : Breast, NOS": CodedConcept("76752008", self.SCT, "Breast"),
-
-            # Skin
-            "C44.9 : Skin, NOS": CodedConcept("39937001", self.SCT, "Skin"),
-
-            # Bones
-            "C40.0 : Long bones of upper limb": CodedConcept("410030009", self.SCT, "Bone structure of upper extremity"),
-            "C40.2 : Long bones of lower limb": CodedConcept("410029004", self.SCT, "Bone structure of lower extremity"),
-            "C41.0 : Bones of skull and face and associated joints": CodedConcept("272679001", self.SCT, "Cranial and/or facial bone"),
-            "C41.2 : Vertebral column": CodedConcept("421060004", self.SCT, "Vertebral column"),
-            "C41.4 : Pelvic bones": CodedConcept("12921003", self.SCT, "Pelvic bone"),
-            "C41.9 : Bone, NOS": CodedConcept("272673000", self.SCT, "Bone"),
-
-            # Soft tissue
-            "C47.9 : Peripheral nerves and autonomic nervous system": CodedConcept("84782009", self.SCT, "Peripheral nerve"),
-            "C49.0 : Connective tissue of head, face and neck": CodedConcept("71836000", self.SCT, "Soft tissue"),
-            "C49.9 : Connective, subcutaneous and other soft tissues, NOS": CodedConcept("71836000", self.SCT, "Soft tissue"),
-
-            # Eye
-            "C69.0 : Conjunctiva": CodedConcept("29445007", self.SCT, "Conjunctiva"),
-            "C69.2 : Retina": CodedConcept("5665001", self.SCT, "Retina"),
-            "C69.4 : Ciliary body": CodedConcept("29534007", self.SCT, "Ciliary body"),
-            "C69.6 : Orbit, NOS": CodedConcept("363654007", self.SCT, "Orbit"),
-            "C69.9 : Eye, NOS": CodedConcept("81745001", self.SCT, "Eye"),
-
-            # Lymph nodes
-            "C77.0 : Lymph nodes of head, face and neck": CodedConcept("59441001", self.SCT, "Lymph node"),
-            "C77.9 : Lymph node, NOS": CodedConcept("59441001", self.SCT, "Lymph node"),
-
-            # GI tract
-            "C15.9 : Esophagus, NOS": CodedConcept("32849002", self.SCT, "Esophagus"),
-            "C16.9 : Stomach, NOS": CodedConcept("69695003", self.SCT, "Stomach"),
-            "C17.0 : Duodenum": CodedConcept("38848004", self.SCT, "Duodenum"),
-            "C17.9 : Small intestine, NOS": CodedConcept("30315005", self.SCT, "Small intestine"),
-            "C18.9 : Colon, NOS": CodedConcept("71854001", self.SCT, "Colon"),
-            "C19.9 : Rectosigmoid junction": CodedConcept("49832006", self.SCT, "Rectosigmoid junction"),
-            "C20.9 : Rectum, NOS": CodedConcept("34402009", self.SCT, "Rectum"),
-
-            # Head and neck
-            "C00.9 : Lip, NOS": CodedConcept("81083006", self.SCT, "Lip"),
-            "C01.9 : Base of tongue": CodedConcept("47975008", self.SCT, "Base of tongue"),
-            "C02.9 : Tongue, NOS": CodedConcept("21974007", self.SCT, "Tongue"),
-            "C07.9 : Parotid gland": CodedConcept("45289007", self.SCT, "Parotid gland"),
-            "C08.9 : Major salivary gland, NOS": CodedConcept("385296007", self.SCT, "Salivary gland"),
-            "C09.9 : Tonsil, NOS": CodedConcept("75573002", self.SCT, "Tonsil"),
-            "C10.9 : Oropharynx, NOS": CodedConcept("31389004", self.SCT, "Oropharynx"),
-            "C11.9 : Nasopharynx, NOS": CodedConcept("71836000", self.SCT, "Nasopharynx"),
-            "C13.9 : Hypopharynx, NOS": CodedConcept("81502006", self.SCT, "Hypopharynx"),
-            "C30.0 : Nasal cavity": CodedConcept("279549004", self.SCT, "Nasal cavity"),
-            "C31.0 : Maxillary sinus": CodedConcept("15924003", self.SCT, "Maxillary sinus"),
-            "C32.9 : Larynx, NOS": CodedConcept("4596009", self.SCT, "Larynx"),
-            "C73.9 : Thyroid gland": CodedConcept("69748006", self.SCT, "Thyroid gland"),
-
-            # Unknown
-            "C76.0 : Head, face or neck, NOS": CodedConcept("774007", self.SCT, "Head and/or neck structure"),
-            "C76.7 : Other ill-defined sites": CodedConcept("39801007", self.SCT, "Body structure"),
-            "C80.9 : Unknown primary site": CodedConcept("39801007", self.SCT, "Body structure"),
-        }
-
-    def _init_fixation_mappings(self) -> None:
-        """Initialize fixation method mappings."""
-        self._fixation_map: Dict[str, CodedConcept] = {
-            # Formalin-based fixation
-            "FFPE": CodedConcept("431510009", self.SCT, "Formalin fixed and target antigen retrieved"),
-            "Formalin fixed paraffin embedded (FFPE)": CodedConcept("431510009", self.SCT, "Formalin fixed and target antigen retrieved"),
-            "Formalin-Fixed Paraffin-Embedded": CodedConcept("431510009", self.SCT, "Formalin fixed and target antigen retrieved"),
-            "Formalin": CodedConcept("431510009", self.SCT, "Formalin fixed and target antigen retrieved"),
-            "10% Neutral Buffered Formalin": CodedConcept("434162003", self.SCT, "Neutral Buffered Formalin"),
-            "PAXgene": CodedConcept("C185113", self.NCIT, "PAXgene Tissue System"),
-
-            # Frozen/OCT
-            "OCT": CodedConcept("433469005", self.SCT, "Tissue freezing medium"),
-            "Optimal Cutting Temperature": CodedConcept("433469005", self.SCT, "Tissue freezing medium"),
-            "Frozen": CodedConcept("433469005", self.SCT, "Tissue freezing medium"),
-        }
-
-        self._fixation_abbreviations: Dict[str, str] = {
-            "FFPE": "FF",
-            "Formalin fixed paraffin embedded (FFPE)": "FF",
-            "Formalin-Fixed Paraffin-Embedded": "FF",
-            "Formalin": "FF",
-            "10% Neutral Buffered Formalin": "FF",
-            "PAXgene": "PG",
-            "OCT": "OCT",
-            "Optimal Cutting Temperature": "OCT",
-            "Frozen": "FR",
-        }
-
-    def _init_embedding_mappings(self) -> None:
-        """Initialize embedding media mappings."""
-        self._embedding_map: Dict[str, CodedConcept] = {
-            # Paraffin embedding
-            "FFPE": CodedConcept("311731000", self.SCT, "Paraffin wax"),
-            "Formalin fixed paraffin embedded (FFPE)": CodedConcept("311731000", self.SCT, "Paraffin wax"),
-            "Formalin-Fixed Paraffin-Embedded": CodedConcept("311731000", self.SCT, "Paraffin wax"),
-            "Paraffin": CodedConcept("311731000", self.SCT, "Paraffin wax"),
-            "Paraffin wax": CodedConcept("311731000", self.SCT, "Paraffin wax"),
-            # OCT is the embedding medium itself (frozen sections)
-        }
-
-        self._embedding_abbreviations: Dict[str, str] = {
-            "FFPE": "PE",
-            "Formalin fixed paraffin embedded (FFPE)": "PE",
-            "Formalin-Fixed Paraffin-Embedded": "PE",
-            "Paraffin": "PE",
-            "Paraffin wax": "PE",
-        }
-
-    def _init_staining_mappings(self) -> None:
-        """Initialize staining method mappings."""
-        # Each staining method maps to a list of (code, scheme, meaning) tuples
-        self._staining_map: Dict[str, List[CodedConcept]] = {
-            # H&E - two stains
-            "H&E": [
-                CodedConcept("12710003", self.SCT, "hematoxylin stain"),
-                CodedConcept("36879007", self.SCT, "water soluble eosin stain")
-            ],
-            "Hematoxylin and Eosin Staining Method": [
-                CodedConcept("12710003", self.SCT, "hematoxylin stain"),
-                CodedConcept("36879007", self.SCT, "water soluble eosin stain")
-            ],
-            "HE": [
-                CodedConcept("12710003", self.SCT, "hematoxylin stain"),
-                CodedConcept("36879007", self.SCT, "water soluble eosin stain")
-            ],
-
-            # Immunohistochemistry
-            "IHC": [
-                CodedConcept("127790008", self.SCT, "immunohistochemical stain")
-            ],
-            "Immunohistochemistry": [
-                CodedConcept("127790008", self.SCT, "immunohistochemical stain")
-            ],
-
-            # Other common stains
-            "PAS": [
-                CodedConcept("104210008", self.SCT, "periodic acid Schiff stain")
-            ],
-            "Masson trichrome": [
-                CodedConcept("76574004", self.SCT, "Masson trichrome stain")
-            ],
-            "Silver stain": [
-                CodedConcept("86243006", self.SCT, "silver stain")
-            ],
-            "Giemsa": [
-                CodedConcept("62778005", self.SCT, "Giemsa stain")
-            ],
-        }
-
-        self._staining_abbreviations: Dict[str, str] = {
-            "H&E": "HE",
-            "Hematoxylin and Eosin Staining Method": "HE",
-            "HE": "HE",
-            "IHC": "IHC",
-            "Immunohistochemistry": "IHC",
-            "PAS": "PAS",
-            "Masson trichrome": "MT",
-            "Silver stain": "SS",
-            "Giemsa": "GI",
-        }
-
-    def _init_tissue_type_mappings(self) -> None:
-        """Initialize tissue type (tumor status) mappings."""
-        self._tissue_type_map: Dict[str, CodedConcept] = {
-            "Normal": CodedConcept("17621005", self.SCT, "Normal"),
-            "Tumor": CodedConcept("108369006", self.SCT, "Tumor"),
-            "Neoplastic": CodedConcept("108369006", self.SCT, "Neoplastic"),
-        }
-
-        self._tissue_type_abbreviations: Dict[str, str] = {
-            "Normal": "N",
-            "Tumor": "T",
-            "Neoplastic": "T",
-        }
-
     def map_anatomy_to_snomed(self, anatomic_site: str) -> Optional[CodedConcept]:
         """
         Map anatomic site string to SNOMED CT code.
@@ -354,19 +406,33 @@ class DicomCodeMapper:
         if not anatomic_site or anatomic_site in ("Not Reported", "Invalid value", ""):
             return None
 
+        try:
+            return self._anatomy_cache[anatomic_site]
+        except KeyError:
+            anatomy = self._lookup_anatomy(anatomic_site)
+            self._anatomy_cache[anatomic_site] = anatomy
+            return anatomy
+
+    def _lookup_anatomy(self, anatomic_site: str) -> Optional[CodedConcept]:
+        """Look up anatomic site in the anatomy tables (uncached)."""
         # Direct lookup
-        anatomy = self._anatomy_map.get(anatomic_site)
+        anatomy = _ANATOMY_MAP.get(anatomic_site)
         if anatomy:
             return anatomy
 
-        # Try partial match (anatomic_site might have extra whitespace or variations)
-        for key, anat in self._anatomy_map.items():
-            # Check if the ICD-O code portion matches
-            if anatomic_site.startswith(key.split(":")[0].strip()):
-                return anat
-            # Check if key is contained in anatomic_site
-            if key in anatomic_site:
-                return anat
+        # Fall back to the ICD-O code portion (anatomic_site might have extra
+        # whitespace or a variant description)
+        prefix = anatomic_site.split(":", 1)[0].strip()
+        anatomy = _ANATOMY_PREFIX_MAP.get(prefix)
+        if anatomy:
+            return anatomy
+
+        # Last resort: a known ICD-O code contained in the string, found in
+        # a single scan regardless of table size
+        for match in _ICDO_TOPOGRAPHY_RE.finditer(anatomic_site):
+            anatomy = _ANATOMY_PREFIX_MAP.get(match.group())
+            if anatomy:
+                return anatomy
 
         return None
 
@@ -390,22 +456,37 @@ class DicomCodeMapper:
         tuple
             (code_value, coding_scheme, code_meaning) or (None, None, None)
         """
-        diagnosis = diagnosis_data.get('diagnosis', '')
+        key = (
+            diagnosis_data.get('diagnosis', ''),
+            diagnosis_data.get('diagnosis_comment', '')
+        )
+        try:
+            return self._diagnosis_cache[key]
+        except KeyError:
+            resolved = self._parse_diagnosis(*key)
+            self._diagnosis_cache[key] = resolved
+            return resolved
+
+    def _parse_diagnosis(
+        self,
+        diagnosis: Optional[str],
+        comment: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Parse diagnosis string into code components (uncached)."""
         if not diagnosis or diagnosis == "see diagnosis_comment":
             # Use diagnosis_comment as description only
-            comment = diagnosis_data.get('diagnosis_comment', '')
             if comment:
                 return None, None, comment
             return None, None, None
 
         # Extract ICD-O code from format like "9470/3 : Medulloblastoma, NOS"
-        parts = diagnosis.split(' : ', 1)
-        if len(parts) >= 2:
-            code = parts[0].strip()
-            meaning = parts[1].strip()
+        code, sep, meaning = diagnosis.partition(' : ')
+        if sep:
+            code = code.strip()
+            meaning = meaning.strip()
 
             # Skip unknown codes (999x/x)
-            if code.startswith('999'):
+            if code[:3] == '999':
                 return None, None, meaning
 
             return code, self.ICDO3, meaning
@@ -437,12 +518,9 @@ class DicomCodeMapper:
         if not fixation_method:
             return None, None
 
-        fixative_code = self._fixation_map.get(fixation_method)
-        embedding_code = self._embedding_map.get(fixation_method)
-
-        return fixative_code, embedding_code
+        return _FIXATION_COMBO_MAP.get(fixation_method, (None, None))
 
-    def map_staining_to_codes(self, staining_method: str) -> List[CodedConcept]:
+    def map_staining_to_codes(self, staining_method: str) -> Tuple[CodedConcept, ...]:
         """
         Map staining method to SNOMED CT stain codes.
 
@@ -453,13 +531,13 @@ class DicomCodeMapper:
 
         Returns
         -------
-        list
-            List of CodedConcept objects for the stains
+        tuple
+            CodedConcept objects for the stains (shared, immutable)
         """
         if not staining_method:
-            return []
+            return ()
 
-        return self._staining_map.get(staining_method, [])
+        return _STAINING_MAP.get(staining_method, ())
 
     def get_fixation_abbreviation(self, fixation_method: str) -> Optional[str]:
         """
@@ -477,7 +555,7 @@ class DicomCodeMapper:
         """
         if not fixation_method:
             return None
-        return self._fixation_abbreviations.get(fixation_method)
+        return _FIXATION_ABBREVIATIONS.get(fixation_method)
 
     def get_embedding_abbreviation(self, embedding_method: str) -> Optional[str]:
         """
@@ -495,7 +573,7 @@ class DicomCodeMapper:
         """
         if not embedding_method:
             return None
-        return self._embedding_abbreviations.get(embedding_method)
+        return _EMBEDDING_ABBREVIATIONS.get(embedding_method)
 
     def get_staining_abbreviation(self, staining_method: str) -> Optional[str]:
         """
@@ -513,7 +591,7 @@ class DicomCodeMapper:
         """
         if not staining_method:
             return None
-        return self._staining_abbreviations.get(staining_method)
+        return _STAINING_ABBREVIATIONS.get(staining_method)
 
     def get_tissue_type_code(self, tumor_status: str) -> Optional[CodedConcept]:
         """
@@ -531,7 +609,7 @@ class DicomCodeMapper:
         """
         if not tumor_status:
             return None
-        return self._tissue_type_map.get(tumor_status)
+        return _TISSUE_TYPE_MAP.get(tumor_status)
 
     def get_tissue_type_abbreviation(self, tumor_status: str) -> Optional[str]:
         """
@@ -549,7 +627,7 @@ class DicomCodeMapper:
         """
         if not tumor_status:
             return None
-        return self._tissue_type_abbreviations.get(tumor_status)
+        return _TISSUE_TYPE_ABBREVIATIONS.get(tumor_status)
 
     def map_sex(self, sex_at_birth: Optional[str]) -> Optional[str]:
         """
@@ -567,14 +645,4 @@ class DicomCodeMapper:
         """
         if not sex_at_birth:
             return None
-
-        sex_lower = sex_at_birth.lower().strip()
-
-        if sex_lower in ("male", "m"):
-            return "M"
-        elif sex_lower in ("female", "f"):
-            return "F"
-        elif sex_lower in ("other", "o"):
-            return "O"
-
-        return None
+        return _SEX_MAP.get(sex_at_birth.lower().strip())
@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CollectionConfig:
     """
     Collection-specific configuration for DICOM attributes.
@@ -5,8 +5,13 @@ Integrates the metadata handler with wsidicomizer for full
 metadata propagation during WSI to DICOM conversion.
 """
 
+import copy
+import functools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable
 
 import pydicom
 from pydicom.uid import UID, JPEG2000
@@ -31,6 +36,8 @@ except ImportError:
     from code_mapper import DicomCodeMapper
     from collection_config import CollectionConfig, MCI_CCDI_CONFIG
 
+logger = logging.getLogger(__name__)
+
 
 class Jpeg2kLosslessEncoder(Jpeg2kEncoder):
     """
@@ -57,6 +64,19 @@ class Jpeg2kLosslessEncoder(Jpeg2kEncoder):
         return "YBR_ICT"
 
 
+@functools.lru_cache(maxsize=None)
+def _default_encoder() -> Jpeg2kLosslessEncoder:
+    """
+    Return the shared default lossless encoder.
+
+    The encoder only holds its settings and encodes each tile
+    independently, so one instance is shared by all conversions and
+    worker threads. Created on first use to keep imports free of codec
+    initialization.
+    """
+    return Jpeg2kLosslessEncoder()
+
+
 def create_metadata_post_processor(
     additional_ds: pydicom.Dataset
 ) -> MetadataPostProcessor:
@@ -66,6 +86,12 @@ def create_metadata_post_processor(
     The post-processor is called for each DICOM file generated and
     can add or modify attributes in the output dataset.
 
+    Each output dataset gets its own copy of the elements.
+
+    Only header elements are copied; the post-processor never reads or
+    writes PixelData. If additional_ds is ever loaded from disk, read it
+    with ``pydicom.dcmread(path, stop_before_pixels=True)``.
+
     Parameters
     ----------
     additional_ds : pydicom.Dataset
@@ -76,15 +102,44 @@ def create_metadata_post_processor(
     MetadataPostProcessor
         Post-processor function for wsidicomizer
     """
+    # Snapshot the elements once; the post-processor runs for every output file
+    elements = tuple(additional_ds)
+
     def post_processor(ds: pydicom.Dataset, metadata: WsiMetadata) -> pydicom.Dataset:
         # Copy all attributes from additional_ds to the output dataset
-        for elem in additional_ds:
-            ds.add(elem)
+        for elem in copy.deepcopy(elements):
+            ds[elem.tag] = elem
         return ds
 
     return post_processor
 
 
+def _completion_marker(
+    output_folder: Path,
+    study_uid: str,
+    slide_id: str
+) -> Path:
+    """
+    Return the path of the marker written once a slide is fully converted.
+
+    Parameters
+    ----------
+    output_folder : Path
+        Output directory of the conversion
+    study_uid : str
+        StudyInstanceUID assigned to the slide's study
+    slide_id : str
+        ContainerIdentifier (slide ID) of the slide
+
+    Returns
+    -------
+    Path
+        Marker path inside output_folder
+    """
+    safe_id = "".join(c if c.isalnum() or c in "-_." else "_" for c in slide_id)
+    return output_folder / f".{safe_id}_{study_uid}.done"
+
+
 def convert_with_metadata(
     input_file: Path,
     output_folder: Path,
@@ -96,7 +151,8 @@ def convert_with_metadata(
     workers: int = 4,
     include_label: bool = False,
     include_overview: bool = True,
-    encoding: Optional[Jpeg2kEncoder] = None
+    encoding: Optional[Jpeg2kEncoder] = None,
+    force: bool = False
 ) -> None:
     """
     Convert WSI file to DICOM with full metadata propagation.
@@ -125,9 +181,24 @@ def convert_with_metadata(
         Include overview/macro image (default True)
     encoding : Jpeg2kEncoder, optional
         Encoder to use. If None, uses Jpeg2kLosslessEncoder.
+    force : bool
+        Convert even if a previous run already completed the slide, as
+        recorded by a marker keyed on study UID and slide ID (default False)
+
+    Raises
+    ------
+    FileNotFoundError
+        If input_file does not exist
+    ValueError
+        If no samples are found for the input file
     """
     input_file = Path(input_file)
     output_folder = Path(output_folder)
+
+    # Fail fast before any metadata is assembled
+    if not input_file.is_file():
+        raise FileNotFoundError(f"Input file not found: {input_file}")
+
     output_folder.mkdir(parents=True, exist_ok=True)
 
     # Initialize code mapper if not provided
@@ -143,17 +214,31 @@ def convert_with_metadata(
     )
 
     # Load metadata from CSVs
-    print(f"Loading metadata for {input_file.name}...")
+    logger.info("Loading metadata for %s...", input_file.name)
     slide_data = handler.load_metadata_for_file(input_file)
+    if not slide_data.samples:
+        raise ValueError(f"No samples found for {input_file.name}")
     patient_data = handler.get_patient_data(slide_data)
 
-    print(f"  Patient ID: {patient_data.patient_id}")
-    print(f"  Samples: {[s.sample_id for s in slide_data.samples]}")
+    logger.info("  Patient ID: %s", patient_data.patient_id)
+    logger.info("  Samples: %s", [s.sample_id for s in slide_data.samples])
     if patient_data.diagnosis_meaning:
-        print(f"  Diagnosis: {patient_data.diagnosis_meaning}")
+        logger.info("  Diagnosis: %s", patient_data.diagnosis_meaning)
 
     # Build wsidicomizer metadata
     wsidicom_metadata = handler.build_wsidicomizer_metadata(slide_data, patient_data)
+    # Persist any UIDs minted for this slide before they reach the output
+    uid_manager.flush()
+
+    # Skip slides that a previous run converted to completion
+    marker = _completion_marker(
+        output_folder,
+        wsidicom_metadata.study.uid,
+        wsidicom_metadata.slide.identifier
+    )
+    if not force and marker.is_file():
+        logger.info("Skipping %s: already converted (%s)", input_file.name, marker.name)
+        return
 
     # Build additional metadata (clinical trial, diagnosis, etc.)
     additional_metadata = handler.build_additional_metadata(patient_data, slide_data)
@@ -163,12 +248,12 @@ def convert_with_metadata(
 
     # Use provided encoder or default
     if encoding is None:
-        encoding = Jpeg2kLosslessEncoder()
+        encoding = _default_encoder()
 
     # Run conversion
-    print(f"Converting {input_file.name} to DICOM...")
+    logger.info("Converting %s to DICOM...", input_file.name)
     try:
-        WsiDicomizer.convert(
+        written = WsiDicomizer.convert(
             filepath=input_file,
             output_path=output_folder,
             metadata=wsidicom_metadata,
@@ -181,24 +266,58 @@ def convert_with_metadata(
             preferred_source=TiffSlideSource,
             encoding=encoding
         )
-        print(f"Conversion completed. Output in {output_folder}")
+        # Only a finished conversion is marked, so interrupted runs are redone
+        marker.write_text("".join(f"{Path(path).name}\n" for path in written))
+        logger.info("Conversion completed. Output in %s", output_folder)
     except Exception as e:
-        print(f"Conversion failed: {e}")
+        logger.error("Conversion of %s failed: %s", input_file.name, e)
         raise
 
 
+@functools.lru_cache(maxsize=8)
+def _get_loader(csv_directory: str, metadata_basename: str) -> MCICCDILoader:
+    """
+    Return a loaded MCI/CCDI loader, shared across conversions.
+
+    The returned loader is shared and must be treated as read-only.
+    """
+    csv_loader = MCICCDILoader(metadata_basename)
+    csv_loader.load(Path(csv_directory))
+    return csv_loader
+
+
+@functools.lru_cache(maxsize=8)
+def _get_uid_manager(uid_base_path: str) -> UIDMappingManager:
+    """Return the MCI UID mapping manager for a base path, shared across conversions."""
+    uid_base = Path(uid_base_path)
+    return UIDMappingManager(
+        specimen_map_file=uid_base / "MCIspecimenIDToUIDMap.csv",
+        study_uid_map_file=uid_base / "MCIstudyIDToUIDMap.csv",
+        study_datetime_map_file=uid_base / "MCIstudyIDToDateTimeMap.csv"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_code_mapper(icd_o_file: Optional[str]) -> DicomCodeMapper:
+    """Return a code mapper for an ICD-O file, shared across conversions."""
+    return DicomCodeMapper(icd_o_file=icd_o_file)
+
+
 def convert_mci_wsi_to_dicom(
     input_file: Path,
     output_folder: Path,
     csv_directory: Path,
     metadata_basename: str,
     uid_base_path: Path,
-    icd_o_file: Optional[Path] = None
+    icd_o_file: Optional[Path] = None,
+    workers: int = 4
 ) -> None:
     """
     Convert MCI/CCDI WSI file to DICOM with full metadata propagation.
 
     Convenience function that sets up all components for MCI/CCDI collection.
+    The loader, UID manager and code mapper are cached per input paths and
+    reused by subsequent calls in the same process.
 
     Parameters
     ----------
@@ -214,18 +333,13 @@ def convert_mci_wsi_to_dicom(
         Base path for UID mapping files
     icd_o_file : Path, optional
         Path to ICD-O-3 code file for diagnosis lookup
+    workers : int
+        Number of worker threads for the conversion (default 4)
     """
-    # Initialize components
-    csv_loader = MCICCDILoader(metadata_basename)
-    csv_loader.load(Path(csv_directory))
-
-    uid_manager = UIDMappingManager(
-        specimen_map_file=Path(uid_base_path) / "MCIspecimenIDToUIDMap.csv",
-        study_uid_map_file=Path(uid_base_path) / "MCIstudyIDToUIDMap.csv",
-        study_datetime_map_file=Path(uid_base_path) / "MCIstudyIDToDateTimeMap.csv"
-    )
-
-    code_mapper = DicomCodeMapper(icd_o_file=icd_o_file)
+    # Components are cached so batch runs parse the CSVs and mapping files once
+    csv_loader = _get_loader(str(csv_directory), metadata_basename)
+    uid_manager = _get_uid_manager(str(uid_base_path))
+    code_mapper = _get_code_mapper(str(icd_o_file) if icd_o_file is not None else None)
 
     convert_with_metadata(
         input_file=input_file,
@@ -233,14 +347,98 @@ def convert_mci_wsi_to_dicom(
         csv_loader=csv_loader,
         uid_manager=uid_manager,
         collection_config=MCI_CCDI_CONFIG,
-        code_mapper=code_mapper
+        code_mapper=code_mapper,
+        workers=workers
     )
 
 
+def _init_batch_worker() -> None:
+    """Drop the UID manager inherited from the parent; each worker opens its own."""
+    _get_uid_manager.cache_clear()
+
+
+def convert_mci_batch(
+    input_files: Iterable[Path],
+    output_root: Path,
+    csv_directory: Path,
+    metadata_basename: str,
+    uid_base_path: Path,
+    icd_o_file: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    workers: int = 4
+) -> None:
+    """
+    Convert a batch of MCI/CCDI WSI files to DICOM in parallel processes.
+
+    Each slide is written to ``output_root / <input file stem>``. All
+    specimen and study UIDs are assigned in the calling process before the
+    conversions start, so the worker processes only read the UID mapping
+    files and never append to them concurrently.
+
+    Parameters
+    ----------
+    input_files : Iterable[Path]
+        Paths to input WSI files
+    output_root : Path
+        Directory in which to create one output folder per slide
+    csv_directory : Path
+        Path to directory containing CSV metadata files
+    metadata_basename : str
+        Base name for CSV files
+    uid_base_path : Path
+        Base path for UID mapping files
+    icd_o_file : Path, optional
+        Path to ICD-O-3 code file for diagnosis lookup
+    jobs : int, optional
+        Number of slides converted concurrently. Defaults to the number of
+        CPUs divided by ``workers``.
+    workers : int
+        Number of worker threads per conversion (default 4)
+    """
+    input_files = [Path(f) for f in input_files]
+    output_root = Path(output_root)
+
+    csv_loader = _get_loader(str(csv_directory), metadata_basename)
+    uid_manager = _get_uid_manager(str(uid_base_path))
+
+    # Assign UIDs the same way WSIMetadataHandler does: per found sample, and
+    # per participant of the first found sample
+    sample_ids = []
+    for input_file in input_files:
+        samples = csv_loader.get_joined_record(input_file.name)[0]
+        sample_ids.extend(sample.sample_id for sample in samples)
+        if samples and samples[0].participant_id:
+            uid_manager.get_or_create_study_uid(samples[0].participant_id)
+    uid_manager.get_or_create_specimen_uids(sample_ids)
+    # Write the new mappings and close the map files before forking
+    uid_manager.close()
+
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 1) // max(1, workers))
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker) as executor:
+        futures = [
+            executor.submit(
+                convert_mci_wsi_to_dicom,
+                input_file,
+                output_root / input_file.stem,
+                csv_directory,
+                metadata_basename,
+                uid_base_path,
+                icd_o_file,
+                workers
+            )
+            for input_file in input_files
+        ]
+        for future in futures:
+            future.result()
+
+
 # Convenience export
 __all__ = [
     'convert_with_metadata',
     'convert_mci_wsi_to_dicom',
+    'convert_mci_batch',
     'create_metadata_post_processor',
     'Jpeg2kLosslessEncoder',
 ]
@@ -6,12 +6,34 @@ for loading metadata from CSV files.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import importlib.util
+import re
+import sys
 import pandas as pd
 
 
+# Diagnosis IDs for additional CNS classification entries (not the primary diagnosis)
+_CNS_VARIANT_PATTERN = re.compile('_CNS_category|_CNS5_diagnosis')
+
+# Diagnosis rows for one key: (all rows, primary rows, CNS5 rows)
+_DiagnosisRows = Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]
+
+# Anatomic site placeholders that do not name a site
+UNREPORTED_ANATOMIC_SITES = frozenset({sys.intern("Not Reported"), sys.intern("Invalid value")})
+
+# Low-cardinality value columns, interned at load time and stored as categoricals
+_PATHOLOGY_VALUE_COLUMNS = ('fixation_embedding_method', 'staining_method')
+_SAMPLE_VALUE_COLUMNS = ('anatomic_site', 'sample_tumor_status')
+_DIAGNOSIS_VALUE_COLUMNS = ('anatomic_site',)
+
+# pandas can hand CSV parsing to pyarrow's multithreaded reader when installed
+_CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+
 @dataclass
 class SampleData:
     """
@@ -52,6 +74,10 @@ class SampleData:
     percent_necrosis: Optional[str] = None
 
 
+# Joined metadata for one file: (samples, participant data, diagnosis data)
+JoinedRecord = Tuple[List[SampleData], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
 class CSVLoaderBase(ABC):
     """
     Abstract base class for collection-specific CSV loaders.
@@ -63,6 +89,10 @@ class CSVLoaderBase(ABC):
     (MCI/CCDI, GTEx, CMB, etc.) by implementing the abstract methods.
     """
 
+    # Filled per file by get_joined_record(), or for every file at once by
+    # build_denormalized_index()
+    _denormalized_index: Optional[Dict[str, JoinedRecord]] = None
+
     @abstractmethod
     def load(self, csv_directory: Path) -> None:
         """
@@ -172,6 +202,119 @@ class CSVLoaderBase(ABC):
         """
         pass
 
+    def get_filenames(self) -> List[str]:
+        """
+        Get the names of all files described by the loaded metadata.
+
+        Loaders that cannot enumerate their files return an empty list;
+        their files are then joined on demand by get_joined_record().
+
+        Returns
+        -------
+        List[str]
+            Input file names
+        """
+        return []
+
+    def build_denormalized_index(self) -> Dict[str, JoinedRecord]:
+        """
+        Join the metadata of every known file once.
+
+        Runs the file -> sample -> imaging -> participant -> diagnosis
+        lookups for each file from get_filenames() and caches the result,
+        so per-file processing is a single dict lookup. The loader must not
+        be modified after the index is built.
+
+        Returns
+        -------
+        dict
+            Mapping of file name to (samples, participant data, diagnosis data)
+        """
+        if self._denormalized_index is None:
+            self._denormalized_index = {}
+        index = self._denormalized_index
+        for filename in self.get_filenames():
+            if filename not in index:
+                index[filename] = self._join_file(filename)
+        return index
+
+    def get_joined_record(self, filename: str) -> JoinedRecord:
+        """
+        Get the joined metadata for a file.
+
+        Only the requested file is joined; its record is cached for later
+        lookups.
+
+        Parameters
+        ----------
+        filename : str
+            Input file name
+
+        Returns
+        -------
+        tuple
+            (samples, participant data, diagnosis data); the samples list
+            is empty if the file has no known samples
+        """
+        if self._denormalized_index is None:
+            self._denormalized_index = {}
+        record = self._denormalized_index.get(filename)
+        if record is None:
+            record = self._join_file(filename)
+            self._denormalized_index[filename] = record
+        return record
+
+    def _join_file(self, filename: str) -> JoinedRecord:
+        """Run the relational lookups for a single file."""
+        samples = []
+        for sample_id in self.get_samples_for_file(filename):
+            sample_data = self.get_sample_data(sample_id)
+            if sample_data:
+                # Enrich with imaging-specific data
+                imaging_data = self.get_imaging_data(filename, sample_id)
+                if imaging_data:
+                    sample_data.fixation_method = imaging_data.get('fixation_embedding_method')
+                    sample_data.staining_method = imaging_data.get('staining_method')
+                    sample_data.magnification = imaging_data.get('magnification')
+                    sample_data.percent_tumor = imaging_data.get('percent_tumor')
+                    sample_data.percent_necrosis = imaging_data.get('percent_necrosis')
+                samples.append(sample_data)
+
+        if not samples:
+            return samples, None, None
+
+        # Participant and diagnosis are resolved from the first sample
+        first_sample = samples[0]
+        participant_data = self.get_participant_data(first_sample.participant_id)
+        diagnosis = self.get_diagnosis_data(
+            first_sample.participant_id, first_sample.sample_id
+        )
+        self.fill_anatomic_sites(samples, diagnosis)
+
+        return samples, participant_data, diagnosis
+
+    @staticmethod
+    def fill_anatomic_sites(
+        samples: List[SampleData],
+        diagnosis: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Fill missing sample anatomic sites from the diagnosis anatomic site.
+
+        Parameters
+        ----------
+        samples : List[SampleData]
+            Samples to update in place
+        diagnosis : dict, optional
+            Diagnosis data as returned by get_diagnosis_data()
+        """
+        diagnosis_anatomy = diagnosis.get('anatomic_site') if diagnosis else None
+        if not diagnosis_anatomy:
+            return
+        for sample in samples:
+            if not sample.anatomic_site or sample.anatomic_site in UNREPORTED_ANATOMIC_SITES:
+                sample.anatomic_site = diagnosis_anatomy
+
 
 class MCICCDILoader(CSVLoaderBase):
     """
@@ -200,9 +343,26 @@ class MCICCDILoader(CSVLoaderBase):
         self.pathology_df: Optional[pd.DataFrame] = None
         self.sample_df: Optional[pd.DataFrame] = None
         self.participant_df: Optional[pd.DataFrame] = None
-        self.diagnosis_df: Optional[pd.DataFrame] = None
         self._loaded = False
 
+        # diagnosis.csv is only read when diagnosis data is first requested
+        self._diagnosis_path: Optional[Path] = None
+        self._diagnosis_df: Optional[pd.DataFrame] = None
+
+        # Row indexes built from the DataFrames in load()
+        self._pathology_by_file: Dict[str, List[Dict[str, Any]]] = {}
+        self._samples_by_file: Dict[str, List[str]] = {}
+        self._sample_by_id: Dict[str, List[Dict[str, Any]]] = {}
+        self._participant_by_id: Dict[str, List[Dict[str, Any]]] = {}
+        self._diagnosis_by_participant: Dict[str, _DiagnosisRows] = {}
+        self._diagnosis_by_sample: Dict[str, _DiagnosisRows] = {}
+
+        # Key column names, resolved once per table when it is indexed
+        self._pathology_sample_col = 'sample_id'
+        self._sample_participant_col = 'participant_id'
+        self._diagnosis_participant_col = 'participant_id'
+        self._diagnosis_sample_col = 'sample_id'
+
     def load(self, csv_directory: Path) -> None:
         """
         Load all MCI/CCDI CSV files.
@@ -213,57 +373,232 @@ class MCICCDILoader(CSVLoaderBase):
             Directory containing the CSV files
         """
         csv_directory = Path(csv_directory)
+        base = self.metadata_basename
 
-        # Load pathology_file.csv
-        pathology_path = csv_directory / f"{self.metadata_basename}_pathology_file.csv"
-        if pathology_path.exists():
-            self.pathology_df = pd.read_csv(
-                pathology_path,
-                dtype=str,
-                na_values=[''],
-                keep_default_na=False
-            )
-            self._clean_columns(self.pathology_df)
+        def _read(path: Path) -> Optional[pd.DataFrame]:
+            return self._read_csv(path) if path.exists() else None
 
-        # Load sample.csv
-        sample_path = csv_directory / f"{self.metadata_basename}_sample.csv"
-        if sample_path.exists():
-            self.sample_df = pd.read_csv(
-                sample_path,
-                dtype=str,
-                na_values=[''],
-                keep_default_na=False
-            )
-            self._clean_columns(self.sample_df)
+        # The files are independent and the parsers release the GIL,
+        # so read them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(_read, csv_directory / f"{base}_{suffix}.csv")
+                for suffix in ('pathology_file', 'sample', 'participant')
+            ]
+            (
+                self.pathology_df,
+                self.sample_df,
+                self.participant_df,
+            ) = [future.result() for future in futures]
+
+        # Deferred until diagnosis data is first requested
+        self._diagnosis_path = csv_directory / f"{base}_diagnosis.csv"
+        self._diagnosis_df = None
+        self._diagnosis_by_participant = {}
+        self._diagnosis_by_sample = {}
+        self._denormalized_index = None
+
+        self._build_indexes()
+        self._loaded = True
 
-        # Load participant.csv
-        participant_path = csv_directory / f"{self.metadata_basename}_participant.csv"
-        if participant_path.exists():
-            self.participant_df = pd.read_csv(
-                participant_path,
-                dtype=str,
-                na_values=[''],
-                keep_default_na=False
-            )
-            self._clean_columns(self.participant_df)
+    @property
+    def diagnosis_df(self) -> Optional[pd.DataFrame]:
+        """Diagnosis table, read from diagnosis.csv on first access."""
+        if self._diagnosis_path is not None:
+            path, self._diagnosis_path = self._diagnosis_path, None
+            if path.exists():
+                self._diagnosis_df = self._read_csv(path)
+                self._build_diagnosis_indexes()
+        return self._diagnosis_df
 
-        # Load diagnosis.csv
-        diagnosis_path = csv_directory / f"{self.metadata_basename}_diagnosis.csv"
-        if diagnosis_path.exists():
-            self.diagnosis_df = pd.read_csv(
-                diagnosis_path,
-                dtype=str,
-                na_values=[''],
-                keep_default_na=False
-            )
-            self._clean_columns(self.diagnosis_df)
+    def _read_csv(self, path: Path) -> pd.DataFrame:
+        """
+        Read a metadata CSV with all values as strings.
 
-        self._loaded = True
+        Uses the pyarrow parser when available; empty cells are read as
+        missing values with either engine.
+
+        Parameters
+        ----------
+        path : Path
+            CSV file path
+
+        Returns
+        -------
+        pd.DataFrame
+            Table with cleaned column names
+        """
+        df = pd.read_csv(
+            path,
+            dtype=str,
+            na_values=[''],
+            keep_default_na=False,
+            engine=_CSV_ENGINE
+        )
+        self._clean_columns(df)
+        return df
 
     def _clean_columns(self, df: pd.DataFrame) -> None:
         """Clean column names (remove BOM if present)."""
         df.columns = [c.lstrip('\ufeff').strip() for c in df.columns]
 
+    def _build_indexes(self) -> None:
+        """
+        Build dict indexes over the loaded tables.
+
+        The getters are called once per slide, so the tables are indexed
+        once here instead of being filtered with a boolean mask per call.
+        The loader must be treated as read-only after load().
+        """
+        # Key column names may be dotted ('sample.sample_id') or plain ('sample_id')
+        if self.pathology_df is not None:
+            self._pathology_sample_col = self._resolve_column(
+                self.pathology_df, 'sample.sample_id', 'sample_id'
+            )
+        if self.sample_df is not None:
+            self._sample_participant_col = self._resolve_column(
+                self.sample_df, 'participant.participant_id', 'participant_id'
+            )
+
+        key_columns = (
+            (self.pathology_df, ('file_name', self._pathology_sample_col)),
+            (self.sample_df, ('sample_id', self._sample_participant_col)),
+            (self.participant_df, ('participant_id',)),
+        )
+
+        # IDs repeat across tables; intern them so the indexes and the rows
+        # share one string object per ID. Repetitive values (methods, sites)
+        # are interned too so later comparisons and set lookups are cheap.
+        for df, columns in key_columns:
+            self._intern_columns(df, *columns)
+        self._intern_columns(self.pathology_df, *_PATHOLOGY_VALUE_COLUMNS)
+        self._intern_columns(self.sample_df, *_SAMPLE_VALUE_COLUMNS)
+
+        if self.pathology_df is not None:
+            self._pathology_by_file = self._index_rows(self.pathology_df, 'file_name')
+
+            sample_col = self._pathology_sample_col
+            self._samples_by_file = {
+                filename: list(dict.fromkeys(
+                    row[sample_col] for row in rows if row.get(sample_col)
+                ))
+                for filename, rows in self._pathology_by_file.items()
+            }
+
+        if self.sample_df is not None:
+            self._sample_by_id = self._index_rows(self.sample_df, 'sample_id')
+
+        if self.participant_df is not None:
+            self._participant_by_id = self._index_rows(self.participant_df, 'participant_id')
+
+        # Dictionary-encode the join keys and the low-cardinality value
+        # columns of the retained DataFrames
+        for df, columns in key_columns:
+            self._categorize_columns(df, *columns)
+        self._categorize_columns(self.pathology_df, *_PATHOLOGY_VALUE_COLUMNS)
+        self._categorize_columns(self.sample_df, *_SAMPLE_VALUE_COLUMNS)
+
+    def _build_diagnosis_indexes(self) -> None:
+        """Build the diagnosis indexes once diagnosis.csv has been read."""
+        df = self._diagnosis_df
+        self._diagnosis_participant_col = self._resolve_column(
+            df, 'participant.participant_id', 'participant_id'
+        )
+        self._diagnosis_sample_col = self._resolve_column(
+            df, 'sample.sample_id', 'sample_id'
+        )
+        key_columns = (
+            'diagnosis_id', self._diagnosis_participant_col, self._diagnosis_sample_col
+        )
+        self._intern_columns(df, *key_columns)
+        self._intern_columns(df, *_DIAGNOSIS_VALUE_COLUMNS)
+
+        self._diagnosis_by_participant = self._split_diagnosis_rows(
+            self._index_rows(df, self._diagnosis_participant_col)
+        )
+        self._diagnosis_by_sample = self._split_diagnosis_rows(
+            self._index_rows(df, self._diagnosis_sample_col)
+        )
+
+        self._categorize_columns(df, *key_columns)
+        self._categorize_columns(df, *_DIAGNOSIS_VALUE_COLUMNS)
+
+    @staticmethod
+    def _intern_columns(df: Optional[pd.DataFrame], *columns: str) -> None:
+        """Replace the string values of the given columns of df with interned strings."""
+        if df is None:
+            return
+        for column in columns:
+            if column in df.columns:
+                df[column] = [
+                    sys.intern(v) if isinstance(v, str) else v
+                    for v in df[column].to_numpy()
+                ]
+
+    @staticmethod
+    def _categorize_columns(df: Optional[pd.DataFrame], *columns: str) -> None:
+        """Convert the given columns of df (where present) to category dtype."""
+        if df is None:
+            return
+        for column in columns:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+
+    def _split_diagnosis_rows(
+        self,
+        index: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, _DiagnosisRows]:
+        """
+        Classify indexed diagnosis rows into primary and CNS5 entries.
+
+        CNS_category and CNS5_diagnosis rows are additional classification
+        entries, not the primary diagnosis.
+        """
+        split = {}
+        for key, rows in index.items():
+            primary = []
+            cns5 = []
+            for row in rows:
+                diagnosis_id = self._get_value(row, 'diagnosis_id') or ''
+                if '_CNS5_diagnosis' in diagnosis_id:
+                    cns5.append(row)
+                if not _CNS_VARIANT_PATTERN.search(diagnosis_id):
+                    primary.append(row)
+            split[key] = (rows, primary, cns5)
+        return split
+
+    @staticmethod
+    def _resolve_column(df: pd.DataFrame, *candidates: str) -> str:
+        """Return the first candidate column present in df, else the last candidate."""
+        columns = set(df.columns)
+        return next((c for c in candidates if c in columns), candidates[-1])
+
+    @staticmethod
+    def _index_rows(df: pd.DataFrame, key_column: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Group the rows of a DataFrame (as dicts) by the value of a column."""
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        if key_column not in df.columns:
+            return index
+        columns = list(df.columns)
+        key_position = columns.index(key_column)
+        # Missing cells become '' so row values are always plain strings
+        for values in df.fillna('').itertuples(index=False, name=None):
+            key = values[key_position]
+            if key:
+                index.setdefault(key, []).append(dict(zip(columns, values)))
+        return index
+
+    def get_filenames(self) -> List[str]:
+        """
+        Get all file names listed in pathology_file.csv.
+
+        Returns
+        -------
+        List[str]
+            Input file names
+        """
+        return list(self._pathology_by_file)
+
     def get_samples_for_file(self, filename: str) -> List[str]:
         """
         Get sample IDs from pathology_file.csv by filename.
@@ -278,17 +613,7 @@ class MCICCDILoader(CSVLoaderBase):
         List[str]
             List of sample IDs
         """
-        if self.pathology_df is None:
-            return []
-
-        matches = self.pathology_df[
-            self.pathology_df['file_name'] == filename
-        ]
-
-        # Column name may be 'sample.sample_id' or just 'sample_id'
-        sample_col = 'sample.sample_id' if 'sample.sample_id' in matches.columns else 'sample_id'
-
-        return matches[sample_col].dropna().unique().tolist()
+        return list(self._samples_by_file.get(filename, ()))
 
     def get_sample_data(self, sample_id: str) -> Optional[SampleData]:
         """
@@ -304,27 +629,18 @@ class MCICCDILoader(CSVLoaderBase):
         SampleData or None
             Sample data if found
         """
-        if self.sample_df is None:
-            return None
-
-        matches = self.sample_df[
-            self.sample_df['sample_id'] == sample_id
-        ]
-
-        if matches.empty:
+        rows = self._sample_by_id.get(sample_id)
+        if not rows:
             return None
 
-        row = matches.iloc[0]
-
-        # Handle column name variations
-        participant_col = 'participant.participant_id' if 'participant.participant_id' in row.index else 'participant_id'
+        get = rows[0].get
 
         return SampleData(
             sample_id=sample_id,
-            participant_id=self._get_value(row, participant_col),
-            anatomic_site=self._get_value(row, 'anatomic_site'),
-            tumor_status=self._get_value(row, 'sample_tumor_status'),
-            tumor_classification=self._get_value(row, 'tumor_classification')
+            participant_id=(get(self._sample_participant_col) or '').strip() or None,
+            anatomic_site=(get('anatomic_site') or '').strip() or None,
+            tumor_status=(get('sample_tumor_status') or '').strip() or None,
+            tumor_classification=(get('tumor_classification') or '').strip() or None
         )
 
     def get_participant_data(self, participant_id: str) -> Optional[Dict[str, Any]]:
@@ -341,21 +657,15 @@ class MCICCDILoader(CSVLoaderBase):
         dict or None
             Participant data
         """
-        if self.participant_df is None:
-            return None
-
-        matches = self.participant_df[
-            self.participant_df['participant_id'] == participant_id
-        ]
-
-        if matches.empty:
+        rows = self._participant_by_id.get(participant_id)
+        if not rows:
             return None
 
-        row = matches.iloc[0]
+        get = rows[0].get
         return {
-            'sex_at_birth': self._get_value(row, 'sex_at_birth'),
-            'race': self._get_value(row, 'race'),
-            'ethnicity': self._get_value(row, 'ethnicity'),
+            'sex_at_birth': (get('sex_at_birth') or '').strip() or None,
+            'race': (get('race') or '').strip() or None,
+            'ethnicity': (get('ethnicity') or '').strip() or None,
         }
 
     def get_diagnosis_data(
@@ -384,51 +694,36 @@ class MCICCDILoader(CSVLoaderBase):
         if self.diagnosis_df is None:
             return None
 
-        # Handle column name variations
-        participant_col = 'participant.participant_id' if 'participant.participant_id' in self.diagnosis_df.columns else 'participant_id'
-
         # First try by participant_id
-        matches = self.diagnosis_df[
-            self.diagnosis_df[participant_col] == participant_id
-        ]
+        entry = self._diagnosis_by_participant.get(participant_id)
 
-        if matches.empty and sample_id:
+        if entry is None and sample_id:
             # Fall back to sample_id lookup
-            sample_col = 'sample.sample_id' if 'sample.sample_id' in self.diagnosis_df.columns else 'sample_id'
-            matches = self.diagnosis_df[
-                self.diagnosis_df[sample_col] == sample_id
-            ]
+            entry = self._diagnosis_by_sample.get(sample_id)
 
-        if matches.empty:
+        if entry is None:
             return None
 
-        # Filter out CNS_category and CNS5_diagnosis entries initially
-        # These are additional classification entries, not the primary diagnosis
-        primary_matches = matches[
-            ~matches['diagnosis_id'].str.contains('_CNS_category|_CNS5_diagnosis',
-                                                   na=False, regex=True)
-        ]
+        matches, primary_matches, cns5_matches = entry
 
-        if not primary_matches.empty:
-            row = primary_matches.iloc[0]
+        # Prefer the primary diagnosis over the additional classification entries
+        if primary_matches:
+            row = primary_matches[0]
             diagnosis_value = self._get_value(row, 'diagnosis')
 
             # If primary code is 999 (unknown), try CNS5_diagnosis as fallback
-            if diagnosis_value and diagnosis_value.startswith('999'):
-                cns5_matches = matches[
-                    matches['diagnosis_id'].str.contains('_CNS5_diagnosis', na=False)
-                ]
-                if not cns5_matches.empty:
-                    row = cns5_matches.iloc[0]
+            if diagnosis_value and diagnosis_value.startswith('999') and cns5_matches:
+                row = cns5_matches[0]
         else:
-            row = matches.iloc[0]
+            row = matches[0]
 
+        get = row.get
         return {
-            'diagnosis': self._get_value(row, 'diagnosis'),
-            'diagnosis_classification_system': self._get_value(row, 'diagnosis_classification_system'),
-            'diagnosis_comment': self._get_value(row, 'diagnosis_comment'),
-            'anatomic_site': self._get_value(row, 'anatomic_site'),
-            'age_at_diagnosis': self._parse_age(self._get_value(row, 'age_at_diagnosis')),
+            'diagnosis': (get('diagnosis') or '').strip() or None,
+            'diagnosis_classification_system': (get('diagnosis_classification_system') or '').strip() or None,
+            'diagnosis_comment': (get('diagnosis_comment') or '').strip() or None,
+            'anatomic_site': (get('anatomic_site') or '').strip() or None,
+            'age_at_diagnosis': self._parse_age((get('age_at_diagnosis') or '').strip()),
         }
 
     def get_imaging_data(
@@ -451,44 +746,33 @@ class MCICCDILoader(CSVLoaderBase):
         dict or None
             Imaging data
         """
-        if self.pathology_df is None:
+        rows = self._pathology_by_file.get(filename)
+        if not rows:
             return None
 
-        # Column name may be 'sample.sample_id' or just 'sample_id'
-        sample_col = 'sample.sample_id' if 'sample.sample_id' in self.pathology_df.columns else 'sample_id'
-
-        matches = self.pathology_df[
-            (self.pathology_df['file_name'] == filename) &
-            (self.pathology_df[sample_col] == sample_id)
-        ]
+        sample_col = self._pathology_sample_col
+        # Prefer the row for this sample, otherwise match just by filename
+        row = next((r for r in rows if r.get(sample_col) == sample_id), rows[0])
 
-        if matches.empty:
-            # Try matching just by filename
-            matches = self.pathology_df[
-                self.pathology_df['file_name'] == filename
-            ]
-
-        if matches.empty:
-            return None
-
-        row = matches.iloc[0]
+        get = row.get
         return {
-            'fixation_embedding_method': self._get_value(row, 'fixation_embedding_method'),
-            'staining_method': self._get_value(row, 'staining_method'),
-            'magnification': self._get_value(row, 'magnification'),
-            'percent_tumor': self._get_value(row, 'percent_tumor'),
-            'percent_necrosis': self._get_value(row, 'percent_necrosis'),
-            'image_modality': self._get_value(row, 'image_modality'),
+            'fixation_embedding_method': (get('fixation_embedding_method') or '').strip() or None,
+            'staining_method': (get('staining_method') or '').strip() or None,
+            'magnification': (get('magnification') or '').strip() or None,
+            'percent_tumor': (get('percent_tumor') or '').strip() or None,
+            'percent_necrosis': (get('percent_necrosis') or '').strip() or None,
+            'image_modality': (get('image_modality') or '').strip() or None,
         }
 
-    def _get_value(self, row: pd.Series, column: str) -> Optional[str]:
+    @staticmethod
+    def _get_value(row: Dict[str, Any], column: str) -> Optional[str]:
         """
-        Safely get value from row, returning None for missing/empty values.
+        Get a stripped value from an indexed row, or None if missing/empty.
 
         Parameters
         ----------
-        row : pd.Series
-            DataFrame row
+        row : dict
+            Indexed table row
         column : str
             Column name
 
@@ -497,12 +781,7 @@ class MCICCDILoader(CSVLoaderBase):
         str or None
             Value or None
         """
-        if column not in row.index:
-            return None
-        val = row.get(column)
-        if pd.isna(val) or val == '' or val is None:
-            return None
-        return str(val).strip()
+        return (row.get(column) or '').strip() or None
 
     def _parse_age(self, age_str: Optional[str]) -> Optional[int]:
         """
@@ -521,10 +800,16 @@ class MCICCDILoader(CSVLoaderBase):
         if not age_str:
             return None
         try:
-            age = int(float(age_str))
-            return age if age >= 0 else None
-        except (ValueError, TypeError):
+            # Ages are almost always integer strings; only parse floats on failure
+            age = int(age_str)
+        except ValueError:
+            try:
+                age = int(float(age_str))
+            except (ValueError, TypeError, OverflowError):
+                return None
+        except TypeError:
             return None
+        return age if age >= 0 else None
 
 
 class GTExLoader(CSVLoaderBase):
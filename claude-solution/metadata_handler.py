@@ -5,9 +5,12 @@ Main orchestrator class that coordinates CSV loading, UID mapping,
 code translation, and WsiDicomizerMetadata object construction.
 """
 
+import copy
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 
 import pydicom
@@ -35,17 +38,49 @@ from wsidicom.conceptcode import (
 from wsidicomizer.metadata import WsiDicomizerMetadata
 
 try:
-    from .csv_loaders import CSVLoaderBase, SampleData
+    from .csv_loaders import CSVLoaderBase, SampleData, UNREPORTED_ANATOMIC_SITES
     from .uid_manager import UIDMappingManager
     from .code_mapper import DicomCodeMapper
     from .collection_config import CollectionConfig
-    from .specimen_builder import SpecimenMetadataBuilder
+    from .specimen_builder import SpecimenMetadataBuilder, PREP_TYPES_BY_METHOD
 except ImportError:
-    from csv_loaders import CSVLoaderBase, SampleData
+    from csv_loaders import CSVLoaderBase, SampleData, UNREPORTED_ANATOMIC_SITES
     from uid_manager import UIDMappingManager
     from code_mapper import DicomCodeMapper
     from collection_config import CollectionConfig
-    from specimen_builder import SpecimenMetadataBuilder
+    from specimen_builder import SpecimenMetadataBuilder, PREP_TYPES_BY_METHOD
+
+
+# Slide file extensions stripped from filenames to form the slide ID
+_SLIDE_EXTENSIONS = frozenset({'svs', 'dcm', 'tiff', 'tif', 'ndpi', 'scn', 'mrxs'})
+
+
+def _concept_code(code_class, meaning: Optional[str]):
+    """Build a wsidicom concept code for a meaning, or None if not in its CID."""
+    if not meaning:
+        return None
+    try:
+        return code_class(meaning)
+    except (ValueError, KeyError):
+        return None
+
+
+# Casefolded fixation method -> (CID 8114 fixative code, CID 8115 embedding
+# medium code), built once at import; None where there is no such step
+_PREP_CODES = MappingProxyType({
+    method: (
+        _concept_code(SpecimenFixativesCode, fixation_type),
+        _concept_code(SpecimenEmbeddingMediaCode, embedding_type),
+    )
+    for method, (fixation_type, embedding_type) in PREP_TYPES_BY_METHOD.items()
+})
+
+
+# Stain code lookups by meaning are cached; None marks meanings not in the CID
+@functools.lru_cache(maxsize=64)
+def _stain_code(meaning: str) -> Optional[SpecimenStainsCode]:
+    """Get the CID 8112 stain code for a meaning, or None."""
+    return _concept_code(SpecimenStainsCode, meaning)
 
 
 @dataclass
@@ -155,12 +190,39 @@ class WSIMetadataHandler:
         self.config = collection_config
         self.specimen_builder = SpecimenMetadataBuilder(code_mapper)
 
+        # Config values truncated to the 64-character LO limit once
+        self._sponsor_name_64 = collection_config.sponsor_name[:64]
+        self._protocol_name_64 = collection_config.protocol_name[:64]
+
+        # Config-derived Clinical Trial elements, copied into every
+        # build_additional_metadata() result
+        self._clinical_trial_elements = dict(
+            (elem.tag, elem) for elem in self._build_clinical_trial_template()
+        )
+
+        # Resolved (SlideData, PatientData) per file name, built from the
+        # loader's denormalized index on first access
+        self._joined: Dict[str, Tuple[SlideData, Optional[PatientData]]] = {}
+
+        # Anatomic site -> anatomy Code (None if unmapped), filled on first use
+        self._anatomy_codes: Dict[str, Optional[Code]] = {}
+
+        # UIDs already resolved through the UID manager by this handler
+        self._specimen_uid_cache: Dict[str, str] = {}
+        self._study_uid_cache: Dict[str, str] = {}
+
+        # Patient and Study metadata per patient ID, shared by all its slides
+        self._patient_cache: Dict[str, Patient] = {}
+        self._study_cache: Dict[str, Study] = {}
+
     def load_metadata_for_file(self, input_file: Path) -> SlideData:
         """
         Load all relevant metadata for a WSI file from CSV sources.
 
-        Performs relational lookups across multiple CSV files to gather
-        sample, participant, and diagnosis information.
+        Sample, participant, and diagnosis information is taken from the
+        loader's denormalized index, so the relational lookups across the
+        CSV files run once per file. The returned SlideData is shared by
+        subsequent calls for the same file.
 
         Parameters
         ----------
@@ -172,32 +234,7 @@ class WSIMetadataHandler:
         SlideData
             Aggregated slide and sample metadata
         """
-        filename = input_file.name
-        slide_id = self._extract_slide_id(filename)
-
-        # Get samples associated with this file
-        sample_ids = self.csv_loader.get_samples_for_file(filename)
-
-        samples = []
-        for sample_id in sample_ids:
-            sample_data = self.csv_loader.get_sample_data(sample_id)
-            if sample_data:
-                # Enrich with imaging-specific data
-                imaging_data = self.csv_loader.get_imaging_data(filename, sample_id)
-                if imaging_data:
-                    sample_data.fixation_method = imaging_data.get('fixation_embedding_method')
-                    sample_data.staining_method = imaging_data.get('staining_method')
-                    sample_data.magnification = imaging_data.get('magnification')
-                    sample_data.percent_tumor = imaging_data.get('percent_tumor')
-                    sample_data.percent_necrosis = imaging_data.get('percent_necrosis')
-                samples.append(sample_data)
-
-        return SlideData(
-            slide_id=slide_id,
-            filename=filename,
-            samples=samples,
-            acquisition_datetime=None  # Could be extracted from file metadata
-        )
+        return self._get_joined(input_file.name)[0]
 
     def get_patient_data(self, slide_data: SlideData) -> PatientData:
         """
@@ -221,6 +258,11 @@ class WSIMetadataHandler:
         if not slide_data.samples:
             raise ValueError(f"No samples found for slide {slide_data.slide_id}")
 
+        # Slides from load_metadata_for_file() were resolved with the join
+        joined = self._joined.get(slide_data.filename)
+        if joined is not None and joined[0] is slide_data:
+            return joined[1]
+
         # Get participant ID from first sample
         first_sample = slide_data.samples[0]
         participant_id = first_sample.participant_id
@@ -233,6 +275,42 @@ class WSIMetadataHandler:
             participant_id, first_sample.sample_id
         )
 
+        # Enrich sample anatomic site from diagnosis if missing
+        self.csv_loader.fill_anatomic_sites(slide_data.samples, diagnosis)
+
+        return self._build_patient_data(participant_id, participant_data, diagnosis)
+
+    def _get_joined(self, filename: str) -> Tuple[SlideData, Optional[PatientData]]:
+        """Get the resolved slide and patient data for a file name."""
+        try:
+            return self._joined[filename]
+        except KeyError:
+            pass
+
+        samples, participant_data, diagnosis = self.csv_loader.get_joined_record(filename)
+
+        slide_data = SlideData(
+            slide_id=self._extract_slide_id(filename),
+            filename=filename,
+            samples=samples,
+            acquisition_datetime=None  # Could be extracted from file metadata
+        )
+        patient_data = None
+        if samples:
+            patient_data = self._build_patient_data(
+                samples[0].participant_id, participant_data, diagnosis
+            )
+
+        joined = self._joined[filename] = (slide_data, patient_data)
+        return joined
+
+    def _build_patient_data(
+        self,
+        participant_id: str,
+        participant_data: Optional[dict],
+        diagnosis: Optional[dict]
+    ) -> PatientData:
+        """Build PatientData from participant and diagnosis lookups."""
         # Map diagnosis to code
         diagnosis_code = None
         diagnosis_scheme = None
@@ -242,13 +320,6 @@ class WSIMetadataHandler:
             diagnosis_code, diagnosis_scheme, diagnosis_meaning = \
                 self.code_mapper.resolve_diagnosis_code(diagnosis)
 
-            # Enrich sample anatomic site from diagnosis if missing
-            diagnosis_anatomy = diagnosis.get('anatomic_site')
-            if diagnosis_anatomy:
-                for sample in slide_data.samples:
-                    if not sample.anatomic_site or sample.anatomic_site in ("Not Reported", "Invalid value"):
-                        sample.anatomic_site = diagnosis_anatomy
-
         return PatientData(
             patient_id=participant_id,
             sex=participant_data.get('sex_at_birth') if participant_data else None,
@@ -279,21 +350,28 @@ class WSIMetadataHandler:
         WsiDicomizerMetadata
             Metadata object for wsidicomizer
         """
+        patient_id = patient_data.patient_id
+
         # Build Patient
-        patient = Patient(
-            identifier=patient_data.patient_id,
-            name=patient_data.patient_id,
-            sex=self._map_sex(patient_data.sex)
-        )
+        try:
+            patient = self._patient_cache[patient_id]
+        except KeyError:
+            patient = self._patient_cache[patient_id] = Patient(
+                identifier=patient_id,
+                name=patient_id,
+                sex=self._map_sex(patient_data.sex)
+            )
 
         # Build Study with persistent UID
-        study_uid = self.uid_manager.get_or_create_study_uid(patient_data.patient_id)
-        study = Study(
-            uid=UID(study_uid),
-            identifier=patient_data.patient_id,
-            accession_number=patient_data.patient_id,
-            description="Histopathology"
-        )
+        try:
+            study = self._study_cache[patient_id]
+        except KeyError:
+            study = self._study_cache[patient_id] = Study(
+                uid=UID(self._get_study_uid(patient_id)),
+                identifier=patient_id,
+                accession_number=patient_id,
+                description="Histopathology"
+            )
 
         # Build Series (description will be added via post-processor if needed)
         series = Series()
@@ -346,16 +424,13 @@ class WSIMetadataHandler:
         pydicom.Dataset
             Additional DICOM attributes
         """
-        ds = pydicom.Dataset()
-
-        # Clinical Trial Module
-        ds.ClinicalTrialSponsorName = self.config.sponsor_name[:64]
-        ds.ClinicalTrialProtocolID = self.config.protocol_id
-        ds.ClinicalTrialProtocolName = self.config.protocol_name[:64]
-        ds.ClinicalTrialCoordinatingCenterName = self.config.coordinating_center
+        # Clinical Trial Module; copy the template elements so no two results
+        # share them, and deep-copy sequences, whose items are mutable
+        ds = pydicom.Dataset({
+            tag: copy.deepcopy(elem) if elem.VR == 'SQ' else copy.copy(elem)
+            for tag, elem in self._clinical_trial_elements.items()
+        })
         ds.ClinicalTrialSubjectID = patient_data.patient_id
-        ds.ClinicalTrialSiteID = self.config.site_id
-        ds.ClinicalTrialSiteName = self.config.site_name
 
         # Admitting Diagnosis (if available)
         if patient_data.diagnosis_meaning:
@@ -374,6 +449,20 @@ class WSIMetadataHandler:
             if age_str:
                 ds.PatientAge = age_str
 
+        return ds
+
+    def _build_clinical_trial_template(self) -> pydicom.Dataset:
+        """Build the Clinical Trial attributes that depend only on the config."""
+        ds = pydicom.Dataset()
+
+        # Clinical Trial Module
+        ds.ClinicalTrialSponsorName = self._sponsor_name_64
+        ds.ClinicalTrialProtocolID = self.config.protocol_id
+        ds.ClinicalTrialProtocolName = self._protocol_name_64
+        ds.ClinicalTrialCoordinatingCenterName = self.config.coordinating_center
+        ds.ClinicalTrialSiteID = self.config.site_id
+        ds.ClinicalTrialSiteName = self.config.site_name
+
         # Other Clinical Trial Protocol IDs (DOI)
         if self.config.doi_protocol_id:
             other_protocol = pydicom.Dataset()
@@ -391,70 +480,121 @@ class WSIMetadataHandler:
         """Build SlideSample objects for each sample on the slide."""
         slide_samples = []
 
-        for sample_data in slide_data.samples:
-            # Get or create specimen UID
-            specimen_uid = self.uid_manager.get_or_create_specimen_uid(sample_data.sample_id)
-
-            # Map anatomy to SNOMED code
-            anatomy_codes = []
-            if sample_data.anatomic_site and sample_data.anatomic_site not in ("Not Reported", "Invalid value"):
-                anatomy_code = self.specimen_builder.build_anatomy_code(sample_data.anatomic_site)
-                if anatomy_code:
-                    anatomy_codes.append(anatomy_code)
+        # Samples cut from the same block share fixation, staining, tumor
+        # status and site, so their anatomy codes, preparation steps and
+        # short description are built once per distinct combination
+        shared_parts = {}
 
-            # Build specimen with preparation steps
-            specimen = self._build_specimen(sample_data)
+        specimen_uids = self._get_specimen_uids(
+            [sample_data.sample_id for sample_data in slide_data.samples]
+        )
 
-            # Build short description
-            short_desc = self.specimen_builder.build_short_description(
+        for sample_data, specimen_uid in zip(slide_data.samples, specimen_uids):
+            key = (
                 sample_data.fixation_method,
                 sample_data.staining_method,
-                sample_data.tumor_status
+                sample_data.tumor_status,
+                sample_data.anatomic_site,
             )
+            try:
+                anatomy_codes, steps, short_desc = shared_parts[key]
+            except KeyError:
+                anatomy_codes, steps, short_desc = shared_parts[key] = \
+                    self._build_sample_parts(sample_data)
+
+            # Build specimen with preparation steps
+            specimen = self._build_specimen(sample_data, steps)
 
             # Create SlideSample
             slide_sample = SlideSample(
                 identifier=sample_data.sample_id,
-                anatomical_sites=anatomy_codes if anatomy_codes else None,
+                anatomical_sites=list(anatomy_codes) if anatomy_codes else None,
                 sampled_from=specimen.sample() if specimen else None,
                 uid=UID(specimen_uid),
-                short_description=short_desc[:64] if short_desc else None
+                short_description=short_desc
             )
 
             slide_samples.append(slide_sample)
 
         return slide_samples
 
-    def _build_specimen(self, sample_data: SampleData) -> Optional[Specimen]:
-        """Build a Specimen object with fixation and embedding steps."""
+    def _build_sample_parts(
+        self,
+        sample_data: SampleData
+    ) -> Tuple[List[Code], list, Optional[str]]:
+        """Build the anatomy codes, preparation steps and short description of a sample."""
+        # Map anatomy to SNOMED code
+        anatomy_codes = []
+        anatomic_site = sample_data.anatomic_site
+        if anatomic_site and anatomic_site not in UNREPORTED_ANATOMIC_SITES:
+            try:
+                anatomy_code = self._anatomy_codes[anatomic_site]
+            except KeyError:
+                anatomy_code = self.specimen_builder.build_anatomy_code(anatomic_site)
+                self._anatomy_codes[anatomic_site] = anatomy_code
+            if anatomy_code:
+                anatomy_codes.append(anatomy_code)
+
+        steps = self._build_preparation_steps(sample_data.fixation_method)
+
+        # Build short description
+        short_desc = self.specimen_builder.build_short_description(
+            sample_data.fixation_method,
+            sample_data.staining_method,
+            sample_data.tumor_status
+        )
+
+        return anatomy_codes, steps, short_desc[:64] if short_desc else None
+
+    def _get_specimen_uids(self, sample_ids: List[str]) -> List[str]:
+        """Get or create the specimen UIDs for samples, memoized per handler."""
+        cache = self._specimen_uid_cache
+        missing = [sample_id for sample_id in sample_ids if sample_id not in cache]
+        if missing:
+            cache.update(zip(missing, self.uid_manager.get_or_create_specimen_uids(missing)))
+        return [cache[sample_id] for sample_id in sample_ids]
+
+    def _get_study_uid(self, patient_id: str) -> str:
+        """Get or create the study UID for a patient, memoized per handler."""
+        try:
+            return self._study_uid_cache[patient_id]
+        except KeyError:
+            uid = self._study_uid_cache[patient_id] = \
+                self.uid_manager.get_or_create_study_uid(patient_id)
+            return uid
+
+    def _build_preparation_steps(self, fixation_method: Optional[str]) -> list:
+        """Build the fixation and embedding steps for a fixation method."""
         steps = []
+        if not fixation_method:
+            return steps
+
+        fixative, medium = _PREP_CODES.get(fixation_method.casefold(), (None, None))
 
         # Add fixation step if applicable
-        fixation_type = self.specimen_builder.get_fixation_type_for_wsidicom(
-            sample_data.fixation_method
-        )
-        if fixation_type:
-            try:
-                fixation = Fixation(fixative=SpecimenFixativesCode(fixation_type))
-                steps.append(fixation)
-            except (ValueError, KeyError):
-                pass  # Fixation type not in CID 8114
+        if fixative is not None:
+            steps.append(Fixation(fixative=fixative))
 
         # Add embedding step if applicable
-        embedding_type = self.specimen_builder.get_embedding_type_for_wsidicom(
-            sample_data.fixation_method
-        )
-        if embedding_type:
-            try:
-                embedding = Embedding(medium=SpecimenEmbeddingMediaCode(embedding_type))
-                steps.append(embedding)
-            except (ValueError, KeyError):
-                pass  # Embedding type not in CID 8115
+        if medium is not None:
+            steps.append(Embedding(medium=medium))
+
+        return steps
+
+    def _build_specimen(
+        self,
+        sample_data: SampleData,
+        steps: Optional[list] = None
+    ) -> Optional[Specimen]:
+        """Build a Specimen object with fixation and embedding steps."""
+        if steps is None:
+            steps = self._build_preparation_steps(sample_data.fixation_method)
 
         if steps:
+            # Each specimen gets its own list; the step objects are shared
             return Specimen(
                 identifier=sample_data.sample_id,
-                steps=steps
+                steps=list(steps)
             )
 
         return Specimen(identifier=sample_data.sample_id)
@@ -462,22 +602,21 @@ class WSIMetadataHandler:
     def _build_stainings(self, samples: List[SampleData]) -> Optional[List[Staining]]:
         """Build Staining objects from sample staining methods."""
         stainings = []
-        seen_methods = set()
-
-        for sample in samples:
-            if sample.staining_method and sample.staining_method not in seen_methods:
-                seen_methods.add(sample.staining_method)
-
-                substances = self.specimen_builder.get_staining_substances_for_wsidicom(
-                    sample.staining_method
-                )
-                if substances:
-                    try:
-                        stain_codes = [SpecimenStainsCode(s) for s in substances]
-                        stainings.append(Staining(substances=stain_codes))
-                    except (ValueError, KeyError):
-                        # Fall back to string description
-                        stainings.append(Staining(substances=sample.staining_method))
+
+        # Unique staining methods in sample order
+        unique_methods = dict.fromkeys(
+            sample.staining_method for sample in samples if sample.staining_method
+        )
+
+        for method in unique_methods:
+            substances = self.specimen_builder.get_staining_substances_for_wsidicom(method)
+            if substances:
+                stain_codes = [_stain_code(s) for s in substances]
+                if all(code is not None for code in stain_codes):
+                    stainings.append(Staining(substances=stain_codes))
+                else:
+                    # Fall back to string description
+                    stainings.append(Staining(substances=method))
 
         return stainings if stainings else None
 
@@ -494,7 +633,9 @@ class WSIMetadataHandler:
 
         return " ".join(parts) if parts else "Histopathology"
 
-    def _map_sex(self, sex_at_birth: Optional[str]) -> Optional[PatientSex]:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _map_sex(sex_at_birth: Optional[str]) -> Optional[PatientSex]:
         """Map CSV sex value to DICOM PatientSex enum."""
         if not sex_at_birth:
             return None
@@ -510,7 +651,9 @@ class WSIMetadataHandler:
 
         return None
 
-    def _format_dicom_age(self, age_in_days: int) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _format_dicom_age(age_in_days: int) -> Optional[str]:
         """
         Format age in days to DICOM age string (nnnD, nnnM, or nnnY).
 
@@ -545,7 +688,9 @@ class WSIMetadataHandler:
 
         return None
 
-    def _extract_slide_id(self, filename: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_slide_id(filename: str) -> str:
         """
         Extract slide ID from filename.
 
@@ -560,10 +705,5 @@ class WSIMetadataHandler:
             Slide ID (e.g., "0DWWQ6")
         """
         # Remove common extensions
-        base = filename
-        for ext in ['.svs', '.dcm', '.tiff', '.tif', '.ndpi', '.scn', '.mrxs']:
-            if base.lower().endswith(ext):
-                base = base[:-len(ext)]
-                break
-
-        return base
+        base, dot, ext = filename.rpartition('.')
+        return base if dot and ext.casefold() in _SLIDE_EXTENSIONS else filename
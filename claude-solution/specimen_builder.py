@@ -5,7 +5,8 @@ Constructs wsidicom Specimen and preparation step objects
 from CSV metadata.
 """
 
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Dict, Optional, List, Tuple
 from pydicom.sr.coding import Code
 
 try:
@@ -14,6 +15,51 @@ except ImportError:
     from code_mapper import DicomCodeMapper, CodedConcept
 
 
+# CSV method -> wsidicom meaning tables, keyed by casefolded method
+
+# Map to CID 8114 meanings
+_FIXATION_LUT = MappingProxyType({
+    key.casefold(): value for key, value in {
+        "FFPE": "Neutral Buffered Formalin",
+        "Formalin fixed paraffin embedded (FFPE)": "Neutral Buffered Formalin",
+        "Formalin-Fixed Paraffin-Embedded": "Neutral Buffered Formalin",
+        "Formalin": "Formalin",
+        "10% Neutral Buffered Formalin": "Neutral Buffered Formalin",
+        "OCT": None,  # OCT is a freezing medium, not a fixative
+        "Optimal Cutting Temperature": None,
+        "Frozen": None,
+    }.items()
+})
+
+# Map to CID 8115 meanings
+_EMBEDDING_LUT = MappingProxyType({
+    key.casefold(): value for key, value in {
+        "FFPE": "Paraffin wax",
+        "Formalin fixed paraffin embedded (FFPE)": "Paraffin wax",
+        "Formalin-Fixed Paraffin-Embedded": "Paraffin wax",
+        "Paraffin": "Paraffin wax",
+        "OCT": "OCT medium",
+        "Optimal Cutting Temperature": "OCT medium",
+    }.items()
+})
+
+# Both preparation types per method: (CID 8114 fixative, CID 8115 embedding)
+PREP_TYPES_BY_METHOD = MappingProxyType({
+    key: (_FIXATION_LUT.get(key), _EMBEDDING_LUT.get(key))
+    for key in _FIXATION_LUT.keys() | _EMBEDDING_LUT.keys()
+})
+
+# Map to CID 8112 meanings
+_HE_SUBSTANCES = ("hematoxylin stain", "water soluble eosin stain")
+_STAINING_LUT = MappingProxyType({
+    key.casefold(): value for key, value in {
+        "H&E": _HE_SUBSTANCES,
+        "Hematoxylin and Eosin Staining Method": _HE_SUBSTANCES,
+        "HE": _HE_SUBSTANCES,
+    }.items()
+})
+
+
 class SpecimenMetadataBuilder:
     """
     Builds specimen preparation metadata for wsidicom.
@@ -35,6 +81,9 @@ class SpecimenMetadataBuilder:
             Code mapper for translating metadata values to DICOM codes
         """
         self.code_mapper = code_mapper
+        self._short_description_cache: Dict[
+            Tuple[Optional[str], Optional[str], Optional[str]], str
+        ] = {}
 
     def build_fixation_code(self, fixation_method: Optional[str]) -> Optional[Code]:
         """
@@ -167,6 +216,12 @@ class SpecimenMetadataBuilder:
         str
             Short description (max 64 characters per DICOM spec)
         """
+        key = (fixation_method, staining_method, tumor_status)
+        try:
+            return self._short_description_cache[key]
+        except KeyError:
+            pass
+
         parts = []
 
         # Fixation abbreviation
@@ -192,7 +247,9 @@ class SpecimenMetadataBuilder:
         description = " ".join(parts)
 
         # Ensure max 64 characters
-        return description[:64] if description else ""
+        description = description[:64] if description else ""
+        self._short_description_cache[key] = description
+        return description
 
     def get_fixation_type_for_wsidicom(self, fixation_method: Optional[str]) -> Optional[str]:
         """
@@ -211,22 +268,7 @@ class SpecimenMetadataBuilder:
         str or None
             Fixation type meaning for SpecimenFixativesCode
         """
-        if not fixation_method:
-            return None
-
-        # Map to CID 8114 meanings
-        fixation_mappings = {
-            "FFPE": "Neutral Buffered Formalin",
-            "Formalin fixed paraffin embedded (FFPE)": "Neutral Buffered Formalin",
-            "Formalin-Fixed Paraffin-Embedded": "Neutral Buffered Formalin",
-            "Formalin": "Formalin",
-            "10% Neutral Buffered Formalin": "Neutral Buffered Formalin",
-            "OCT": None,  # OCT is a freezing medium, not a fixative
-            "Optimal Cutting Temperature": None,
-            "Frozen": None,
-        }
-
-        return fixation_mappings.get(fixation_method)
+        return _FIXATION_LUT.get(fixation_method.casefold()) if fixation_method else None
 
     def get_embedding_type_for_wsidicom(self, fixation_method: Optional[str]) -> Optional[str]:
         """
@@ -245,20 +287,7 @@ class SpecimenMetadataBuilder:
         str or None
             Embedding type meaning for SpecimenEmbeddingMediaCode
         """
-        if not fixation_method:
-            return None
-
-        # Map to CID 8115 meanings
-        embedding_mappings = {
-            "FFPE": "Paraffin wax",
-            "Formalin fixed paraffin embedded (FFPE)": "Paraffin wax",
-            "Formalin-Fixed Paraffin-Embedded": "Paraffin wax",
-            "Paraffin": "Paraffin wax",
-            "OCT": "OCT medium",
-            "Optimal Cutting Temperature": "OCT medium",
-        }
-
-        return embedding_mappings.get(fixation_method)
+        return _EMBEDDING_LUT.get(fixation_method.casefold()) if fixation_method else None
 
     def get_staining_substances_for_wsidicom(
         self,
@@ -283,14 +312,8 @@ class SpecimenMetadataBuilder:
         if not staining_method:
             return None
 
-        # Map to CID 8112 meanings
-        staining_mappings = {
-            "H&E": ["hematoxylin stain", "water soluble eosin stain"],
-            "Hematoxylin and Eosin Staining Method": ["hematoxylin stain", "water soluble eosin stain"],
-            "HE": ["hematoxylin stain", "water soluble eosin stain"],
-        }
-
-        return staining_mappings.get(staining_method)
+        substances = _STAINING_LUT.get(staining_method.casefold())
+        return list(substances) if substances else None
 
     def coded_concept_to_code(self, concept: CodedConcept) -> Code:
         """
@@ -6,11 +6,131 @@ to ensure consistency across conversion runs and multiple series per study.
 """
 
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+import atexit
 import csv
-import uuid
+import importlib.util
+import os
+import sqlite3
+import sys
+import weakref
 from datetime import datetime
 
+# Map files larger than this are parsed with pyarrow's multithreaded reader
+# when it is installed
+_ARROW_MIN_SIZE = 64 * 1024
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def _as_path(path) -> Path:
+    """Return ``path`` as a Path, reusing it if it already is one."""
+    return path if isinstance(path, Path) else Path(path)
+
+
+# Managers holding rows not yet written; weak so they can still be collected
+_pending_managers: "weakref.WeakSet[UIDMappingManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_pending_managers() -> None:
+    """Write the pending rows of managers that were not closed before exit."""
+    for manager in list(_pending_managers):
+        manager.close()
+
+
+class SqliteUIDStore:
+    """
+    SQLite backing store for identifier -> UID mappings.
+
+    Keeps the specimen, study UID and study datetime maps as tables of a
+    single database file, so existing mappings are looked up by key
+    instead of being loaded into memory.
+
+    Attributes
+    ----------
+    path : Path
+        SQLite database file
+    """
+
+    TABLES = ('specimen_map', 'study_map', 'study_datetime_map')
+
+    def __init__(self, path: Path):
+        """
+        Open (and create if needed) the mapping database.
+
+        Parameters
+        ----------
+        path : Path
+            SQLite database file
+        """
+        self.path = _as_path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        with self._connection() as conn:
+            for table in self.TABLES:
+                conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table}"
+                    "(k TEXT PRIMARY KEY, v TEXT) WITHOUT ROWID"
+                )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection for this process, reconnecting after a fork."""
+        if self._pid != os.getpid():
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, table: str, key: str) -> Optional[str]:
+        """
+        Get the value mapped to a key.
+
+        Parameters
+        ----------
+        table : str
+            One of ``TABLES``
+        key : str
+            Identifier to look up
+
+        Returns
+        -------
+        str or None
+            Mapped value or None if not found
+        """
+        row = self._connection().execute(
+            f"SELECT v FROM {table} WHERE k = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, table: str, pairs: Iterable[Tuple[str, str]]) -> None:
+        """
+        Store key-value pairs in one transaction, keeping existing keys.
+
+        Parameters
+        ----------
+        table : str
+            One of ``TABLES``
+        pairs : Iterable[Tuple[str, str]]
+            (key, value) pairs to store
+        """
+        with self._connection() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO {table} (k, v) VALUES (?, ?)", pairs
+            )
+
+    def count(self, table: str) -> int:
+        """Number of mappings in a table."""
+        return self._connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+        self._pid = None
+
 
 class UIDMappingManager:
     """
@@ -31,15 +151,34 @@ class UIDMappingManager:
         CSV file for study_id -> StudyInstanceUID mapping
     study_datetime_map_file : Path, optional
         CSV file for study_id -> datetime mapping
+
+    When a ``db_path`` is given, mappings are kept in a ``SqliteUIDStore``
+    instead of the CSV files, which are only read once to seed a new
+    database.
+
+    Notes
+    -----
+    Identifiers are stored stripped of surrounding whitespace and interned,
+    as they are short IDs that are looked up repeatedly. Lookups try the
+    identifier as given first and only strip it on a miss.
+
+    New mappings are buffered and appended to the CSV files in batches.
+    Call ``flush()`` (or use the manager as a context manager) before
+    other processes read the mapping files; pending rows of managers
+    still alive at interpreter exit are also written. The CSV files stay
+    open for appending until ``close()``.
     """
 
     UID_PREFIX = "2.25"  # UUID-derived OID prefix per ISO/IEC 9834-8
+    _UID_PREFIX_DOT = UID_PREFIX + "."
+    FLUSH_THRESHOLD = 256  # Pending rows per file before an automatic flush
 
     def __init__(
         self,
         specimen_map_file: Path,
         study_uid_map_file: Path,
-        study_datetime_map_file: Optional[Path] = None
+        study_datetime_map_file: Optional[Path] = None,
+        db_path: Optional[Path] = None
     ):
         """
         Initialize the UID mapping manager.
@@ -52,25 +191,107 @@ class UIDMappingManager:
             CSV file for study_id -> StudyInstanceUID mapping
         study_datetime_map_file : Path, optional
             CSV file for study_id -> datetime mapping
+        db_path : Path, optional
+            SQLite database to store the mappings in instead of the CSV
+            files. A new database is seeded from the CSV files.
         """
-        self.specimen_map_file = Path(specimen_map_file)
-        self.study_uid_map_file = Path(study_uid_map_file)
-        self.study_datetime_map_file = Path(study_datetime_map_file) if study_datetime_map_file else None
+        self.specimen_map_file = _as_path(specimen_map_file)
+        self.study_uid_map_file = _as_path(study_uid_map_file)
+        self.study_datetime_map_file = _as_path(study_datetime_map_file) if study_datetime_map_file else None
 
         # In-memory caches
         self._specimen_cache: Dict[str, str] = {}
         self._study_uid_cache: Dict[str, str] = {}
         self._study_datetime_cache: Dict[str, str] = {}
+        self._datetime_loaded = False
+
+        self._store: Optional[SqliteUIDStore] = None
+        if db_path is not None:
+            is_new = not os.path.exists(db_path)
+            self._store = SqliteUIDStore(db_path)
+            if is_new:
+                self.migrate_from_csv()
+        else:
+            # Map file directories are created once; they must not be removed mid-run
+            for map_file in (self.specimen_map_file, self.study_uid_map_file,
+                             self.study_datetime_map_file):
+                if map_file is not None:
+                    map_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Append handles of the CSV map files, opened on first write
+        self._handles: Dict[Path, TextIO] = {}
+
+        # Rows not yet appended to the CSV files or database
+        self._pending_specimen: List[Tuple[str, str]] = []
+        self._pending_study: List[Tuple[str, str]] = []
+        self._pending_datetime: List[Tuple[str, str]] = []
 
         # Load existing mappings
         self._load_mappings()
 
+    def __enter__(self) -> "UIDMappingManager":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Write pending mappings and close the open map files.
+
+        The manager stays usable; files are reopened on the next write.
+        """
+        _pending_managers.discard(self)
+        self.flush()
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+        if self._store is not None:
+            self._store.close()
+
     def _load_mappings(self) -> None:
-        """Load existing mappings from CSV files into memory caches."""
+        """
+        Load existing UID mappings from CSV files into memory caches.
+
+        The study datetime map is loaded on first use by
+        ``_ensure_datetime_loaded()``. With a database the caches start
+        empty and are filled by lookups.
+        """
+        if self._store is not None:
+            self._specimen_cache = {}
+            self._study_uid_cache = {}
+            self._study_datetime_cache = {}
+            self._datetime_loaded = True
+            return
         self._specimen_cache = self._load_csv_map(self.specimen_map_file)
         self._study_uid_cache = self._load_csv_map(self.study_uid_map_file)
-        if self.study_datetime_map_file:
+        self._study_datetime_cache = {}
+        self._datetime_loaded = False
+
+    def migrate_from_csv(self) -> None:
+        """Copy the mappings in the CSV files into the database."""
+        for filepath, table in (
+            (self.specimen_map_file, 'specimen_map'),
+            (self.study_uid_map_file, 'study_map'),
+            (self.study_datetime_map_file, 'study_datetime_map'),
+        ):
+            if filepath is not None:
+                self._store.put_many(table, self._load_csv_map(filepath).items())
+
+    def _lookup(self, cache: Dict[str, str], table: str, key: str) -> Optional[str]:
+        """Look up a stripped key in a cache, falling back to the database."""
+        value = cache.get(key)
+        if value is None and self._store is not None:
+            value = self._store.get(table, key)
+            if value is not None:
+                cache[key] = value
+        return value
+
+    def _ensure_datetime_loaded(self) -> None:
+        """Load the study datetime map if it has not been loaded yet."""
+        if not self._datetime_loaded:
             self._study_datetime_cache = self._load_csv_map(self.study_datetime_map_file)
+            self._datetime_loaded = True
 
     def _load_csv_map(self, filepath: Path) -> Dict[str, str]:
         """
@@ -87,33 +308,116 @@ class UIDMappingManager:
             Dictionary mapping first column to second column
         """
         mapping = {}
-        if filepath.exists():
-            with open(filepath, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2 and row[0].strip():
-                        mapping[row[0].strip()] = row[1].strip()
-        return mapping
+        if not filepath.exists():
+            return mapping
+
+        if _HAS_PYARROW and filepath.stat().st_size > _ARROW_MIN_SIZE:
+            arrow_mapping = self._load_csv_map_arrow(filepath)
+            if arrow_mapping is not None:
+                return arrow_mapping
+
+        data = filepath.read_text(encoding='utf-8')
+
+        # Quoted fields need the full CSV parser
+        if '"' in data:
+            for row in csv.reader(data.splitlines()):
+                if len(row) >= 2 and row[0].strip():
+                    mapping[sys.intern(row[0].strip())] = row[1].strip()
+            return mapping
+
+        # Keys are stripped before rows with an empty key are dropped
+        rows = (line.partition(',') for line in data.splitlines())
+        return {
+            key: value
+            for key, value in (
+                (sys.intern(key.strip()), rest.partition(',')[0].strip())
+                for key, sep, rest in rows if sep
+            )
+            if key
+        }
+
+    @staticmethod
+    def _load_csv_map_arrow(filepath: Path) -> Optional[Dict[str, str]]:
+        """
+        Load a two-column CSV into a dictionary using pyarrow.
 
-    def _save_to_csv(self, filepath: Path, key: str, value: str) -> None:
+        Parameters
+        ----------
+        filepath : Path
+            Path to the CSV file
+
+        Returns
+        -------
+        Dict[str, str] or None
+            Dictionary mapping first column to second column, or None if
+            pyarrow cannot parse the file (e.g. ragged rows)
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pa_csv
+
+        try:
+            table = pa_csv.read_csv(
+                filepath,
+                read_options=pa_csv.ReadOptions(autogenerate_column_names=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={'f0': pa.string(), 'f1': pa.string()},
+                    strings_can_be_null=False
+                )
+            )
+        except pa.ArrowInvalid:
+            return None
+        if table.num_columns < 2:
+            return None
+
+        keys = pc.utf8_trim_whitespace(table.column(0)).to_pylist()
+        values = pc.utf8_trim_whitespace(table.column(1)).to_pylist()
+        return {sys.intern(key): value for key, value in zip(keys, values) if key}
+
+    def _save_to_csv(self, filepath: Path, rows: List[Tuple[str, str]]) -> None:
         """
-        Append a key-value pair to a CSV file.
+        Append key-value rows to a CSV file.
 
-        Creates parent directories if they don't exist.
+        The file is kept open for appending until ``close()``, and is
+        flushed after every batch. The parent directory is created by
+        ``__init__``.
 
         Parameters
         ----------
         filepath : Path
             Path to the CSV file
-        key : str
-            Key (first column)
-        value : str
-            Value (second column)
+        rows : List[Tuple[str, str]]
+            (key, value) rows to append
         """
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([key, value])
+        try:
+            handle = self._handles[filepath]
+        except KeyError:
+            handle = self._handles[filepath] = open(
+                filepath, 'a', newline='', encoding='utf-8', buffering=8192
+            )
+        csv.writer(handle).writerows(rows)
+        handle.flush()
+
+    def _queue(self, pending: List[Tuple[str, str]], key: str, value: str) -> None:
+        """Buffer a new mapping row, flushing once the buffer is full."""
+        pending.append((key, value))
+        _pending_managers.add(self)
+        if len(pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append all pending mappings to their CSV files or the database."""
+        for filepath, table, pending in (
+            (self.specimen_map_file, 'specimen_map', self._pending_specimen),
+            (self.study_uid_map_file, 'study_map', self._pending_study),
+            (self.study_datetime_map_file, 'study_datetime_map', self._pending_datetime),
+        ):
+            if pending:
+                if self._store is not None:
+                    self._store.put_many(table, pending)
+                else:
+                    self._save_to_csv(filepath, pending)
+                pending.clear()
 
     def generate_new_uid(self) -> str:
         """
@@ -128,8 +432,8 @@ class UIDMappingManager:
         str
             New UID in format "2.25.{uuid_as_integer}"
         """
-        uuid_int = uuid.uuid4().int
-        return f"{self.UID_PREFIX}.{uuid_int}"
+        # uuid.uuid4() draws from os.urandom too; skip building the UUID object
+        return self._UID_PREFIX_DOT + str(int.from_bytes(os.urandom(16), 'big'))
 
     def get_or_create_specimen_uid(self, specimen_id: str) -> str:
         """
@@ -148,17 +452,63 @@ class UIDMappingManager:
         str
             DICOM UID for the specimen
         """
-        specimen_id = specimen_id.strip()
-
-        if specimen_id in self._specimen_cache:
+        try:
             return self._specimen_cache[specimen_id]
+        except KeyError:
+            specimen_id = sys.intern(specimen_id.strip())
+
+        existing = self._lookup(self._specimen_cache, 'specimen_map', specimen_id)
+        if existing is not None:
+            return existing
 
         uid = self.generate_new_uid()
         self._specimen_cache[specimen_id] = uid
-        self._save_to_csv(self.specimen_map_file, specimen_id, uid)
+        self._queue(self._pending_specimen, specimen_id, uid)
 
         return uid
 
+    def get_or_create_specimen_uids(self, specimen_ids: Iterable[str]) -> List[str]:
+        """
+        Get existing or create new UIDs for several specimen identifiers.
+
+        Equivalent to calling ``get_or_create_specimen_uid`` for each
+        identifier, but draws the random bits for all new UIDs at once and
+        queues their mappings together.
+
+        Parameters
+        ----------
+        specimen_ids : Iterable[str]
+            Specimen/sample identifiers
+
+        Returns
+        -------
+        List[str]
+            DICOM UIDs for the specimens, in the order given
+        """
+        cache = self._specimen_cache
+        specimen_ids = [
+            specimen_id if specimen_id in cache else sys.intern(specimen_id.strip())
+            for specimen_id in specimen_ids
+        ]
+        needed = [
+            specimen_id for specimen_id in dict.fromkeys(specimen_ids)
+            if self._lookup(cache, 'specimen_map', specimen_id) is None
+        ]
+
+        if needed:
+            random_bytes = os.urandom(16 * len(needed))
+            for index, specimen_id in enumerate(needed):
+                uid = self._UID_PREFIX_DOT + str(
+                    int.from_bytes(random_bytes[16 * index:16 * (index + 1)], 'big')
+                )
+                cache[specimen_id] = uid
+                self._pending_specimen.append((specimen_id, uid))
+            _pending_managers.add(self)
+            if len(self._pending_specimen) >= self.FLUSH_THRESHOLD:
+                self.flush()
+
+        return [cache[specimen_id] for specimen_id in specimen_ids]
+
     def get_or_create_study_uid(self, study_id: str) -> str:
         """
         Get existing or create new StudyInstanceUID for study identifier.
@@ -176,14 +526,18 @@ class UIDMappingManager:
         str
             DICOM StudyInstanceUID
         """
-        study_id = study_id.strip()
-
-        if study_id in self._study_uid_cache:
+        try:
             return self._study_uid_cache[study_id]
+        except KeyError:
+            study_id = sys.intern(study_id.strip())
+
+        existing = self._lookup(self._study_uid_cache, 'study_map', study_id)
+        if existing is not None:
+            return existing
 
         uid = self.generate_new_uid()
         self._study_uid_cache[study_id] = uid
-        self._save_to_csv(self.study_uid_map_file, study_id, uid)
+        self._queue(self._pending_study, study_id, uid)
 
         return uid
 
@@ -210,20 +564,25 @@ class UIDMappingManager:
         str or None
             Study datetime string in DICOM format
         """
-        if not self.study_datetime_map_file:
+        if self._store is None and not self.study_datetime_map_file:
             return datetime_str
 
-        study_id = study_id.strip()
-
-        if study_id in self._study_datetime_cache:
+        self._ensure_datetime_loaded()
+        try:
             return self._study_datetime_cache[study_id]
+        except KeyError:
+            study_id = sys.intern(study_id.strip())
+
+        existing = self._lookup(self._study_datetime_cache, 'study_datetime_map', study_id)
+        if existing is not None:
+            return existing
 
         # If no datetime provided, use current datetime
         if not datetime_str:
             datetime_str = datetime.now().strftime("%Y%m%d%H%M%S")
 
         self._study_datetime_cache[study_id] = datetime_str
-        self._save_to_csv(self.study_datetime_map_file, study_id, datetime_str)
+        self._queue(self._pending_datetime, study_id, datetime_str)
 
         return datetime_str
 
@@ -241,7 +600,7 @@ class UIDMappingManager:
         bool
             True if mapping exists
         """
-        return specimen_id.strip() in self._specimen_cache
+        return self.get_specimen_uid(specimen_id) is not None
 
     def has_study_uid(self, study_id: str) -> bool:
         """
@@ -257,7 +616,7 @@ class UIDMappingManager:
         bool
             True if mapping exists
         """
-        return study_id.strip() in self._study_uid_cache
+        return self.get_study_uid(study_id) is not None
 
     def get_specimen_uid(self, specimen_id: str) -> Optional[str]:
         """
@@ -273,7 +632,10 @@ class UIDMappingManager:
         str or None
             Existing UID or None if not found
         """
-        return self._specimen_cache.get(specimen_id.strip())
+        return (
+            self._specimen_cache.get(specimen_id)
+            or self._lookup(self._specimen_cache, 'specimen_map', specimen_id.strip())
+        )
 
     def get_study_uid(self, study_id: str) -> Optional[str]:
         """
@@ -289,18 +651,28 @@ class UIDMappingManager:
         str or None
             Existing UID or None if not found
         """
-        return self._study_uid_cache.get(study_id.strip())
+        return (
+            self._study_uid_cache.get(study_id)
+            or self._lookup(self._study_uid_cache, 'study_map', study_id.strip())
+        )
 
     def reload(self) -> None:
-        """Reload mappings from CSV files."""
+        """Reload mappings from their backing store, writing pending mappings first."""
+        self.flush()
         self._load_mappings()
 
     @property
     def specimen_count(self) -> int:
         """Number of specimen mappings."""
+        if self._store is not None:
+            self.flush()
+            return self._store.count('specimen_map')
         return len(self._specimen_cache)
 
     @property
     def study_count(self) -> int:
         """Number of study mappings."""
+        if self._store is not None:
+            self.flush()
+            return self._store.count('study_map')
         return len(self._study_uid_cache)
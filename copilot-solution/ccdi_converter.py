@@ -5,85 +5,146 @@ Provides a class-based interface for converting WSI files to DICOM with CCDI met
 supporting both single conversions and batch processing with aggregate statistics.
 """
 
+import array
+import collections
+import functools
+import gc
+import logging
+import os
 import time
 import shutil
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Literal
-import tifffile
-from wsidicomizer import WsiDicomizer
-from wsidicomizer.sources import TiffSlideSource
-from wsidicom.codec.settings import Jpeg2kSettings
-from wsidicom.codec.encoder import Jpeg2kEncoder
-from pydicom.uid import JPEG2000, UID
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Tuple, Union, Literal
 
 try:
     from .ccdi_loader import CCDIMetadataLoader
-    from .metadata_builder import MetadataBuilder
     from .uid_registry import UIDRegistry
-    from .tiff_datetime import extract_scan_datetime
+    from .tiff_datetime import extract_scan_datetime_from_tiff
 except ImportError:
     from ccdi_loader import CCDIMetadataLoader
-    from metadata_builder import MetadataBuilder
     from uid_registry import UIDRegistry
-    from tiff_datetime import extract_scan_datetime
+    from tiff_datetime import extract_scan_datetime_from_tiff
+
+# tifffile, wsidicomizer, wsidicom and pydicom are imported where they are
+# used, so importing this module (e.g. to read statistics) stays fast
+if TYPE_CHECKING:
+    import tifffile
+    from wsidicom.codec.encoder import Jpeg2kEncoder
+    from metadata_builder import MetadataBuilder
+
+
+# Progress output; command-line entry points attach a handler, set this
+# logger to WARNING to silence it
+logger = logging.getLogger("ccdi")
+logger.addHandler(logging.NullHandler())
 
 
 # Conversion Configuration
 DEFAULT_TILE_SIZE = None  # Use native tile size by default
 DEFAULT_WORKERS = 8
 DEFAULT_ENCODING = None  # Use native encoding by default
+DEFAULT_BACKEND = "tiffslide"  # Source used to read the input WSI
+GC_INTERVAL = 32  # Slides between garbage collections in serial batches
+TRACEBACK_BUFFER_SIZE = 20  # Most recent failure tracebacks kept for dump_tracebacks
 
 # Type alias for encoding specification
-EncodingSpec = Union[None, Literal["native", "jpeg2k-lossless", "jpeg2k-lossy"], Jpeg2kEncoder]
+EncodingSpec = Union[None, Literal["native", "jpeg2k-lossless", "jpeg2k-lossy"], "Jpeg2kEncoder"]
 
+# TIFF compression codes of JPEG 2000 encoded sources (Aperio YCbCr/lossy/RGB, generic)
+_JPEG2000_COMPRESSIONS = frozenset({33003, 33004, 33005, 34712})
 
-class Jpeg2kLosslessEncoder(Jpeg2kEncoder):
-    """JPEG 2000 lossless encoder."""
-    
-    def __init__(self):
-        settings = Jpeg2kSettings(levels=[0])
-        super().__init__(settings)
-    
-    @property
-    def lossy(self) -> bool:
-        return False
-    
-    @property
-    def transfer_syntax(self) -> UID:
-        return JPEG2000
-    
-    @property
-    def photometric_interpretation(self) -> str:
-        return "YBR_ICT"
+# Source backends and their wsidicomizer source class names
+Backend = Literal["tiffslide", "cucim", "openslide"]
+_BACKEND_SOURCES = {
+    "tiffslide": "TiffSlideSource",
+    "cucim": "CuCIMSource",
+    "openslide": "OpenSlideSource",
+}
 
 
-class Jpeg2kLossyEncoder(Jpeg2kEncoder):
-    """JPEG 2000 lossy encoder with configurable quality."""
+@functools.lru_cache(maxsize=None)
+def _encoder_classes() -> Tuple[type, type]:
+    """
+    Define the JPEG 2000 encoder classes on first use, importing wsidicom.
     
-    def __init__(self, compression_ratio: float = 10.0):
-        """
-        Args:
-            compression_ratio: Target compression ratio (higher = more compression, lower quality).
-                             Typical values: 5-20. Default: 10.
-        """
-        settings = Jpeg2kSettings(compression_ratio=compression_ratio)
-        super().__init__(settings)
-        self.compression_ratio = compression_ratio
+    Returns:
+        Tuple of (Jpeg2kLosslessEncoder, Jpeg2kLossyEncoder)
+    """
+    from wsidicom.codec.settings import Jpeg2kSettings
+    from wsidicom.codec.encoder import Jpeg2kEncoder
+    from pydicom.uid import JPEG2000, UID
     
-    @property
-    def lossy(self) -> bool:
-        return True
+    class Jpeg2kLosslessEncoder(Jpeg2kEncoder):
+        """JPEG 2000 lossless encoder."""
+        
+        def __init__(self):
+            settings = Jpeg2kSettings(levels=[0])
+            super().__init__(settings)
+        
+        @property
+        def lossy(self) -> bool:
+            return False
+        
+        @property
+        def transfer_syntax(self) -> UID:
+            return JPEG2000
+        
+        @property
+        def photometric_interpretation(self) -> str:
+            return "YBR_ICT"
     
-    @property
-    def transfer_syntax(self) -> UID:
-        return JPEG2000
+    class Jpeg2kLossyEncoder(Jpeg2kEncoder):
+        """JPEG 2000 lossy encoder with configurable quality."""
+        
+        def __init__(self, compression_ratio: float = 10.0):
+            """
+            Args:
+                compression_ratio: Target compression ratio (higher = more compression, lower quality).
+                                 Typical values: 5-20. Default: 10.
+            """
+            settings = Jpeg2kSettings(compression_ratio=compression_ratio)
+            super().__init__(settings)
+            self.compression_ratio = compression_ratio
+        
+        @property
+        def lossy(self) -> bool:
+            return True
+        
+        @property
+        def transfer_syntax(self) -> UID:
+            return JPEG2000
+        
+        @property
+        def photometric_interpretation(self) -> str:
+            return "YBR_ICT"
     
-    @property
-    def photometric_interpretation(self) -> str:
-        return "YBR_ICT"
+    # Module-level names, so instances pickle through __getattr__ below
+    Jpeg2kLosslessEncoder.__qualname__ = "Jpeg2kLosslessEncoder"
+    Jpeg2kLossyEncoder.__qualname__ = "Jpeg2kLossyEncoder"
+    return Jpeg2kLosslessEncoder, Jpeg2kLossyEncoder
+
+
+def __getattr__(name: str):
+    """Resolve the lazily defined encoder classes as module attributes."""
+    if name == "Jpeg2kLosslessEncoder":
+        return _encoder_classes()[0]
+    if name == "Jpeg2kLossyEncoder":
+        return _encoder_classes()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _is_encoder(encoding: EncodingSpec) -> bool:
+    """Check whether an encoding specification is an encoder instance."""
+    if encoding is None or isinstance(encoding, str):
+        return False
+    from wsidicom.codec.encoder import Jpeg2kEncoder
+    return isinstance(encoding, Jpeg2kEncoder)
 
 
-def create_encoder(encoding: EncodingSpec, compression_ratio: float = 10.0) -> Optional[Jpeg2kEncoder]:
+def create_encoder(encoding: EncodingSpec, compression_ratio: float = 10.0) -> Optional["Jpeg2kEncoder"]:
     """
     Create an encoder based on the encoding specification.
     
@@ -101,10 +162,10 @@ def create_encoder(encoding: EncodingSpec, compression_ratio: float = 10.0) -> O
     if encoding is None or encoding == "native":
         return None
     elif encoding == "jpeg2k-lossless":
-        return Jpeg2kLosslessEncoder()
+        return _encoder_classes()[0]()
     elif encoding == "jpeg2k-lossy":
-        return Jpeg2kLossyEncoder(compression_ratio=compression_ratio)
-    elif isinstance(encoding, Jpeg2kEncoder):
+        return _encoder_classes()[1](compression_ratio=compression_ratio)
+    elif _is_encoder(encoding):
         return encoding
     else:
         raise ValueError(
@@ -113,6 +174,39 @@ def create_encoder(encoding: EncodingSpec, compression_ratio: float = 10.0) -> O
         )
 
 
+@functools.lru_cache(maxsize=None)
+def get_source_class(backend: Backend) -> type:
+    """
+    Get the wsidicomizer source class for a backend.
+    
+    Sources other than TiffSlide are imported on first use. cuCIM needs a
+    CUDA GPU and a cuCIM-supported SVS/TIFF layout; if the source cannot be
+    imported, TiffSlide is used instead.
+    
+    Args:
+        backend: "tiffslide", "cucim" or "openslide"
+        
+    Returns:
+        Source class to pass as preferred_source
+    """
+    try:
+        class_name = _BACKEND_SOURCES[backend]
+    except KeyError:
+        raise ValueError(
+            f"Invalid backend: {backend}. Must be one of {', '.join(_BACKEND_SOURCES)}."
+        )
+    from wsidicomizer.sources import TiffSlideSource
+    if class_name == "TiffSlideSource":
+        return TiffSlideSource
+    
+    try:
+        import wsidicomizer.sources as sources
+        return getattr(sources, class_name)
+    except (ImportError, AttributeError) as e:
+        logger.warning("  %s backend unavailable (%s), using tiffslide", backend, e)
+        return TiffSlideSource
+
+
 def get_native_tile_size(filepath: Path) -> Optional[int]:
     """
     Extract native tile size from TIFF/SVS file.
@@ -123,30 +217,196 @@ def get_native_tile_size(filepath: Path) -> Optional[int]:
     Returns:
         Native tile width, or None if not tiled or cannot determine
     """
+    import tifffile
+    
     try:
         with tifffile.TiffFile(filepath) as tif:
-            page = tif.pages[0]  # Get first page (full resolution)
-            
-            # Check if image is tiled
-            if hasattr(page, 'is_tiled') and page.is_tiled:
-                tile_width = page.tilewidth
-                tile_height = page.tilelength
-                
-                # Most WSI use square tiles, verify
-                if tile_width == tile_height:
-                    return tile_width
-                else:
-                    print(f"  Warning: Non-square tiles ({tile_width}x{tile_height}), using width")
-                    return tile_width
-            else:
-                print(f"  Warning: Image is not tiled, no native tile size")
-                return None
+            return _native_tile_size_from_tiff(tif)
                 
     except Exception as e:
-        print(f"  Warning: Could not determine native tile size: {e}")
+        logger.warning("  Could not determine native tile size: %s", e)
         return None
 
 
+def _native_tile_size_from_tiff(tif: "tifffile.TiffFile") -> Optional[int]:
+    """
+    Extract native tile size from an open TIFF/SVS file.
+    
+    Args:
+        tif: Open TIFF/SVS file
+        
+    Returns:
+        Native tile width, or None if not tiled
+    """
+    page = tif.pages[0]  # Get first page (full resolution)
+    
+    # Check if image is tiled
+    if hasattr(page, 'is_tiled') and page.is_tiled:
+        tile_width = page.tilewidth
+        tile_height = page.tilelength
+        
+        # Most WSI use square tiles, verify
+        if tile_width == tile_height:
+            return tile_width
+        else:
+            logger.warning("  Non-square tiles (%sx%s), using width", tile_width, tile_height)
+            return tile_width
+    else:
+        logger.warning("  Image is not tiled, no native tile size")
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _probe_tiff(filepath: Path, mtime_ns: int, size: int) -> Tuple[Optional[int], Optional[int], Optional[datetime]]:
+    """
+    Read native tile size, compression and scan datetime with a single TIFF open.
+    
+    Cached per file path, modification time and size, so a rewritten file
+    is probed again.
+    
+    Args:
+        filepath: Path to TIFF/SVS file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Tuple of (native tile width or None, TIFF compression code of the
+        full resolution page, scan datetime or None)
+    """
+    import tifffile
+    
+    with tifffile.TiffFile(filepath) as tif:
+        tile_size = _native_tile_size_from_tiff(tif)
+        compression = int(tif.pages[0].compression)
+        # A malformed header date must not cost the tile size and compression
+        try:
+            scan_datetime = extract_scan_datetime_from_tiff(tif)
+        except Exception as e:
+            logger.warning("  Could not extract datetime from %s: %s", filepath, e)
+            scan_datetime = None
+    return tile_size, compression, scan_datetime
+
+
+def probe_tiff(filepath: Path) -> Tuple[Optional[int], Optional[int], Optional[datetime]]:
+    """
+    Get native tile size, compression and scan datetime of a TIFF/SVS file.
+    
+    Args:
+        filepath: Path to TIFF/SVS file
+        
+    Returns:
+        Tuple of (native tile width or None, TIFF compression code or None,
+        scan datetime or None)
+    """
+    try:
+        stat = filepath.stat()
+        return _probe_tiff(filepath, stat.st_mtime_ns, stat.st_size)
+    except Exception as e:
+        logger.warning("  Could not read TIFF header of %s: %s", filepath, e)
+        return None, None, None
+
+
+def _cap_workers(workers: int) -> int:
+    """
+    Limit the worker thread count to the available CPUs, keeping one core free.
+    
+    wsidicomizer and OpenJPEG both run their own thread pools, so more
+    workers than cores mostly adds context switching.
+    
+    Args:
+        workers: Requested number of worker threads
+        
+    Returns:
+        Number of worker threads to use
+    """
+    effective = min(workers, max(1, (os.cpu_count() or 1) - 1))
+    if effective != workers:
+        logger.warning("  %s workers requested but only %s CPUs available, using %s", workers, os.cpu_count(), effective)
+    return effective
+
+
+def _advise_sequential(filepath: Path):
+    """
+    Ask the kernel to read ahead an input file before it is converted.
+    
+    wsidicomizer opens the file itself; the sequential access hint only
+    applies to this descriptor, but the readahead started by WILLNEED fills
+    the page cache that its later reads hit. No-op where posix_fadvise is
+    not available (non-Linux).
+    
+    Args:
+        filepath: Input SVS/TIFF file path
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+class _Phase:
+    """Context manager storing the elapsed perf_counter_ns of a block under a name."""
+    
+    __slots__ = ('times', 'name', '_start')
+    
+    def __init__(self, times: Dict[str, int], name: str):
+        self.times = times
+        self.name = name
+    
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.times[self.name] = time.perf_counter_ns() - self._start
+        return False
+
+
+def _fast_rmtree(path: Path, max_workers: int = 16):
+    """
+    Delete a directory tree, unlinking its files from a thread pool.
+    
+    Clearing a previous conversion means unlinking many DICOM files; each
+    unlink is a separate filesystem metadata operation, so running them
+    concurrently is much faster than shutil.rmtree. Falls back to
+    shutil.rmtree on Windows.
+    
+    Args:
+        path: Directory to delete
+        max_workers: Number of unlink threads (default: 16)
+    """
+    if os.name == 'nt':
+        shutil.rmtree(path)
+        return
+    
+    # Directories are collected parents first, files are unlinked in parallel
+    directories = []
+    files = []
+    pending = [os.fspath(path)]
+    while pending:
+        directory = pending.pop()
+        directories.append(directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    files.append(entry.path)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so unlink errors are raised
+        list(executor.map(os.unlink, files))
+    
+    for directory in reversed(directories):
+        os.rmdir(directory)
+
+
 def inspect_source_file(filepath: Path) -> Dict:
     """
     Inspect source WSI file to understand its structure.
@@ -157,6 +417,8 @@ def inspect_source_file(filepath: Path) -> Dict:
     Returns:
         Dictionary with file information
     """
+    import tifffile
+    
     info = {
         'file_size_mb': filepath.stat().st_size / (1024 * 1024),
         'num_pages': 0,
@@ -188,6 +450,96 @@ def inspect_source_file(filepath: Path) -> Dict:
     return info
 
 
+@functools.lru_cache(maxsize=8)
+def _get_loader(
+    pathology_csv: str,
+    sample_csv: str,
+    participant_csv: str,
+    diagnosis_csv: str,
+    codes_dir: str
+) -> CCDIMetadataLoader:
+    """
+    Get the CCDI metadata loader for a set of CSVs, shared within the process.
+    
+    Converters created for the same CSVs (e.g. by convert_ccdi_slide or
+    repeated CCDIConverter construction) reuse the loaded tables. The
+    returned loader is shared and must be treated as read-only.
+    
+    Args:
+        pathology_csv: CCDI pathology_file CSV
+        sample_csv: CCDI sample CSV
+        participant_csv: CCDI participant CSV
+        diagnosis_csv: CCDI diagnosis CSV
+        codes_dir: Directory with code mapping CSVs
+        
+    Returns:
+        Loaded CCDIMetadataLoader
+    """
+    return CCDIMetadataLoader(
+        pathology_csv=pathology_csv,
+        sample_csv=sample_csv,
+        participant_csv=participant_csv,
+        diagnosis_csv=diagnosis_csv,
+        codes_dir=codes_dir
+    )
+
+
+# Summed batch_stats keys: slide counts and running timing totals
+_STAT_COUNTERS = (
+    'total_slides', 'successful', 'failed', 'skipped',
+    'total_load', 'total_datetime', 'total_build', 'total_conversion', 'total_time'
+)
+
+# Per-slide batch_stats columns (one entry per successful slide) and their array typecodes
+_STAT_COLUMNS = {
+    'load_times': 'd',
+    'datetime_times': 'd',
+    'build_times': 'd',
+    'conversion_times': 'd',
+    'total_times': 'd',
+    'num_files': 'q',
+}
+
+# Converter instance of a batch worker process, created by _init_slide_worker
+_worker_converter: Optional["CCDIConverter"] = None
+
+
+def _init_slide_worker(config: Dict[str, Any], quiet: bool = False):
+    """
+    Create the converter used by a batch worker process.
+    
+    Args:
+        config: CCDIConverter constructor arguments
+        quiet: Only log warnings and errors
+    """
+    global _worker_converter
+    if quiet:
+        logger.setLevel(logging.WARNING)
+    _worker_converter = CCDIConverter(**config)
+    _worker_converter._ensure_components()
+
+
+def _convert_slide_worker(
+    input_file: Path,
+    output_folder: Path,
+    kwargs: Dict[str, Any]
+) -> Tuple[Optional[List[str]], Dict]:
+    """
+    Convert one slide in a batch worker process.
+    
+    Args:
+        input_file: Input SVS/TIFF file path
+        output_folder: Output directory for DICOM files
+        kwargs: Additional convert_slide arguments
+        
+    Returns:
+        Tuple of (generated DICOM file paths or None, statistics of this slide)
+    """
+    _worker_converter.reset_statistics()
+    result = _worker_converter.convert_slide(input_file, output_folder, **kwargs)
+    return result, _worker_converter.batch_stats
+
+
 class CCDIConverter:
     """
     Unified converter for single-slide and batch CCDI WSI conversions.
@@ -207,7 +559,9 @@ class CCDIConverter:
         tile_size: Optional[int] = DEFAULT_TILE_SIZE,
         workers: int = DEFAULT_WORKERS,
         encoding: EncodingSpec = DEFAULT_ENCODING,
-        compression_ratio: float = 10.0
+        compression_ratio: float = 10.0,
+        backend: Backend = DEFAULT_BACKEND,
+        keep_per_slide: bool = True
     ):
         """
         Initialize the CCDI converter with configuration.
@@ -227,48 +581,170 @@ class CCDIConverter:
                 - "jpeg2k-lossy": JPEG 2000 lossy
                 - Encoder instance: Custom encoder
             compression_ratio: Compression ratio for lossy encoding (default: 10.0)
+            backend: Source used to read input WSI files (default: "tiffslide")
+                - "tiffslide": TiffSlide
+                - "cucim": cuCIM, GPU-accelerated (requires CUDA)
+                - "openslide": OpenSlide
+            keep_per_slide: Record per-slide timings as batch_stats columns
+                ('filenames', 'load_times', ...; default: True). Aggregate
+                totals are always kept.
         """
         self.tile_size = tile_size
-        self.workers = workers
+        self.workers = workers = _cap_workers(workers)
         self.encoding = encoding
         self.compression_ratio = compression_ratio
+        self.backend = backend
+        self.keep_per_slide = keep_per_slide
         
-        # Initialize components once
-        init_start = time.time()
-        self.loader = CCDIMetadataLoader(
-            pathology_csv=str(pathology_csv),
-            sample_csv=str(sample_csv),
-            participant_csv=str(participant_csv),
-            diagnosis_csv=str(diagnosis_csv),
-            codes_dir=str(codes_dir)
-        )
-        self.registry = UIDRegistry(str(uid_registry_db))
-        self.builder = MetadataBuilder(self.registry, dataset="CCDI")
-        init_time = time.time() - init_start
+        # OpenJPEG only threads its own encode/decode when OPJ_NUM_THREADS is set.
+        # The outer `workers` tiles are already encoded in parallel, so split the
+        # cores between them instead of multiplying threads (an explicit value wins).
+        if encoding in ("jpeg2k-lossless", "jpeg2k-lossy") or _is_encoder(encoding):
+            opj_threads = max(1, (os.cpu_count() or 1) // max(1, workers))
+            os.environ.setdefault("OPJ_NUM_THREADS", str(opj_threads))
+        
+        # Encoders by (encoding, compression_ratio), shared by all slides
+        self._encoder_cache: Dict[Tuple[str, float], Optional["Jpeg2kEncoder"]] = {}
+        
+        # probe_tiff results of batch slides read ahead by _prescan_tiffs
+        self._tiff_cache: Dict[Path, Tuple[Optional[int], Optional[int], Optional[datetime]]] = {}
+        
+        # Input paths as strings, converted once here
+        pathology_csv = os.fspath(pathology_csv)
+        sample_csv = os.fspath(sample_csv)
+        participant_csv = os.fspath(participant_csv)
+        diagnosis_csv = os.fspath(diagnosis_csv)
+        codes_dir = os.fspath(codes_dir)
+        uid_registry_db = os.fspath(uid_registry_db)
+        
+        # Constructor arguments, used to create converters in batch worker processes
+        self._config = {
+            'pathology_csv': pathology_csv,
+            'sample_csv': sample_csv,
+            'participant_csv': participant_csv,
+            'diagnosis_csv': diagnosis_csv,
+            'codes_dir': codes_dir,
+            'uid_registry_db': uid_registry_db,
+            'tile_size': tile_size,
+            'workers': workers,
+            'encoding': encoding,
+            'compression_ratio': compression_ratio,
+            'backend': backend,
+            'keep_per_slide': keep_per_slide,
+        }
+        
+        # Loader, registry and builder are created on first use (_ensure_components)
+        self._loader: Optional[CCDIMetadataLoader] = None
+        self._registry: Optional[UIDRegistry] = None
+        self._builder: Optional["MetadataBuilder"] = None
         
         encoding_str = encoding if isinstance(encoding, str) or encoding is None else type(encoding).__name__
         tile_str = tile_size if tile_size is not None else "native"
-        print(f"\n{'='*70}")
-        print(f"CCDIConverter Initialized")
-        print(f"{'='*70}")
-        print(f"  Initialization time: {init_time:.3f}s")
-        print(f"\n  Default Configuration:")
-        print(f"    Tile Size:         {tile_str}")
-        print(f"    Workers:           {workers}")
-        print(f"    Encoding:          {encoding_str or 'native'}")
+        logger.info("\n%s", "=" * 70)
+        logger.info("CCDIConverter Initialized")
+        logger.info("%s", "=" * 70)
+        logger.info("  Default Configuration:")
+        logger.info("    Tile Size:         %s", tile_str)
+        logger.info("    Workers:           %s", workers)
+        logger.info("    Encoding:          %s", encoding_str or 'native')
         if encoding == "jpeg2k-lossy":
-            print(f"    Compression Ratio: {compression_ratio}")
-        print(f"\n  Note: These defaults can be overridden per conversion.")
-        print(f"{'='*70}")
+            logger.info("    Compression Ratio: %s", compression_ratio)
+        logger.info("    Backend:           %s", backend)
+        logger.info("\n  Note: These defaults can be overridden per conversion.")
+        logger.info("%s", "=" * 70)
         
         # Batch statistics
-        self.batch_stats = {
-            'conversions': [],
-            'total_slides': 0,
-            'successful': 0,
-            'failed': 0,
-            'skipped': 0
-        }
+        self.reset_statistics()
+    
+    def _ensure_components(self):
+        """
+        Create the metadata loader, UID registry and metadata builder once.
+        
+        Deferred until the first conversion so that a converter holds only
+        paths and settings until then; the parent of a parallel batch never
+        loads the CSVs, and each worker opens its own registry connection.
+        """
+        if self._builder is not None:
+            return
+        try:
+            from .metadata_builder import MetadataBuilder
+        except ImportError:
+            from metadata_builder import MetadataBuilder
+        
+        init_start = time.perf_counter()
+        config = self._config
+        self._loader = _get_loader(
+            config['pathology_csv'],
+            config['sample_csv'],
+            config['participant_csv'],
+            config['diagnosis_csv'],
+            config['codes_dir']
+        )
+        self._registry = UIDRegistry(config['uid_registry_db'])
+        self._builder = MetadataBuilder(self._registry, dataset="CCDI")
+        logger.info("  Components initialized in %.3fs", time.perf_counter() - init_start)
+    
+    @property
+    def loader(self) -> CCDIMetadataLoader:
+        """CCDI metadata loader, created on first use."""
+        self._ensure_components()
+        return self._loader
+    
+    @property
+    def registry(self) -> UIDRegistry:
+        """UID registry, created on first use."""
+        self._ensure_components()
+        return self._registry
+    
+    @property
+    def builder(self) -> "MetadataBuilder":
+        """DICOM metadata builder, created on first use."""
+        self._ensure_components()
+        return self._builder
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only settings and statistics; components are recreated on use."""
+        state = self.__dict__.copy()
+        state['_loader'] = state['_registry'] = state['_builder'] = None
+        state['_encoder_cache'] = {}
+        state['_tracebacks'] = collections.deque(maxlen=TRACEBACK_BUFFER_SIZE)
+        return state
+    
+    def _get_encoder(self, encoding: EncodingSpec, compression_ratio: float) -> Optional["Jpeg2kEncoder"]:
+        """
+        Get the encoder for an encoding specification, creating it on first use.
+        
+        Encoders only hold their settings, so one instance is reused for every
+        slide converted with the same encoding and compression ratio.
+        
+        Args:
+            encoding: Encoding specification (see create_encoder)
+            compression_ratio: Compression ratio for lossy JPEG2000
+            
+        Returns:
+            Encoder instance, or None for native encoding
+        """
+        if encoding is None or _is_encoder(encoding):
+            return create_encoder(encoding, compression_ratio)
+        
+        key = (encoding, compression_ratio)
+        if key not in self._encoder_cache:
+            self._encoder_cache[key] = create_encoder(encoding, compression_ratio)
+        return self._encoder_cache[key]
+    
+    def _prescan_tiffs(self, paths: List[Path], n_threads: int = 16):
+        """
+        Read the TIFF headers of batch slides concurrently before converting.
+        
+        Header reads are IO-bound, so a thread pool overlaps them; the results
+        are kept in self._tiff_cache for convert_slide.
+        
+        Args:
+            paths: Input SVS/TIFF file paths
+            n_threads: Number of reader threads (default: 16)
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(n_threads, len(paths)))) as executor:
+            self._tiff_cache.update(zip(paths, executor.map(probe_tiff, paths)))
     
     def _check_output_directory(self, output_folder: Path, auto_clear: bool = False) -> bool:
         """
@@ -284,27 +760,26 @@ class CCDIConverter:
         if output_folder.exists():
             existing_files = list(output_folder.iterdir())
             if existing_files:
-                print(f"\n  WARNING: Output directory is not empty!")
-                print(f"  Path: {output_folder}")
-                print(f"  Contains {len(existing_files)} items")
-                print(f"  Mixing multiple DICOM series in one folder can cause issues.\n")
+                logger.warning("  Output directory is not empty: %s", output_folder)
+                logger.info("  Contains %s items", len(existing_files))
+                logger.info("  Mixing multiple DICOM series in one folder can cause issues.\n")
                 
                 if auto_clear:
-                    print(f"  Auto-clearing enabled: deleting existing content...")
-                    shutil.rmtree(output_folder)
+                    logger.info("  Auto-clearing enabled: deleting existing content...")
+                    _fast_rmtree(output_folder)
                     output_folder.mkdir(parents=True, exist_ok=True)
-                    print(f"  Output directory cleared.")
+                    logger.info("  Output directory cleared.")
                     return True
                 else:
                     response = input("  Delete existing content and continue? (yes/no): ").strip().lower()
                     if response in ['yes', 'y']:
-                        print(f"  Deleting existing content...")
-                        shutil.rmtree(output_folder)
+                        logger.info("  Deleting existing content...")
+                        _fast_rmtree(output_folder)
                         output_folder.mkdir(parents=True, exist_ok=True)
-                        print(f"  Output directory cleared.")
+                        logger.info("  Output directory cleared.")
                         return True
                     else:
-                        print(f"  Aborting conversion to avoid mixing DICOM series.")
+                        logger.info("  Aborting conversion to avoid mixing DICOM series.")
                         return False
         return True
     
@@ -316,7 +791,10 @@ class CCDIConverter:
         workers: Optional[int] = None,
         encoding: Optional[EncodingSpec] = None,
         compression_ratio: Optional[float] = None,
-        auto_clear: bool = False
+        auto_clear: bool = False,
+        backend: Optional[Backend] = None,
+        force_reencode: bool = False,
+        _folder_ready: bool = False
     ) -> Optional[List[str]]:
         """
         Convert a single CCDI slide to DICOM.
@@ -329,17 +807,26 @@ class CCDIConverter:
             encoding: Override instance encoding if provided (None = use native)
             compression_ratio: Override instance compression_ratio if provided
             auto_clear: Auto-clear output directory without prompt
+            backend: Override instance backend if provided
+            force_reencode: Re-encode with "jpeg2k-lossless" even if the source
+                is already JPEG 2000 (default: copy the source tiles)
+            _folder_ready: Output folder was already created (by convert_batch)
             
         Returns:
             List of generated DICOM file paths, or None if conversion failed/aborted
         """
-        input_file = Path(input_file)
-        output_folder = Path(output_folder)
-        workers = workers if workers is not None else self.workers
+        # Batches already pass Path objects; only wrap other path types
+        if not isinstance(input_file, Path):
+            input_file = Path(input_file)
+        if not isinstance(output_folder, Path):
+            output_folder = Path(output_folder)
+        workers = _cap_workers(workers) if workers is not None else self.workers
         encoding = encoding if encoding is not None else self.encoding
         compression_ratio = compression_ratio if compression_ratio is not None else self.compression_ratio
+        backend = backend if backend is not None else self.backend
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        phase_ns: Dict[str, int] = {}  # Elapsed nanoseconds per phase
         
         # Check output directory FIRST before doing any work
         if not self._check_output_directory(output_folder, auto_clear):
@@ -347,109 +834,125 @@ class CCDIConverter:
             return None
         
         # Inspect source file
-        print(f"\n  Inspecting source file...")
+        logger.info("\n  Inspecting source file...")
         source_info = inspect_source_file(input_file)
-        print(f"  Source file size: {source_info['file_size_mb']:.2f} MB")
-        print(f"  Number of pages: {source_info['num_pages']}")
+        logger.info("  Source file size: %.2f MB", source_info['file_size_mb'])
+        logger.info("  Number of pages: %s", source_info['num_pages'])
         for page in source_info['pages'][:3]:  # Show first 3 pages
             size_str = f"{page['width']}x{page['height']}"
             tile_str = f", tiles: {page.get('tile_width', 'N/A')}x{page.get('tile_height', 'N/A')}" if page['is_tiled'] else ""
-            print(f"    Page {page['index']}: {size_str}, compression: {page['compression']}{tile_str}")
+            logger.info("    Page %s: %s, compression: %s%s", page['index'], size_str, page['compression'], tile_str)
         if source_info['num_pages'] > 3:
-            print(f"    ... and {source_info['num_pages'] - 3} more page(s)")
+            logger.info("    ... and %s more page(s)", source_info['num_pages'] - 3)
+        
+        # Read native tile size, compression and scan datetime with one TIFF open
+        with _Phase(phase_ns, 'probe'):
+            probe = self._tiff_cache.pop(input_file, None)
+            if probe is None:
+                probe = probe_tiff(input_file)
+        detected_tile_size, source_compression, study_datetime = probe
+        
+        # A JPEG 2000 source gains nothing from a lossless JPEG 2000 roundtrip
+        if (encoding == "jpeg2k-lossless" and not force_reencode
+                and source_compression in _JPEG2000_COMPRESSIONS):
+            logger.info("  ✓ Source already JPEG 2000, bypassing re-encode")
+            encoding = None
         
         # Handle tile_size - use native if None
         tile_size_source = "override"
         if tile_size is None and self.tile_size is None:
-            detected_tile_size = get_native_tile_size(input_file)
             if detected_tile_size:
                 tile_size = detected_tile_size
                 tile_size_source = "native (detected)"
-                print(f"  ✓ Native tile size detected: {tile_size}x{tile_size}")
+                logger.info("  ✓ Native tile size detected: %sx%s", tile_size, tile_size)
             else:
                 tile_size = None  # Let wsidicomizer choose
                 tile_size_source = "default (wsidicomizer)"
-                print(f"  ⚠ No native tile size found, using wsidicomizer default")
+                logger.warning("  No native tile size found, using wsidicomizer default")
         else:
             tile_size = tile_size if tile_size is not None else self.tile_size
             if tile_size:
                 tile_size_source = "specified"
-                print(f"  ✓ Using specified tile size: {tile_size}x{tile_size}")
+                logger.info("  ✓ Using specified tile size: %sx%s", tile_size, tile_size)
         
         encoding_str = encoding if isinstance(encoding, str) or encoding is None else type(encoding).__name__
         tile_str = tile_size if tile_size is not None else "wsidicomizer-default"
         
-        print(f"\n{'='*70}")
-        print(f"CONVERTING: {input_file.name}")
-        print(f"{'='*70}")
-        print(f"  Input:  {input_file}")
-        print(f"  Output: {output_folder}")
-        print(f"\n  Conversion Parameters:")
-        print(f"    Tile Size:         {tile_str} ({tile_size_source})")
-        print(f"    Workers:           {workers}")
-        print(f"    Encoding:          {encoding_str or 'native'}")
+        logger.info("\n%s", "=" * 70)
+        logger.info("CONVERTING: %s", input_file.name)
+        logger.info("%s", "=" * 70)
+        logger.info("  Input:  %s", input_file)
+        logger.info("  Output: %s", output_folder)
+        logger.info("\n  Conversion Parameters:")
+        logger.info("    Tile Size:         %s (%s)", tile_str, tile_size_source)
+        logger.info("    Workers:           %s", workers)
+        logger.info("    Encoding:          %s", encoding_str or 'native')
         if encoding == "jpeg2k-lossy":
-            print(f"    Compression Ratio: {compression_ratio}")
+            logger.info("    Compression Ratio: %s", compression_ratio)
+        logger.info("    Backend:           %s", backend)
         
-        print(f"\n  Phase 1: Metadata Preparation")
-        print(f"  {'-'*68}")
+        logger.info("\n  Phase 1: Metadata Preparation")
+        logger.info("  %s", "-" * 68)
         
         try:
             # Load domain metadata
             filename = input_file.name
-            print(f"  • Loading CCDI metadata for {filename}...")
-            load_start = time.time()
-            domain_metadata = self.loader.load_slide(filename)
-            load_time = time.time() - load_start
-            
-            print(f"    ✓ Loaded in {load_time:.2f}s")
-            print(f"    Patient ID: {domain_metadata.patient.participant_id}")
-            print(f"    Specimens:  {len(domain_metadata.specimens)}")
+            logger.info("  • Loading CCDI metadata for %s...", filename)
+            with _Phase(phase_ns, 'load'):
+                domain_metadata = self.loader.load_slide(filename)
+            load_time = phase_ns['load'] / 1e9
+            
+            logger.info("    ✓ Loaded in %.2fs", load_time)
+            logger.info("    Patient ID: %s", domain_metadata.patient.participant_id)
+            logger.info("    Specimens:  %s", len(domain_metadata.specimens))
             for spec in domain_metadata.specimens:
-                print(f"      - {spec.specimen_id}: {spec.anatomic_site}")
+                logger.info("      - %s: %s", spec.specimen_id, spec.anatomic_site)
             
-            # Extract study datetime from TIFF
-            print(f"\n  • Extracting scan datetime from TIFF...")
-            datetime_start = time.time()
-            study_datetime = extract_scan_datetime(input_file)
-            datetime_time = time.time() - datetime_start
+            # Study datetime was read from the TIFF header with the tile size
+            logger.info("\n  • Scan datetime from TIFF header...")
+            datetime_time = phase_ns['probe'] / 1e9
             if study_datetime:
-                print(f"    ✓ Found: {study_datetime} ({datetime_time:.3f}s)")
+                logger.info("    ✓ Found: %s (%.3fs)", study_datetime, datetime_time)
             else:
-                print(f"    ⚠ Not found in TIFF, using fallback date ({datetime_time:.3f}s)")
+                logger.warning("    Not found in TIFF, using fallback date (%.3fs)", datetime_time)
             
             # Build metadata
-            print(f"\n  • Building DICOM metadata...")
-            build_start = time.time()
-            wsi_metadata, supplement = self.builder.build(domain_metadata, study_datetime)
-            build_time = time.time() - build_start
+            logger.info("\n  • Building DICOM metadata...")
+            with _Phase(phase_ns, 'build'):
+                try:
+                    wsi_metadata, supplement = self.builder.build(domain_metadata, study_datetime)
+                finally:
+                    # Inside a batch, release the registry write lock before the
+                    # long conversion so other processes can register UIDs
+                    self.registry.commit()
+            build_time = phase_ns['build'] / 1e9
             
-            print(f"    ✓ Built in {build_time:.2f}s")
-            print(f"    Study UID:  {wsi_metadata.study.uid}")
-            print(f"    Series:     {wsi_metadata.series.number} - {wsi_metadata.series.description}")
+            logger.info("    ✓ Built in %.2fs", build_time)
+            logger.info("    Study UID:  %s", wsi_metadata.study.uid)
+            logger.info("    Series:     %s - %s", wsi_metadata.series.number, wsi_metadata.series.description)
             
             # Convert with wsidicomizer
-            print(f"\n  Phase 2: WSI Conversion")
-            print(f"  {'-'*68}")
-            output_folder.mkdir(parents=True, exist_ok=True)
+            logger.info("\n  Phase 2: WSI Conversion")
+            logger.info("  %s", "-" * 68)
+            if not _folder_ready:
+                output_folder.mkdir(parents=True, exist_ok=True)
             
             # Create encoder
-            encoder = create_encoder(encoding, compression_ratio)
+            encoder = self._get_encoder(encoding, compression_ratio)
             if encoder:
-                print(f"  • Encoder:  {type(encoder).__name__}")
+                logger.info("  • Encoder:  %s", type(encoder).__name__)
                 if hasattr(encoder, 'compression_ratio'):
-                    print(f"    Compression ratio: {encoder.compression_ratio}")
+                    logger.info("    Compression ratio: %s", encoder.compression_ratio)
             else:
-                print(f"  • Encoder:  Native (preserving source encoding)")
+                logger.info("  • Encoder:  Native (preserving source encoding)")
             
             # Log conversion parameters
-            print(f"  • Starting conversion with {workers} worker(s)...")
+            logger.info("  • Starting conversion with %s worker(s)...", workers)
             if tile_size:
-                print(f"    Tile size: {tile_size}x{tile_size} ({tile_size_source})")
+                logger.info("    Tile size: %sx%s (%s)", tile_size, tile_size, tile_size_source)
             else:
-                print(f"    Tile size: Using wsidicomizer default")
+                logger.info("    Tile size: Using wsidicomizer default")
             
-            conversion_start = time.time()
             # Build convert args - only pass optional params if specified
             convert_args = {
                 'filepath': input_file,
@@ -457,66 +960,83 @@ class CCDIConverter:
                 'metadata': wsi_metadata,
                 'metadata_post_processor': supplement,
                 'workers': workers,
-                'preferred_source': TiffSlideSource,
+                'preferred_source': get_source_class(backend),
             }
             if tile_size is not None:
                 convert_args['tile_size'] = tile_size
             if encoder:
                 convert_args['encoding'] = encoder
             
-            result = WsiDicomizer.convert(**convert_args)
-            conversion_time = time.time() - conversion_start
-            total_time = time.time() - start_time
+            from wsidicomizer import WsiDicomizer
+            
+            with _Phase(phase_ns, 'conversion'):
+                _advise_sequential(input_file)
+                result = WsiDicomizer.convert(**convert_args)
+            conversion_time = phase_ns['conversion'] / 1e9
+            total_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Calculate output file sizes
-            total_output_size_mb = sum(Path(f).stat().st_size for f in result) / (1024 * 1024)
+            total_output_size_mb = sum(os.path.getsize(f) for f in result) / (1024 * 1024)
             size_ratio = (total_output_size_mb / source_info['file_size_mb']) * 100 if source_info['file_size_mb'] > 0 else 0
             
-            print(f"\n  {'='*68}")
-            print(f"  ✓ CONVERSION SUCCESSFUL")
-            print(f"  {'='*68}")
-            print(f"  Generated {len(result)} DICOM file(s)")
-            print(f"  Output: {output_folder}")
-            print(f"\n  File Size Analysis:")
-            print(f"    Source file:    {source_info['file_size_mb']:8.2f} MB")
-            print(f"    Output files:   {total_output_size_mb:8.2f} MB  ({size_ratio:.1f}% of source)")
+            logger.info("\n  %s", "=" * 68)
+            logger.info("  ✓ CONVERSION SUCCESSFUL")
+            logger.info("  %s", "=" * 68)
+            logger.info("  Generated %s DICOM file(s)", len(result))
+            logger.info("  Output: %s", output_folder)
+            logger.info("\n  File Size Analysis:")
+            logger.info("    Source file:    %8.2f MB", source_info['file_size_mb'])
+            logger.info("    Output files:   %8.2f MB  (%.1f%% of source)", total_output_size_mb, size_ratio)
             if size_ratio < 50:
-                print(f"    ⚠ Warning: Output is significantly smaller than source!")
-                print(f"      This may indicate missing pyramid levels or re-encoding.")
+                logger.warning("    Output is significantly smaller than source!")
+                logger.warning("      This may indicate missing pyramid levels or re-encoding.")
             
-            print(f"\n  Timing Breakdown:")
-            print(f"    Metadata Loading:   {load_time:7.2f}s  ({load_time/total_time*100:5.1f}%)")
-            print(f"    DateTime Extract:   {datetime_time:7.2f}s  ({datetime_time/total_time*100:5.1f}%)")
-            print(f"    Metadata Build:     {build_time:7.2f}s  ({build_time/total_time*100:5.1f}%)")
-            print(f"    WSI Conversion:     {conversion_time:7.2f}s  ({conversion_time/total_time*100:5.1f}%)")
-            print(f"    {'─'*68}")
-            print(f"    Total Time:         {total_time:7.2f}s")
+            logger.info("\n  Timing Breakdown:")
+            logger.info("    Metadata Loading:   %7.2fs  (%5.1f%%)", load_time, load_time/total_time*100)
+            logger.info("    DateTime Extract:   %7.2fs  (%5.1f%%)", datetime_time, datetime_time/total_time*100)
+            logger.info("    Metadata Build:     %7.2fs  (%5.1f%%)", build_time, build_time/total_time*100)
+            logger.info("    WSI Conversion:     %7.2fs  (%5.1f%%)", conversion_time, conversion_time/total_time*100)
+            logger.info("    %s", "─" * 68)
+            logger.info("    Total Time:         %7.2fs", total_time)
             
             # Record statistics
-            self.batch_stats['conversions'].append({
-                'filename': input_file.name,
-                'load_time': load_time,
-                'datetime_time': datetime_time,
-                'build_time': build_time,
-                'conversion_time': conversion_time,
-                'total_time': total_time,
-                'num_files': len(result)
-            })
+            stats = self.batch_stats
+            stats['total_load'] += load_time
+            stats['total_datetime'] += datetime_time
+            stats['total_build'] += build_time
+            stats['total_conversion'] += conversion_time
+            stats['total_time'] += total_time
+            if self.keep_per_slide:
+                stats['filenames'].append(input_file.name)
+                stats['load_times'].append(load_time)
+                stats['datetime_times'].append(datetime_time)
+                stats['build_times'].append(build_time)
+                stats['conversion_times'].append(conversion_time)
+                stats['total_times'].append(total_time)
+                stats['num_files'].append(len(result))
             self.batch_stats['successful'] += 1
             self.batch_stats['total_slides'] += 1
             
             return result
             
         except Exception as e:
-            total_time = time.time() - start_time
-            print(f"\n  {'='*68}")
-            print(f"  ✗ CONVERSION FAILED")
-            print(f"  {'='*68}")
-            print(f"  Error: {e}")
-            print(f"  Time elapsed: {total_time:.2f}s")
-            print(f"\n  Stack trace:")
-            import traceback
-            traceback.print_exc()
+            total_time = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.error("\n  %s", "=" * 68)
+            logger.error("  ✗ CONVERSION FAILED")
+            logger.error("  %s", "=" * 68)
+            logger.error("  Error: %r", e)
+            logger.error("  Time elapsed: %.2fs", total_time)
+            
+            # Log the full stack once per exception type; repeats of a systematic
+            # failure only get the one-line error above
+            if type(e) not in self._logged_error_types:
+                self._logged_error_types.add(type(e))
+                logger.exception("\n  Conversion failed for %s", input_file.name)
+            self._tracebacks.append((
+                input_file.name,
+                traceback.TracebackException.from_exception(e, lookup_lines=False)
+            ))
+            self.batch_stats['failures'].append((input_file.name, repr(e)))
             self.batch_stats['failed'] += 1
             self.batch_stats['total_slides'] += 1
             return None
@@ -529,11 +1049,18 @@ class CCDIConverter:
         workers: Optional[int] = None,
         encoding: Optional[EncodingSpec] = None,
         compression_ratio: Optional[float] = None,
-        create_subfolders: bool = True
+        create_subfolders: bool = True,
+        parallel_slides: int = 1,
+        quiet: bool = False,
+        traceback_path: Optional[Union[str, Path]] = None
     ) -> Dict[str, List[str]]:
         """
         Convert multiple CCDI slides to DICOM.
         
+        With parallel_slides > 1, slides are converted in separate worker
+        processes, each with its own converter, and the worker threads per
+        slide are divided between them.
+        
         Args:
             input_files: List of input SVS/TIFF file paths
             output_base: Base output directory
@@ -542,94 +1069,219 @@ class CCDIConverter:
             encoding: Override instance encoding if provided (None = use native)
             compression_ratio: Override instance compression_ratio if provided
             create_subfolders: Create a subfolder for each slide (recommended)
+            parallel_slides: Number of slides converted concurrently (default: 1).
+                Requires create_subfolders; slides are converted serially otherwise.
+            quiet: Only log warnings and errors during the batch
+            traceback_path: If any slide fails, write the recent failure
+                tracebacks to this file (see dump_tracebacks)
             
         Returns:
             Dictionary mapping input filename to list of output DICOM paths
         """
-        output_base = Path(output_base)
-        results = {}
-        
-        print(f"\n{'='*70}")
-        print(f"BATCH CONVERSION: {len(input_files)} slides")
-        print(f"{'='*70}")
-        
-        batch_start = time.time()
-        
-        for i, input_file in enumerate(input_files, 1):
-            input_file = Path(input_file)
-            print(f"\n[{i}/{len(input_files)}] Processing {input_file.name}")
+        failed_before = self.batch_stats['failed']
+        previous_level = logger.level
+        if quiet:
+            logger.setLevel(logging.WARNING)
+        try:
+            output_base = Path(output_base)
+            input_files = [Path(f) for f in input_files]
+            results = {}
             
-            # Create output folder
+            # Create all output folders in one pass instead of once per slide
             if create_subfolders:
-                output_folder = output_base / input_file.stem
+                output_folders = [output_base / f.stem for f in input_files]
             else:
-                output_folder = output_base
+                output_folders = [output_base] * len(input_files)
+            for output_folder in dict.fromkeys(output_folders):
+                output_folder.mkdir(parents=True, exist_ok=True)
+            
+            logger.info("\n%s", "=" * 70)
+            logger.info("BATCH CONVERSION: %s slides", len(input_files))
+            logger.info("%s", "=" * 70)
+            
+            batch_start = time.perf_counter()
+            
+            # Slides sharing one output folder would clear each other's output
+            if parallel_slides > 1 and create_subfolders:
+                results = self._convert_batch_parallel(
+                    input_files, output_base, tile_size, workers, encoding,
+                    compression_ratio, parallel_slides, quiet
+                )
+            else:
+                self._prescan_tiffs(input_files)
+                
+                # Share one registry connection; UIDs are committed per slide
+                self.registry.begin()
+                try:
+                    for i, (input_file, output_folder) in enumerate(zip(input_files, output_folders), 1):
+                        logger.info("\n[%s/%s] Processing %s", i, len(input_files), input_file.name)
+                        
+                        # Convert (auto-clear for batch processing)
+                        result = self.convert_slide(
+                            input_file=input_file,
+                            output_folder=output_folder,
+                            tile_size=tile_size,
+                            workers=workers,
+                            encoding=encoding,
+                            compression_ratio=compression_ratio,
+                            auto_clear=True,
+                            _folder_ready=True
+                        )
+                        
+                        # Keep only the output paths; drop the rest of the slide's state
+                        results[input_file.name] = [os.fspath(f) for f in result] if result else []
+                        del result
+                        
+                        if i % GC_INTERVAL == 0:
+                            gc.collect()
+                finally:
+                    self.registry.end()
+                    self._tiff_cache.clear()
             
-            # Convert (auto-clear for batch processing)
-            result = self.convert_slide(
-                input_file=input_file,
-                output_folder=output_folder,
-                tile_size=tile_size,
-                workers=workers,
-                encoding=encoding,
-                compression_ratio=compression_ratio,
-                auto_clear=True
-            )
+            batch_time = time.perf_counter() - batch_start
             
-            results[input_file.name] = result if result else []
+            # Print batch summary
+            logger.info("\n%s", "=" * 70)
+            logger.info("BATCH CONVERSION COMPLETE")
+            logger.info("%s", "=" * 70)
+            self.print_batch_statistics(batch_time)
+            
+            if traceback_path is not None and self.batch_stats['failed'] > failed_before:
+                written = self.dump_tracebacks(traceback_path)
+                logger.warning("  %d failure traceback(s) written to %s", written, traceback_path)
+            
+            return results
+        finally:
+            logger.setLevel(previous_level)
+    
+    def _convert_batch_parallel(
+        self,
+        input_files: List[Path],
+        output_base: Path,
+        tile_size: Optional[int],
+        workers: Optional[int],
+        encoding: Optional[EncodingSpec],
+        compression_ratio: Optional[float],
+        parallel_slides: int,
+        quiet: bool
+    ) -> Dict[str, List[str]]:
+        """
+        Convert slides in worker processes and merge their statistics.
         
-        batch_time = time.time() - batch_start
+        Args:
+            See convert_batch.
+            
+        Returns:
+            Dictionary mapping input filename to list of output DICOM paths
+        """
+        # Split the worker threads between concurrent slides to avoid oversubscription
+        slide_workers = max(1, (workers if workers is not None else self.workers) // parallel_slides)
+        kwargs = {
+            'tile_size': tile_size,
+            'workers': slide_workers,
+            'encoding': encoding,
+            'compression_ratio': compression_ratio,
+            'auto_clear': True,
+            '_folder_ready': True,
+        }
+        logger.info("  Converting %s slides at a time, %s worker(s) each", parallel_slides, slide_workers)
         
-        # Print batch summary
-        print(f"\n{'='*70}")
-        print(f"BATCH CONVERSION COMPLETE")
-        print(f"{'='*70}")
-        self.print_batch_statistics(batch_time)
+        results = {}
+        with ProcessPoolExecutor(
+            max_workers=parallel_slides,
+            initializer=_init_slide_worker,
+            initargs=(self._config, quiet)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _convert_slide_worker,
+                    input_file,
+                    output_base / input_file.stem,
+                    kwargs
+                ): input_file
+                for input_file in input_files
+            }
+            
+            for i, future in enumerate(as_completed(futures), 1):
+                input_file = futures[future]
+                result, slide_stats = future.result()
+                logger.info("\n[%s/%s] Finished %s", i, len(input_files), input_file.name)
+                
+                # Merge the worker's per-slide statistics
+                self.batch_stats['filenames'].extend(slide_stats['filenames'])
+                self.batch_stats['failures'].extend(slide_stats['failures'])
+                for key in _STAT_COLUMNS:
+                    self.batch_stats[key].extend(slide_stats[key])
+                for key in _STAT_COUNTERS:
+                    self.batch_stats[key] += slide_stats[key]
+                
+                results[input_file.name] = result if result else []
         
-        return results
+        # Keep the input order
+        return {f.name: results[f.name] for f in input_files}
     
     def print_batch_statistics(self, batch_time: Optional[float] = None):
         """Print aggregate statistics for batch conversions."""
         stats = self.batch_stats
         
-        print(f"\nBatch Statistics:")
-        print(f"  Total slides:       {stats['total_slides']}")
-        print(f"  Successful:         {stats['successful']}")
-        print(f"  Failed:             {stats['failed']}")
-        print(f"  Skipped:            {stats['skipped']}")
-        
-        if stats['conversions']:
-            # Aggregate timing
-            total_load = sum(c['load_time'] for c in stats['conversions'])
-            total_datetime = sum(c['datetime_time'] for c in stats['conversions'])
-            total_build = sum(c['build_time'] for c in stats['conversions'])
-            total_conversion = sum(c['conversion_time'] for c in stats['conversions'])
-            total_time = sum(c['total_time'] for c in stats['conversions'])
-            
-            avg_load = total_load / len(stats['conversions'])
-            avg_datetime = total_datetime / len(stats['conversions'])
-            avg_build = total_build / len(stats['conversions'])
-            avg_conversion = total_conversion / len(stats['conversions'])
-            avg_total = total_time / len(stats['conversions'])
-            
-            print(f"\nAggregate Timing (all successful conversions):")
-            print(f"  Metadata Loading:   {total_load:7.2f}s (avg: {avg_load:6.2f}s)")
-            print(f"  DateTime Extract:   {total_datetime:7.2f}s (avg: {avg_datetime:6.2f}s)")
-            print(f"  Metadata Build:     {total_build:7.2f}s (avg: {avg_build:6.2f}s)")
-            print(f"  WSI Conversion:     {total_conversion:7.2f}s (avg: {avg_conversion:6.2f}s)")
-            print(f"  Total:              {total_time:7.2f}s (avg: {avg_total:6.2f}s)")
+        logger.info("\nBatch Statistics:")
+        logger.info("  Total slides:       %s", stats['total_slides'])
+        logger.info("  Successful:         %s", stats['successful'])
+        logger.info("  Failed:             %s", stats['failed'])
+        logger.info("  Skipped:            %s", stats['skipped'])
+        
+        if stats['successful']:
+            # Aggregate timing, accumulated as each slide completes
+            total_load = stats['total_load']
+            total_datetime = stats['total_datetime']
+            total_build = stats['total_build']
+            total_conversion = stats['total_conversion']
+            total_time = stats['total_time']
+            
+            avg_load = total_load / stats['successful']
+            avg_datetime = total_datetime / stats['successful']
+            avg_build = total_build / stats['successful']
+            avg_conversion = total_conversion / stats['successful']
+            avg_total = total_time / stats['successful']
+            
+            logger.info("\nAggregate Timing (all successful conversions):")
+            logger.info("  Metadata Loading:   %7.2fs (avg: %6.2fs)", total_load, avg_load)
+            logger.info("  DateTime Extract:   %7.2fs (avg: %6.2fs)", total_datetime, avg_datetime)
+            logger.info("  Metadata Build:     %7.2fs (avg: %6.2fs)", total_build, avg_build)
+            logger.info("  WSI Conversion:     %7.2fs (avg: %6.2fs)", total_conversion, avg_conversion)
+            logger.info("  Total:              %7.2fs (avg: %6.2fs)", total_time, avg_total)
             
             if batch_time:
-                print(f"\nEnd-to-end batch time: {batch_time:.2f}s")
+                logger.info("\nEnd-to-end batch time: %.2fs", batch_time)
                 if stats['successful'] > 0:
-                    print(f"Average per slide:     {batch_time/stats['successful']:.2f}s")
+                    logger.info("Average per slide:     %.2fs", batch_time/stats['successful'])
     
     def reset_statistics(self):
         """Reset batch statistics."""
-        self.batch_stats = {
-            'conversions': [],
-            'total_slides': 0,
-            'successful': 0,
-            'failed': 0,
-            'skipped': 0
-        }
+        self.batch_stats = {'filenames': [], 'failures': []}
+        self.batch_stats.update(
+            (key, array.array(typecode)) for key, typecode in _STAT_COLUMNS.items()
+        )
+        self.batch_stats.update(dict.fromkeys(_STAT_COUNTERS, 0))
+        self._tracebacks = collections.deque(maxlen=TRACEBACK_BUFFER_SIZE)
+        self._logged_error_types = set()
+    
+    def dump_tracebacks(self, path: Union[str, Path]) -> int:
+        """
+        Write the tracebacks of the most recent failed conversions to a file.
+        
+        Only failures of this process are kept; slides converted by
+        parallel batch workers are listed in batch_stats['failures'] only.
+        
+        Args:
+            path: Output text file
+            
+        Returns:
+            Number of tracebacks written
+        """
+        with open(path, 'w') as f:
+            for filename, tb in self._tracebacks:
+                f.write(f"{'='*70}\n{filename}\n{'='*70}\n")
+                f.writelines(tb.format())
+                f.write("\n")
+        return len(self._tracebacks)
@@ -5,9 +5,12 @@ Joins CCDI CSV tables (pathology_file, sample, participant, diagnosis) and maps
 codes via lookup tables to populate domain metadata for wsidicomizer conversion.
 """
 
+import collections
+import copy
 import csv
+import importlib.util
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Dict, Tuple
 
 try:
     from .metadata_schema import (
@@ -20,6 +23,129 @@ except ImportError:
         DiagnosisInfo, ClinicalTrialInfo
     )
 
+# CCDI tables larger than this are parsed with pyarrow's multithreaded reader, if installed
+_ARROW_MIN_SIZE = 1024 * 1024
+_ARROW_BLOCK_SIZE = 16 * 1024 * 1024  # Bytes parsed per pyarrow batch
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# Columns of the CCDI tables used by the loader; other columns are not kept
+PATHOLOGY_COLUMNS = (
+    'file_name', 'sample.sample_id', 'magnification', 'image_modality',
+    'fixation_embedding_method', 'staining_method', 'percent_tumor', 'percent_necrosis'
+)
+SAMPLE_COLUMNS = (
+    'sample_id', 'participant.participant_id', 'anatomic_site',
+    'sample_tumor_status', 'tumor_classification'
+)
+PARTICIPANT_COLUMNS = ('participant_id', 'study.study_id', 'sex_at_birth', 'race')
+DIAGNOSIS_COLUMNS = (
+    'diagnosis_id', 'participant.participant_id', 'diagnosis', 'diagnosis_classification_system',
+    'diagnosis_basis', 'anatomic_site', 'age_at_diagnosis', 'year_of_diagnosis', 'laterality'
+)
+
+
+def _iter_csv_rows(csv_path: Path, columns: Tuple[str, ...]) -> Iterator[Dict[str, str]]:
+    """
+    Iterate over CSV rows as dicts holding only the requested columns.
+    
+    Large files are parsed with pyarrow in blocks when it is installed;
+    otherwise, or if pyarrow cannot parse the file, the whole file is read
+    with csv.reader. The pyarrow path builds the row dicts of the whole file
+    before yielding the first one, so memory is not bounded by the block
+    size; csv.reader rows are yielded one at a time. Requested columns
+    missing from the header are left out of the dicts, and values missing
+    from short rows are None (as with csv.DictReader).
+    
+    Args:
+        csv_path: Path to CSV file with a header row
+        columns: Column names to keep
+        
+    Yields:
+        One dict per data row
+    """
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        
+        # Duplicate header names map to the last column, as in csv.DictReader
+        index = {name: i for i, name in enumerate(header)}
+        fields = [(name, index[name]) for name in columns if name in index]
+        
+        if _HAS_PYARROW and csv_path.stat().st_size > _ARROW_MIN_SIZE:
+            rows = _read_csv_rows_arrow(csv_path, header, [name for name, _ in fields])
+            if rows is not None:
+                yield from rows
+                return
+        
+        for row in reader:
+            if not row:
+                continue
+            if len(row) >= len(header):
+                yield {name: row[i] for name, i in fields}
+            else:
+                yield {name: row[i] if i < len(row) else None for name, i in fields}
+
+
+def _parse_int(value: Optional[str], missing: Tuple[str, ...] = ('',)) -> Optional[int]:
+    """
+    Parse an integer CSV value.
+    
+    Args:
+        value: CSV string value (None if the column or field is missing)
+        missing: Values that mean "not recorded"
+        
+    Returns:
+        Integer value, or None if missing or not a number
+    """
+    if not value or value in missing:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _read_csv_rows_arrow(
+    csv_path: Path,
+    header: List[str],
+    columns: List[str]
+) -> Optional[List[Dict[str, str]]]:
+    """
+    Read CSV columns with pyarrow block by block, keeping every value as a string.
+    
+    Args:
+        csv_path: Path to CSV file with a header row
+        header: Column names of the header row
+        columns: Column names to read (all present in header)
+        
+    Returns:
+        One dict per data row, or None if pyarrow cannot parse the file
+        (e.g. ragged rows)
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    
+    rows = []
+    try:
+        reader = pa_csv.open_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(block_size=_ARROW_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                include_columns=columns,
+                strings_can_be_null=False
+            )
+        )
+        # Rows are collected so a parse error can still fall back to csv.reader
+        for batch in reader:
+            rows.extend(batch.to_pylist())
+    except pa.ArrowInvalid:
+        return None
+    return rows
+
 
 class CCDIMetadataLoader:
     """Load and join CCDI CSV metadata for slides."""
@@ -54,6 +180,21 @@ class CCDIMetadataLoader:
         self._fixation_map = self._load_fixation_map()
         self._staining_map = self._load_staining_map()
         self._tissue_type_map = self._load_tissue_type_map()
+        
+        # Index the CCDI tables once; slide loads are then dict lookups
+        self._pathology_by_filename = self._index_pathology()
+        self._sample_by_id = self._index_samples()
+        self._participant_by_id = self._index_participants()
+        self._diagnosis_by_participant = self._index_diagnoses()
+        
+        # Join pathology_file → sample for every slide up front
+        self._slides = self._join_slides()
+        
+        # Built metadata per filename and per participant_id; the slide
+        # cache is never handed out, load_slide() returns copies
+        self._slide_cache: Dict[str, DomainMetadata] = {}
+        self._patient_cache: Dict[str, Optional[PatientInfo]] = {}
+        self._diagnosis_cache: Dict[str, Optional[DiagnosisInfo]] = {}
     
     def _load_anatomy_map(self) -> Dict[str, Tuple[str, str, str]]:
         """Load ICD-O-3 topography → SNOMED anatomy mapping."""
@@ -166,7 +307,8 @@ class CCDIMetadataLoader:
         """
         Load metadata for a slide by filename.
         
-        Performs CSV joins: pathology_file → sample → participant, diagnosis
+        Performs CSV joins: pathology_file → sample → participant, diagnosis.
+        Results are cached per filename; every call returns its own copy.
         
         Args:
             filename: Slide filename (e.g., "0DWWQ6.svs")
@@ -174,40 +316,34 @@ class CCDIMetadataLoader:
         Returns:
             DomainMetadata with all specimens, patient, diagnosis
         """
-        # Step 1: Find pathology_file rows for this filename
-        pathology_rows = self._find_pathology_rows(filename)
-        if not pathology_rows:
+        metadata = self._slide_cache.get(filename)
+        if metadata is None:
+            metadata = self._slide_cache[filename] = self._build_domain_metadata(filename)
+        return copy.deepcopy(metadata)
+    
+    def _build_domain_metadata(self, filename: str) -> DomainMetadata:
+        """Join and map the metadata of one slide."""
+        # Steps 1-2: pathology_file rows joined with their sample rows at init
+        slide_rows = self._slides.get(filename)
+        if slide_rows is None:
             raise ValueError(f"No pathology_file entries found for {filename}")
-        
-        # Extract sample_ids from pathology rows (multiple samples per slide)
-        sample_ids = [row['sample.sample_id'] for row in pathology_rows]
-        
-        # Step 2: Join with sample CSV to get participant_id and specimen details
-        sample_rows = []
-        participant_id = None
-        for sample_id in sample_ids:
-            sample_row = self._find_sample_row(sample_id)
-            if sample_row:
-                sample_rows.append(sample_row)
-                if not participant_id:
-                    participant_id = sample_row['participant.participant_id']
+        pathology_rows, sample_rows, participant_id = slide_rows
         
         if not participant_id:
             raise ValueError(f"Could not find participant_id for {filename}")
         
         # Step 3: Load participant demographics
-        participant_row = self._find_participant_row(participant_id)
-        if not participant_row:
+        patient = self._patient_info(participant_id)
+        if not patient:
             raise ValueError(f"Participant {participant_id} not found")
         
         # Step 4: Load diagnosis (optional, may be missing)
         diagnosis_row = self._find_diagnosis_row(participant_id)
         
         # Build domain entities
-        patient = self._build_patient_info(participant_row)
         slide = self._build_slide_info(pathology_rows[0], filename)
         specimens = self._build_specimen_info_list(pathology_rows, sample_rows, diagnosis_row)
-        diagnosis = self._build_diagnosis_info(diagnosis_row) if diagnosis_row else None
+        diagnosis = self._diagnosis_info(participant_id)
         clinical_trial = self._build_clinical_trial_info(participant_id)
         
         return DomainMetadata(
@@ -218,46 +354,101 @@ class CCDIMetadataLoader:
             clinical_trial=clinical_trial
         )
     
+    def _index_pathology(self) -> Dict[str, List[Dict]]:
+        """Group pathology_file rows by file_name in one pass (multiple samples per slide)."""
+        pathology_by_filename = collections.defaultdict(list)
+        for row in _iter_csv_rows(self.pathology_csv, PATHOLOGY_COLUMNS):
+            # Percentages are parsed once here, not per slide load
+            row['percent_tumor'] = _parse_int(row.get('percent_tumor'))
+            row['percent_necrosis'] = _parse_int(row.get('percent_necrosis'))
+            pathology_by_filename[row['file_name']].append(row)
+        return pathology_by_filename
+    
+    def _index_samples(self) -> Dict[str, Dict]:
+        """Index sample rows by sample_id (first row wins)."""
+        sample_by_id = {}
+        for row in _iter_csv_rows(self.sample_csv, SAMPLE_COLUMNS):
+            sample_by_id.setdefault(row['sample_id'], row)
+        return sample_by_id
+    
+    def _index_participants(self) -> Dict[str, Dict]:
+        """Index participant rows by participant_id (first row wins)."""
+        participant_by_id = {}
+        for row in _iter_csv_rows(self.participant_csv, PARTICIPANT_COLUMNS):
+            participant_by_id.setdefault(row['participant_id'], row)
+        return participant_by_id
+    
+    def _index_diagnoses(self) -> Dict[str, Dict]:
+        """Index diagnosis rows by participant_id (exclude CNS_category, CNS5 variants)."""
+        diagnosis_by_participant = {}
+        for row in _iter_csv_rows(self.diagnosis_csv, DIAGNOSIS_COLUMNS):
+            diagnosis_id = row.get('diagnosis_id', '')
+            # Skip CNS variant diagnoses per mcitodcm.sh filtering
+            if '_CNS_category' in diagnosis_id or '_CNS5_diagnosis' in diagnosis_id:
+                continue
+            # Age in days; -999 means not reported
+            row['age_at_diagnosis'] = _parse_int(row.get('age_at_diagnosis'), ('', '-999'))
+            diagnosis_by_participant.setdefault(row.get('participant.participant_id'), row)
+        return diagnosis_by_participant
+    
+    def _join_slides(self) -> Dict[str, Tuple[List[Dict], List[Dict], Optional[str]]]:
+        """
+        Join pathology_file rows with sample rows for every slide.
+        
+        Returns:
+            Dict of filename → (pathology rows, matched sample rows, participant_id
+            of the first matched sample or None)
+        """
+        slides = {}
+        sample_by_id = self._sample_by_id
+        for filename, pathology_rows in self._pathology_by_filename.items():
+            # Multiple samples per slide; samples missing from the sample CSV are skipped
+            sample_rows = []
+            participant_id = None
+            for row in pathology_rows:
+                sample_row = sample_by_id.get(row['sample.sample_id'])
+                if sample_row:
+                    sample_rows.append(sample_row)
+                    if not participant_id:
+                        participant_id = sample_row['participant.participant_id']
+            slides[filename] = (pathology_rows, sample_rows, participant_id)
+        return slides
+    
     def _find_pathology_rows(self, filename: str) -> List[Dict]:
         """Find all pathology_file rows for filename (multiple samples per slide)."""
-        rows = []
-        with open(self.pathology_csv, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['file_name'] == filename:
-                    rows.append(row)
-        return rows
+        return self._pathology_by_filename.get(filename, [])
     
     def _find_sample_row(self, sample_id: str) -> Optional[Dict]:
         """Find sample row by sample_id."""
-        with open(self.sample_csv, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['sample_id'] == sample_id:
-                    return row
-        return None
+        return self._sample_by_id.get(sample_id)
     
     def _find_participant_row(self, participant_id: str) -> Optional[Dict]:
         """Find participant row by participant_id."""
-        with open(self.participant_csv, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['participant_id'] == participant_id:
-                    return row
-        return None
+        return self._participant_by_id.get(participant_id)
     
     def _find_diagnosis_row(self, participant_id: str) -> Optional[Dict]:
         """Find diagnosis row by participant_id (exclude CNS_category, CNS5 variants)."""
-        with open(self.diagnosis_csv, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('participant.participant_id') == participant_id:
-                    diagnosis_id = row.get('diagnosis_id', '')
-                    # Skip CNS variant diagnoses per mcitodcm.sh filtering
-                    if '_CNS_category' in diagnosis_id or '_CNS5_diagnosis' in diagnosis_id:
-                        continue
-                    return row
-        return None
+        return self._diagnosis_by_participant.get(participant_id)
+    
+    def _patient_info(self, participant_id: str) -> Optional[PatientInfo]:
+        """Build PatientInfo once per participant; None if the participant is unknown."""
+        try:
+            return self._patient_cache[participant_id]
+        except KeyError:
+            participant_row = self._find_participant_row(participant_id)
+            patient = self._build_patient_info(participant_row) if participant_row else None
+            self._patient_cache[participant_id] = patient
+            return patient
+    
+    def _diagnosis_info(self, participant_id: str) -> Optional[DiagnosisInfo]:
+        """Build DiagnosisInfo once per participant; None if no diagnosis is recorded."""
+        try:
+            return self._diagnosis_cache[participant_id]
+        except KeyError:
+            diagnosis_row = self._find_diagnosis_row(participant_id)
+            diagnosis = self._build_diagnosis_info(diagnosis_row) if diagnosis_row else None
+            self._diagnosis_cache[participant_id] = diagnosis
+            return diagnosis
     
     def _build_patient_info(self, participant_row: Dict) -> PatientInfo:
         """Build PatientInfo from participant CSV row."""
@@ -327,11 +518,9 @@ class CCDIMetadataLoader:
             staining_method = pathology_row.get('staining_method', '')
             staining_codes = self._staining_map.get(staining_method, [])
             
-            # Percentages
+            # Percentages (parsed to int or None when indexed)
             percent_tumor = pathology_row.get('percent_tumor')
-            percent_tumor = int(percent_tumor) if percent_tumor and percent_tumor != '' else None
             percent_necrosis = pathology_row.get('percent_necrosis')
-            percent_necrosis = int(percent_necrosis) if percent_necrosis and percent_necrosis != '' else None
             
             specimen = SpecimenInfo(
                 specimen_id=specimen_id,
@@ -376,9 +565,8 @@ class CCDIMetadataLoader:
         if anatomic_site in self._anatomy_map:
             anatomic_code, anatomic_scheme, anatomic_meaning = self._anatomy_map[anatomic_site]
         
-        # Age at diagnosis (days)
+        # Age at diagnosis (days, parsed to int or None when indexed)
         age_at_diagnosis = diagnosis_row.get('age_at_diagnosis')
-        age_at_diagnosis = int(age_at_diagnosis) if age_at_diagnosis and age_at_diagnosis not in ['', '-999'] else None
         
         return DiagnosisInfo(
             diagnosis_id=diagnosis_row.get('diagnosis_id', ''),
@@ -4,6 +4,8 @@ CCDI WSI Converter - End-to-end conversion with metadata propagation.
 Command-line script for converting CCDI slides using CCDIConverter.
 """
 
+import logging
+import sys
 from pathlib import Path
 
 try:
@@ -63,7 +65,14 @@ def convert_ccdi_slide(
     return converter.convert_slide(input_file, output_folder)
 
 
-if __name__ == "__main__":
+def main():
+    """Run the example conversions, printing converter progress to stdout."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    ccdi_logger = logging.getLogger("ccdi")
+    ccdi_logger.addHandler(handler)
+    ccdi_logger.setLevel(logging.INFO)
+    
     # Sample directory
     sample_root = Path("/Users/af61/Desktop/PW44/pw44-wsi-conversion/test_data/sample7")
     
@@ -164,7 +173,8 @@ if __name__ == "__main__":
     # results = converter_lossy.convert_batch(
     #     input_files=input_files,
     #     output_base=output_base,
-    #     create_subfolders=True
+    #     create_subfolders=True,
+    #     traceback_path=output_base / "failures.txt"
     # )
     # 
     # print(f"\nBatch conversion complete!")
@@ -190,3 +200,7 @@ if __name__ == "__main__":
     #     workers=DEFAULT_WORKERS,
     #     encoding=None
     # )
+
+
+if __name__ == "__main__":
+    main()
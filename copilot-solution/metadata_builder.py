@@ -453,7 +453,7 @@ if __name__ == "__main__":
     for i, spec in enumerate(supplement.SpecimenDescriptionSequence):
         print(f"    Specimen {i+1}: {spec.SpecimenIdentifier}")
         print(f"      Short desc: {spec.SpecimenShortDescription}")
-        print(f"      Prep steps: {len(spec.SpecimenPreparationSequence) if hasattr(spec, 'SpecimenPreparationSequence') else 0}")
+        print(f"      Prep steps: {len(spec.get('SpecimenPreparationSequence', []))}")
     
     # Cleanup
     Path("test_uid_registry.db").unlink()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script for the CCDI CSV readers.
+
+Checks that the pyarrow and csv.reader paths of ccdi_loader return the same
+rows and indexes, using synthetic tables. The pyarrow checks are skipped when
+pyarrow is not installed.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add current directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+import ccdi_loader
+
+
+READER_COLUMNS = ('file_name', 'sample.sample_id', 'magnification', 'notes')
+
+
+def read_with_csv(csv_path: Path, columns):
+    """
+    Read rows through _iter_csv_rows with pyarrow disabled.
+
+    Args:
+        csv_path: Path to CSV file with a header row
+        columns: Column names to keep
+
+    Returns:
+        List of row dicts
+    """
+    has_pyarrow = ccdi_loader._HAS_PYARROW
+    ccdi_loader._HAS_PYARROW = False
+    try:
+        return list(ccdi_loader._iter_csv_rows(csv_path, columns))
+    finally:
+        ccdi_loader._HAS_PYARROW = has_pyarrow
+
+
+def test_csv_row_readers():
+    """Test that pyarrow and csv.reader produce the same row dicts."""
+    print("\n=== Testing CSV Row Readers ===")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+
+        # Empty values, a quoted newline, a blank line and an unused column
+        rows_csv = tmpdir / "rows.csv"
+        rows_csv.write_text(
+            "file_name,sample.sample_id,magnification,notes,unused\n"
+            "a.svs,S1,20x,plain,x\n"
+            "b.svs,S2,,,x\n"
+            "\n"
+            'c.svs,S3,40x,"line one\nline two",x\n',
+            encoding='utf-8'
+        )
+
+        # The short last row makes pyarrow reject the file
+        ragged_csv = tmpdir / "ragged.csv"
+        ragged_csv.write_text(
+            rows_csv.read_text(encoding='utf-8') + "d.svs,S4\n",
+            encoding='utf-8'
+        )
+
+        csv_rows = read_with_csv(rows_csv, READER_COLUMNS)
+        print(f"csv.reader rows: {csv_rows}")
+        assert csv_rows == [
+            {'file_name': 'a.svs', 'sample.sample_id': 'S1', 'magnification': '20x', 'notes': 'plain'},
+            {'file_name': 'b.svs', 'sample.sample_id': 'S2', 'magnification': '', 'notes': ''},
+            {'file_name': 'c.svs', 'sample.sample_id': 'S3', 'magnification': '40x', 'notes': 'line one\nline two'},
+        ], "Unexpected csv.reader rows"
+
+        ragged_rows = read_with_csv(ragged_csv, READER_COLUMNS)
+        assert ragged_rows == csv_rows + [
+            {'file_name': 'd.svs', 'sample.sample_id': 'S4', 'magnification': None, 'notes': None},
+        ], "Values missing from short rows should be None"
+
+        if not ccdi_loader._HAS_PYARROW:
+            print("[SKIP] pyarrow not installed")
+        else:
+            header = ['file_name', 'sample.sample_id', 'magnification', 'notes', 'unused']
+            arrow_rows = ccdi_loader._read_csv_rows_arrow(rows_csv, header, list(READER_COLUMNS))
+            print(f"pyarrow rows: {arrow_rows}")
+            assert arrow_rows == csv_rows, "pyarrow and csv.reader rows should match"
+
+            assert ccdi_loader._read_csv_rows_arrow(ragged_csv, header, list(READER_COLUMNS)) is None, \
+                "pyarrow should reject a file with short rows"
+
+            # Route both files through the pyarrow path of _iter_csv_rows
+            min_size = ccdi_loader._ARROW_MIN_SIZE
+            ccdi_loader._ARROW_MIN_SIZE = 0
+            try:
+                assert list(ccdi_loader._iter_csv_rows(rows_csv, READER_COLUMNS)) == csv_rows, \
+                    "pyarrow path should yield the csv.reader rows"
+                assert list(ccdi_loader._iter_csv_rows(ragged_csv, READER_COLUMNS)) == ragged_rows, \
+                    "Files pyarrow rejects should be read with csv.reader"
+            finally:
+                ccdi_loader._ARROW_MIN_SIZE = min_size
+
+    print("\n[PASS] CSV row reader tests passed")
+
+
+def write_large_tables(csv_dir: Path):
+    """
+    Write CCDI tables whose pathology and sample files exceed the pyarrow threshold.
+
+    Args:
+        csv_dir: Directory to write the tables to
+
+    Returns:
+        Dict of CCDIMetadataLoader CSV path arguments
+    """
+    n_slides = 20000
+    pathology = ["file_name,sample.sample_id,magnification,image_modality,"
+                 "fixation_embedding_method,staining_method,percent_tumor,percent_necrosis,file_size"]
+    sample = ["sample_id,participant.participant_id,anatomic_site,sample_tumor_status,tumor_classification,notes"]
+    for i in range(n_slides):
+        pathology.append(
+            f"slide{i}.svs,S{i},{20 if i % 2 else 40}x,Slide Microscopy,"
+            f"{'OCT' if i % 3 else 'Formalin-Fixed Paraffin-Embedded'},H&E,"
+            f"{i % 101 if i % 7 else ''},{'Not Reported' if i % 11 == 0 else i % 13},{i * 1024}"
+        )
+        sample.append(
+            f'S{i},P{i // 3},"C71.7 : Brain stem",Tumor,Primary,"long, quoted note {i:06d}"'
+        )
+    participant = ["participant_id,study.study_id,sex_at_birth,race"]
+    diagnosis = ["diagnosis_id,participant.participant_id,diagnosis,diagnosis_classification_system,"
+                 "diagnosis_basis,anatomic_site,age_at_diagnosis,year_of_diagnosis,laterality"]
+    for p in range(n_slides // 3):
+        participant.append(f"P{p},phs002790,{'Male' if p % 2 else 'Female'},White")
+        diagnosis.append(f"P{p}_CNS5_diagnosis,P{p},9470/3 : Medulloblastoma,ICD-O-3.2,,,,,")
+        diagnosis.append(
+            f"P{p}_diag,P{p},9470/3 : Medulloblastoma,ICD-O-3.2,Clinical,"
+            f"C71.7 : Brain stem,{-999 if p % 5 == 0 else p * 10},2020,Not Reported"
+        )
+
+    tables = {
+        'pathology_csv': ("pathology.csv", pathology),
+        'sample_csv': ("sample.csv", sample),
+        'participant_csv': ("participant.csv", participant),
+        'diagnosis_csv': ("diagnosis.csv", diagnosis),
+    }
+    paths = {}
+    for argument, (name, lines) in tables.items():
+        path = csv_dir / name
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        paths[argument] = str(path)
+    return paths
+
+
+def test_loader_indexes():
+    """Test that loaders built with pyarrow and csv.reader index tables identically."""
+    print("\n=== Testing Loader Indexes ===")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        paths = write_large_tables(tmpdir)
+        pathology_size = Path(paths['pathology_csv']).stat().st_size
+        print(f"Pathology table: {pathology_size / 1024 / 1024:.2f} MB")
+        assert pathology_size > ccdi_loader._ARROW_MIN_SIZE, "Expected a table above the pyarrow threshold"
+
+        # Code tables are not needed to compare the indexes
+        codes_dir = str(tmpdir / "codes")
+
+        has_pyarrow = ccdi_loader._HAS_PYARROW
+        ccdi_loader._HAS_PYARROW = False
+        try:
+            csv_loader = ccdi_loader.CCDIMetadataLoader(codes_dir=codes_dir, **paths)
+        finally:
+            ccdi_loader._HAS_PYARROW = has_pyarrow
+
+        print(f"Slides indexed: {len(csv_loader._slides)}")
+        assert len(csv_loader._slides) == 20000, f"Expected 20000 slides, got {len(csv_loader._slides)}"
+        row = csv_loader._pathology_by_filename['slide7.svs'][0]
+        assert row['percent_tumor'] is None and row['percent_necrosis'] == 7, \
+            f"Unexpected parsed percentages: {row}"
+        assert csv_loader._diagnosis_by_participant['P0']['age_at_diagnosis'] is None, \
+            "Age -999 should be parsed as not reported"
+
+        if not has_pyarrow:
+            print("[SKIP] pyarrow not installed")
+        else:
+            arrow_loader = ccdi_loader.CCDIMetadataLoader(codes_dir=codes_dir, **paths)
+            for attribute in ('_pathology_by_filename', '_sample_by_id', '_participant_by_id',
+                              '_diagnosis_by_participant', '_slides'):
+                assert getattr(arrow_loader, attribute) == getattr(csv_loader, attribute), \
+                    f"{attribute} differs between pyarrow and csv.reader"
+
+    print("\n[PASS] Loader index tests passed")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("CCDI Loader Test Suite")
+    print("=" * 60)
+
+    test_csv_row_readers()
+    test_loader_indexes()
+
+    print("\n" + "=" * 60)
+    print("All tests completed!")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,10 @@ Extracts scan datetime from Aperio and SCN TIFF ImageDescription headers.
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-import tifffile
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import tifffile
 
 
 def extract_scan_datetime(tiff_path: Path) -> Optional[datetime]:
@@ -23,59 +25,74 @@ def extract_scan_datetime(tiff_path: Path) -> Optional[datetime]:
     Returns:
         Scan datetime if found, else None
     """
+    import tifffile
+    
     try:
         with tifffile.TiffFile(tiff_path) as tif:
-            if not tif.pages:
-                return None
-            
-            # Get ImageDescription from first page
-            page = tif.pages[0]
-            if not hasattr(page, 'description') or not page.description:
-                return None
-            
-            description = page.description
-            
-            # Try Aperio format: "Date = MM/DD/YY|Time = HH:MM:SS"
-            # Example from mcitodcm.sh lines 2843-2859
-            aperio_match = re.search(
-                r'Date\s*=\s*(\d{2})/(\d{2})/(\d{2})\s*\|.*?Time\s*=\s*(\d{2}):(\d{2}):(\d{2})',
-                description,
-                re.IGNORECASE
-            )
-            if aperio_match:
-                month, day, year, hour, minute, second = aperio_match.groups()
-                # Assume 20xx for 2-digit year
-                full_year = 2000 + int(year)
-                return datetime(full_year, int(month), int(day), int(hour), int(minute), int(second))
-            
-            # Try SCN format: "Date: YYYY-MM-DD Time: HH:MM:SS"
-            scn_match = re.search(
-                r'Date:\s*(\d{4})-(\d{2})-(\d{2})\s+Time:\s*(\d{2}):(\d{2}):(\d{2})',
-                description,
-                re.IGNORECASE
-            )
-            if scn_match:
-                year, month, day, hour, minute, second = scn_match.groups()
-                return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
-            
-            # Alternative Aperio format without pipe separator
-            aperio_alt_match = re.search(
-                r'Date\s*=\s*(\d{2})/(\d{2})/(\d{2}).*?Time\s*=\s*(\d{2}):(\d{2}):(\d{2})',
-                description,
-                re.IGNORECASE
-            )
-            if aperio_alt_match:
-                month, day, year, hour, minute, second = aperio_alt_match.groups()
-                full_year = 2000 + int(year)
-                return datetime(full_year, int(month), int(day), int(hour), int(minute), int(second))
-            
-            return None
+            return extract_scan_datetime_from_tiff(tif)
             
     except Exception as e:
         print(f"Warning: Could not extract datetime from {tiff_path}: {e}")
         return None
 
 
+def extract_scan_datetime_from_tiff(tif: "tifffile.TiffFile") -> Optional[datetime]:
+    """
+    Extract scan datetime from the ImageDescription of an open TIFF file.
+    
+    Args:
+        tif: Open TIFF/SVS file
+        
+    Returns:
+        Scan datetime if found, else None
+    """
+    if not tif.pages:
+        return None
+    
+    # Get ImageDescription from first page
+    page = tif.pages[0]
+    if not hasattr(page, 'description') or not page.description:
+        return None
+    
+    description = page.description
+    
+    # Try Aperio format: "Date = MM/DD/YY|Time = HH:MM:SS"
+    # Example from mcitodcm.sh lines 2843-2859
+    aperio_match = re.search(
+        r'Date\s*=\s*(\d{2})/(\d{2})/(\d{2})\s*\|.*?Time\s*=\s*(\d{2}):(\d{2}):(\d{2})',
+        description,
+        re.IGNORECASE
+    )
+    if aperio_match:
+        month, day, year, hour, minute, second = aperio_match.groups()
+        # Assume 20xx for 2-digit year
+        full_year = 2000 + int(year)
+        return datetime(full_year, int(month), int(day), int(hour), int(minute), int(second))
+    
+    # Try SCN format: "Date: YYYY-MM-DD Time: HH:MM:SS"
+    scn_match = re.search(
+        r'Date:\s*(\d{4})-(\d{2})-(\d{2})\s+Time:\s*(\d{2}):(\d{2}):(\d{2})',
+        description,
+        re.IGNORECASE
+    )
+    if scn_match:
+        year, month, day, hour, minute, second = scn_match.groups()
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second))
+    
+    # Alternative Aperio format without pipe separator
+    aperio_alt_match = re.search(
+        r'Date\s*=\s*(\d{2})/(\d{2})/(\d{2}).*?Time\s*=\s*(\d{2}):(\d{2}):(\d{2})',
+        description,
+        re.IGNORECASE
+    )
+    if aperio_alt_match:
+        month, day, year, hour, minute, second = aperio_alt_match.groups()
+        full_year = 2000 + int(year)
+        return datetime(full_year, int(month), int(day), int(hour), int(minute), int(second))
+    
+    return None
+
+
 def get_study_datetime(
     tiff_path: Path,
     fallback: Optional[datetime] = None
@@ -6,11 +6,11 @@ across conversion runs. Generates DICOM-compliant 2.25 UIDs via pydicom.
 """
 
 import sqlite3
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 from datetime import datetime
 import threading
-from pydicom.uid import generate_uid
 
 
 class UIDRegistry:
@@ -25,11 +25,60 @@ class UIDRegistry:
         """
         self.db_path = Path(db_path)
         self._lock = threading.Lock()
+        self._batch_conn: Optional[sqlite3.Connection] = None
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; WAL mode makes NORMAL sync safe against corruption."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the open batch connection, or a new connection that commits on exit.
+        
+        Inside a batch (see begin()), changes are committed by commit()/end().
+        """
+        if self._batch_conn is not None:
+            yield self._batch_conn
+            return
+        with closing(self._connect()) as conn:
+            with conn:
+                yield conn
+    
+    def begin(self):
+        """
+        Start a batch: UID inserts share one connection and are committed by
+        commit() or end() instead of after every insert.
+        
+        Uncommitted UIDs are lost if the process dies, and other processes
+        cannot write to the registry until the next commit, so commit before
+        any long-running work.
+        """
+        with self._lock:
+            if self._batch_conn is None:
+                self._batch_conn = self._connect()
+    
+    def commit(self):
+        """Commit UIDs inserted in the current batch, keeping the batch open."""
+        with self._lock:
+            if self._batch_conn is not None:
+                self._batch_conn.commit()
+    
+    def end(self):
+        """Commit and close the current batch."""
+        with self._lock:
+            if self._batch_conn is not None:
+                self._batch_conn.commit()
+                self._batch_conn.close()
+                self._batch_conn = None
+    
     def _init_db(self):
         """Create database schema if not exists."""
-        with sqlite3.connect(self.db_path) as conn:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS studies (
                     dataset TEXT NOT NULL,
@@ -78,7 +127,7 @@ class UIDRegistry:
             DICOM StudyInstanceUID (2.25 format)
         """
         with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.execute(
                     "SELECT study_instance_uid FROM studies WHERE dataset = ? AND patient_id = ?",
                     (dataset, patient_id)
@@ -89,15 +138,20 @@ class UIDRegistry:
                     return row[0]
                 
                 # Generate new UID using pydicom (2.25 format)
+                from pydicom.uid import generate_uid
                 study_uid = generate_uid(prefix=None)
                 
+                # Another process may have registered the same ID meanwhile;
+                # keep whichever UID was stored first
                 conn.execute(
-                    "INSERT INTO studies (dataset, patient_id, study_instance_uid, created_at) VALUES (?, ?, ?, ?)",
+                    "INSERT OR IGNORE INTO studies (dataset, patient_id, study_instance_uid, created_at) VALUES (?, ?, ?, ?)",
                     (dataset, patient_id, study_uid, datetime.utcnow().isoformat())
                 )
-                conn.commit()
                 
-                return study_uid
+                return conn.execute(
+                    "SELECT study_instance_uid FROM studies WHERE dataset = ? AND patient_id = ?",
+                    (dataset, patient_id)
+                ).fetchone()[0]
     
     def get_or_create_specimen_uid(
         self,
@@ -115,7 +169,7 @@ class UIDRegistry:
             DICOM SpecimenUID (2.25 format)
         """
         with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.execute(
                     "SELECT specimen_uid FROM specimens WHERE dataset = ? AND specimen_id = ?",
                     (dataset, specimen_id)
@@ -126,15 +180,20 @@ class UIDRegistry:
                     return row[0]
                 
                 # Generate new UID using pydicom (2.25 format)
+                from pydicom.uid import generate_uid
                 specimen_uid = generate_uid(prefix=None)
                 
+                # Another process may have registered the same ID meanwhile;
+                # keep whichever UID was stored first
                 conn.execute(
-                    "INSERT INTO specimens (dataset, specimen_id, specimen_uid, created_at) VALUES (?, ?, ?, ?)",
+                    "INSERT OR IGNORE INTO specimens (dataset, specimen_id, specimen_uid, created_at) VALUES (?, ?, ?, ?)",
                     (dataset, specimen_id, specimen_uid, datetime.utcnow().isoformat())
                 )
-                conn.commit()
                 
-                return specimen_uid
+                return conn.execute(
+                    "SELECT specimen_uid FROM specimens WHERE dataset = ? AND specimen_id = ?",
+                    (dataset, specimen_id)
+                ).fetchone()[0]
     
     def get_or_create_study_datetime(
         self,
@@ -156,7 +215,7 @@ class UIDRegistry:
             Study datetime (existing or newly stored)
         """
         with self._lock:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.execute(
                     "SELECT study_datetime FROM study_datetimes WHERE dataset = ? AND study_id = ?",
                     (dataset, study_id)
@@ -170,13 +229,17 @@ class UIDRegistry:
                 if study_datetime is None:
                     study_datetime = datetime.now()
                 
+                # Another process may have registered the same study meanwhile;
+                # keep whichever datetime was stored first
                 conn.execute(
-                    "INSERT INTO study_datetimes (dataset, study_id, study_datetime, created_at) VALUES (?, ?, ?, ?)",
+                    "INSERT OR IGNORE INTO study_datetimes (dataset, study_id, study_datetime, created_at) VALUES (?, ?, ?, ?)",
                     (dataset, study_id, study_datetime.isoformat(), datetime.utcnow().isoformat())
                 )
-                conn.commit()
                 
-                return study_datetime
+                return datetime.fromisoformat(conn.execute(
+                    "SELECT study_datetime FROM study_datetimes WHERE dataset = ? AND study_id = ?",
+                    (dataset, study_id)
+                ).fetchone()[0])
     
     def list_studies(self, dataset: Optional[str] = None) -> list:
         """List all registered studies."""